@@ -1,9 +1,13 @@
 import config
 import logging
+import threading
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from database import init_db
+from services.file_service import backup_writer, backfill_legacy_backups
+from services.render_service import prerender_queue, render_executor
+from services.page_plan_service import backfill_page_plans
 from routers import reports, upload, downloads, static
 
 config.setup_logging()
@@ -22,9 +26,26 @@ async def lifespan(app: FastAPI):
     # DB 초기화
     init_db()
 
+    # 매니페스트 도입 이전의 평면 구조 JSON 백업 등록 (/api/reports 목록에 포함되도록)
+    backfill_legacy_backups()
+
+    # 저장된 페이지 배치 계획이 없거나 오래된 보고서의 계획 계산 (백그라운드, 서버 시작을 지연시키지 않음)
+    threading.Thread(target=backfill_page_plans, name="page-plan-backfill", daemon=True).start()
+
+    # JSON 백업 writer 시작
+    backup_writer.start()
+
+    # PPTX 렌더 워커 프로세스 예열 (템플릿 미리 로드)
+    render_executor.start()
+
     yield
 
-    # 앱 종료 시 실행할 로직이 있다면 여기에 작성
+    # 대기 중인 사전 렌더링은 취소 (다운로드 시 다시 렌더링됨)
+    prerender_queue.shutdown()
+    render_executor.shutdown()
+
+    # 대기 중인 JSON 백업을 모두 기록한 뒤 종료
+    backup_writer.stop()
 
 app = FastAPI(lifespan=lifespan)
 
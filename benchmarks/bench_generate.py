@@ -0,0 +1,219 @@
+"""
+PPTX 보고서 생성(NGS_PPT_Generator.generate) 벤치마크
+
+사용법:
+    python benchmarks/bench_generate.py                      # 전체 케이스 측정 + 기준값과 비교
+    python benchmarks/bench_generate.py ge_v1_snv300         # 케이스 지정
+    python benchmarks/bench_generate.py --save-baseline      # 측정 결과를 기준값으로 저장
+    python benchmarks/bench_generate.py --threshold 0.3      # 30% 이상 느려질 때만 회귀로 보고
+
+케이스(합성 report_data)는 benchmarks/synthetic_reports.py의 CASES에 정의되어 있고,
+번들된 resources/ 의 PPTX 템플릿만 사용합니다 (네트워크/DB 불필요).
+
+케이스마다 별도 프로세스에서 렌더 워커와 같은 조건(템플릿 예열, 임시 파일로 저장)으로 측정합니다.
+    wall    : generate() 실행 시간 (--repeat 회 중 최솟값)
+    rss     : 연속 generate() 동안의 프로세스 최대 RSS (MB, 예열된 템플릿 캐시 포함, RenderProfiler.track_peak_rss)
+    heap    : generate() 1회의 Python 힙 최대 사용량 (MB, tracemalloc, lxml 내부 메모리 제외)
+    slides  : 결과 슬라이드 수
+    size    : 결과 PPTX 크기
+    sha256  : 결과 PPTX의 해시 (출력이 결정적이므로 골든 파일 비교용)
+측정 후 케이스마다 1회, 재사용한 템플릿 파트가 prs.save가 기록할 바이트와 같은지 검사합니다
+(verify_reused_parts, 다르면 측정 실패).
+회귀 판정: wall/rss/heap이 기준값보다 threshold 이상 커지면 실패(exit 1).
+슬라이드 수/크기/해시가 달라진 경우는 출력 변경으로 함께 표시합니다.
+"""
+import argparse
+import gc
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_reports import CASES, make_report
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "generate.json")
+MEMORY_SLACK_MB = 5.0  # 작은 케이스의 메모리 측정 오차 허용치
+
+
+def run_case(name, repeat):
+    """현재 프로세스에서 케이스 1개를 측정합니다 (--child 모드에서 호출)."""
+    from services.pptx_generator import NGS_PPT_Generator
+    from services.render_profiler import RenderProfiler
+
+    # 렌더 워커와 같은 조건: 템플릿 예열 후 상주 객체는 GC 추적에서 제외
+    generator = NGS_PPT_Generator()
+    generator.preload()
+    gc.collect()
+    gc.freeze()
+    report_data = make_report(**CASES[name])
+
+    best, best_phases, peak_rss_mb = None, None, 0.0
+    with tempfile.TemporaryFile() as output:
+        for _ in range(repeat):
+            output.seek(0)
+            output.truncate()
+            profiler = RenderProfiler()
+            with profiler.track_peak_rss():
+                started = time.perf_counter()
+                generator.generate(report_data, profiler=profiler, output=output)
+                elapsed = time.perf_counter() - started
+            if profiler.peak_rss_mb is None:
+                peak_rss_mb = None
+            elif peak_rss_mb is not None:
+                peak_rss_mb = max(peak_rss_mb, profiler.peak_rss_mb)
+            if best is None or elapsed < best:
+                best, best_phases = elapsed, profiler.timings
+
+        size = os.fstat(output.fileno()).st_size
+        output.seek(0)
+        content_hash = hashlib.sha256(output.read()).hexdigest()
+        with zipfile.ZipFile(output) as zf:
+            slides = sum(
+                1 for n in zf.namelist()
+                if n.startswith("ppt/slides/slide") and n.endswith(".xml")
+            )
+
+        # Python 힙 최대 사용량은 tracemalloc 오버헤드 때문에 시간 측정과 따로 1회 실행
+        output.seek(0)
+        output.truncate()
+        tracemalloc.start()
+        generator.generate(report_data, output=output)
+        heap_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        # 재사용한 템플릿 파트가 렌더링 중 바뀌지 않았는지 검사 (바뀌었으면 AssertionError로 측정 실패)
+        output.seek(0)
+        output.truncate()
+        generator.verify_reused_parts = True
+        generator.generate(report_data, output=output)
+
+    return {
+        "wall_ms": round(best * 1000, 1),
+        "rss_mb": round(peak_rss_mb, 1) if peak_rss_mb is not None else None,
+        "heap_mb": round(heap_peak / (1024 * 1024), 1),
+        "slides": slides,
+        "bytes": size,
+        "sha256": content_hash,
+        "phases_ms": {phase: round(seconds * 1000, 1) for phase, seconds in best_phases.items()},
+    }
+
+
+def run_case_isolated(name, repeat):
+    """케이스를 새 프로세스에서 측정 (케이스 간 캐시/힙 상태가 섞이지 않도록)"""
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", name, "--repeat", str(repeat)],
+        capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"[{name}] 측정 실패:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _machine_info():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path, results):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"machine": _machine_info(), "cases": results}, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def compare(name, result, base, threshold):
+    """기준값 대비 회귀/변경 내역 [(실패 여부, 메시지)]"""
+    findings = []
+    if result["wall_ms"] > base["wall_ms"] * (1 + threshold):
+        findings.append((True, f"wall {base['wall_ms']:.0f}ms -> {result['wall_ms']:.0f}ms "
+                               f"(+{(result['wall_ms'] / base['wall_ms'] - 1) * 100:.0f}%)"))
+    for metric in ("rss_mb", "heap_mb"):
+        if result.get(metric) is None or base.get(metric) is None:
+            continue
+        limit = max(base[metric] * (1 + threshold), base[metric] + MEMORY_SLACK_MB)
+        if result[metric] > limit:
+            findings.append((True, f"{metric[:-3]} {base[metric]:.1f}MB -> {result[metric]:.1f}MB"))
+    if result["slides"] != base["slides"]:
+        findings.append((False, f"slides {base['slides']} -> {result['slides']}"))
+    if result["bytes"] != base["bytes"]:
+        findings.append((False, f"size {base['bytes']} -> {result['bytes']} bytes"))
+    if base.get("sha256") and result["sha256"] != base["sha256"]:
+        findings.append((False, f"sha256 {base['sha256'][:12]} -> {result['sha256'][:12]}"))
+    return [(failed, f"[{name}] {message}") for failed, message in findings]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NGS_PPT_Generator.generate 벤치마크")
+    parser.add_argument("cases", nargs="*", help=f"측정할 케이스 (기본: 전체) {', '.join(CASES)}")
+    parser.add_argument("--repeat", type=int, default=5, help="케이스당 반복 횟수 (wall은 최솟값)")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 판정할 증가율 (기본 0.2 = 20%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준값 JSON 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="측정 결과를 기준값으로 저장")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_case(args.child, args.repeat)))
+        return
+
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        raise SystemExit(f"알 수 없는 케이스: {', '.join(unknown)}")
+    names = args.cases or list(CASES)
+
+    baseline = None if args.save_baseline else load_baseline(args.baseline)
+    if baseline and baseline.get("machine") != _machine_info():
+        print(f"주의: 기준값 측정 환경이 다릅니다 ({baseline.get('machine')})")
+
+    results, findings = {}, []
+    print(f"{'case':<22} {'wall':>9} {'rss':>9} {'heap':>9} {'slides':>7} {'size':>10}  phases")
+    for name in names:
+        result = run_case_isolated(name, args.repeat)
+        results[name] = result
+        rss = f"{result['rss_mb']:.1f}MB" if result["rss_mb"] is not None else "-"
+        phases = ", ".join(f"{phase} {ms:.0f}" for phase, ms in result["phases_ms"].items())
+        print(
+            f"{name:<22} {result['wall_ms']:>7.0f}ms {rss:>9} {result['heap_mb']:>7.1f}MB {result['slides']:>7} "
+            f"{result['bytes'] / 1024:>8.0f}KB  {phases}"
+        )
+        if baseline and name in baseline.get("cases", {}):
+            findings.extend(compare(name, result, baseline["cases"][name], args.threshold))
+
+    if args.save_baseline:
+        # 일부 케이스만 측정한 경우 나머지 기준값은 유지
+        existing = load_baseline(args.baseline) or {}
+        save_baseline(args.baseline, {**existing.get("cases", {}), **results})
+        print(f"기준값 저장: {args.baseline}")
+        return
+
+    if baseline is None:
+        print(f"기준값이 없습니다 ({args.baseline}). --save-baseline 으로 저장하세요.")
+        return
+
+    for failed, message in findings:
+        print(("회귀: " if failed else "변경: ") + message)
+    if any(failed for failed, _ in findings):
+        raise SystemExit(1)
+    print(f"회귀 없음 (threshold {args.threshold * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+변이 테이블 데이터 행 생성 벤치마크: python-pptx 셀 API vs lxml 직접 생성
+
+사용법:
+    python benchmarks/bench_table_emission.py             # 500 / 2000 / 5000행
+    python benchmarks/bench_table_emission.py 10000       # 행 수 지정
+
+두 방식의 결과 XML이 바이트 단위로 같은지도 함께 확인합니다.
+(특수 문자, 제어 문자, 값이 모자란 행 포함)
+"""
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lxml import etree
+from pptx.oxml.table import CT_Table
+from pptx.table import Table
+from pptx.util import Pt
+
+from services.pptx_generator import NGS_PPT_Generator, PPTReportConfig, _A_NS
+
+TEMPLATE_NAME = "NGS_GE_report_baseline.pptx"
+PROTOTYPE_KEY = "snv_clinical"
+
+
+def make_rows(count, num_cols):
+    rows = []
+    for i in range(count):
+        if i % 97 == 0:
+            # 값이 모자란 행
+            rows.append([f"GENE{i}"])
+        elif i % 31 == 0:
+            # 이스케이프가 필요한 값
+            rows.append([f"A&B<{i}>", "\"quoted\" 'single'", "bell\x07char", "tab\tline\nbreak"] + [i] * (num_cols - 4))
+        else:
+            rows.append([f"GENE{i}"] + [f"c.{i}A>G p.(Val{i}Ala) 12.{i % 10}%"] * (num_cols - 1))
+    return rows
+
+
+def new_table(prototype):
+    tbl = CT_Table.new_tbl(1, prototype.num_cols, prototype.total_width, prototype.header_row_height)
+    for tr in tbl.findall(f"{_A_NS}tr"):
+        tbl.remove(tr)
+    tbl.append(copy.deepcopy(prototype.header_tr))
+    return tbl
+
+
+def fill_with_cell_api(generator, prototype, rows, style_props):
+    """기존 방식: 행 템플릿 복사 후 셀마다 _set_cell_text_preserving_style 호출"""
+    tbl = new_table(prototype)
+    for _ in rows:
+        tbl.append(copy.deepcopy(prototype.data_tr))
+    table = Table(tbl, None)
+    for r_idx, row_data in enumerate(rows):
+        target_row = table.rows[r_idx + 1]
+        for c_idx, val in enumerate(row_data):
+            if c_idx < len(target_row.cells):
+                generator._set_cell_text_preserving_style(
+                    target_row.cells[c_idx], str(val),
+                    is_bold=style_props["bold"], font_color=style_props["color"], font_size=Pt(8)
+                )
+    return tbl
+
+
+def fill_direct(generator, prototype, rows, style_props):
+    """새 방식: lxml로 행 직접 생성"""
+    tbl = new_table(prototype)
+    generator._emit_data_rows(tbl, prototype, rows, style_props)
+    return tbl
+
+
+def best_of(func, repeat=3):
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [500, 2000, 5000]
+
+    generator = NGS_PPT_Generator()
+    entry = generator.template_cache.entry(TEMPLATE_NAME)
+    compiled = generator.template_cache.compiled(entry, "layout", generator._compile_layout)
+    prototype = compiled.table_prototypes[PROTOTYPE_KEY]
+
+    print(f"{'rows':>8} {'style':>9} {'cell API':>10} {'direct':>10} {'speed-up':>9}  identical")
+    for count in counts:
+        rows = make_rows(count, prototype.num_cols)
+        for style_name, style_props in PPTReportConfig.STYLES.items():
+            legacy_time, legacy_tbl = best_of(lambda: fill_with_cell_api(generator, prototype, rows, style_props), repeat=1)
+            direct_time, direct_tbl = best_of(lambda: fill_direct(generator, prototype, rows, style_props))
+            identical = etree.tostring(legacy_tbl) == etree.tostring(direct_tbl)
+            print(
+                f"{count:>8} {style_name:>9} {legacy_time * 1000:>8.0f}ms {direct_time * 1000:>8.0f}ms "
+                f"{legacy_time / direct_time:>8.1f}x  {identical}"
+            )
+            if not identical:
+                raise SystemExit("결과 XML이 다릅니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+벤치마크용 합성 report_data 생성기 (엑셀 파싱 결과와 같은 구조)
+
+패널(GE/SA), V1/V2, 섹션별 변이 수, 코멘트 수/길이, 하이라이트 길이를 조절할 수 있고,
+같은 인자로 만들면 항상 같은 데이터가 나옵니다 (seed 고정).
+"""
+import random
+
+GENES = [
+    "KRAS", "NRAS", "BRAF", "EGFR", "ERBB2", "PIK3CA", "PTEN", "TP53", "BRCA1", "BRCA2",
+    "ALK", "ROS1", "RET", "MET", "NTRK1", "NTRK3", "FGFR1", "FGFR2", "FGFR3", "IDH1",
+    "IDH2", "KIT", "PDGFRA", "CDKN2A", "SMAD4", "APC", "ARID1A", "ATM", "CHEK2", "MYC",
+]
+
+SECTION_HEADERS = {
+    "snv": ["Gene", "Consequence", "AA Change", "VAF", "HGVSc", "HGVSp"],
+    "fusion": ["Gene fusion", "Breakpoint 1", "Breakpoint 2", "Fusion supporting reads"],
+    "cnv": ["Gene", "Location", "Fold Change", "Estimated copy number"],
+    "lr_brca": ["Gene", "Location", "Affected exon", "Fold Change", "Estimated copy number"],
+    "splice": ["Gene", "Affected exon", "Breakpoint 1", "Breakpoint 2", "Splice supporting reads"],
+}
+
+SECTION_TYPES = ("clinical", "unknown")
+
+
+def _make_row(kind, rng, index):
+    gene = rng.choice(GENES)
+    pos = rng.randint(1000, 250000000)
+    if kind == "snv":
+        aa = f"p.{rng.choice('ACDEFGHIKLMNPQRSTVWY')}{index + 12}{rng.choice('ACDEFGHIKLMNPQRSTVWY')}"
+        return [gene, "missense_variant", aa, f"{rng.uniform(1, 60):.1f}%",
+                f"c.{pos % 5000}G>A", aa]
+    if kind == "fusion":
+        partner = rng.choice(GENES)
+        return [f"{gene}-{partner}", f"chr{rng.randint(1, 22)}:{pos}", f"chr{rng.randint(1, 22)}:{pos + 777}",
+                str(rng.randint(5, 900))]
+    if kind == "cnv":
+        return [gene, f"chr{rng.randint(1, 22)}:{pos}-{pos + 50000}", f"{rng.uniform(1.5, 9):.2f}",
+                str(rng.randint(3, 30))]
+    if kind == "lr_brca":
+        return [rng.choice(("BRCA1", "BRCA2")), f"chr{rng.choice((13, 17))}:{pos}",
+                f"exon {rng.randint(1, 27)}", f"{rng.uniform(0.3, 0.7):.2f}", "1"]
+    return [gene, f"exon {rng.randint(1, 20)}", f"chr{rng.randint(1, 22)}:{pos}",
+            f"chr{rng.randint(1, 22)}:{pos + 1200}", str(rng.randint(5, 400))]
+
+
+def _make_highlight(rng, items):
+    """하이라이트 구조 ([{text, style}]): 유전자명은 italic, 나머지는 normal"""
+    highlight = []
+    for i in range(items):
+        if i:
+            highlight.append({"text": ", ", "style": "normal"})
+        highlight.append({"text": rng.choice(GENES), "style": "italic"})
+        highlight.append({"text": f" p.G{rng.randint(10, 999)}D mutation", "style": "normal"})
+    return highlight
+
+
+def _make_comment(rng, index, words):
+    """유전자명/아미노산 변화가 섞인 한/영 혼합 코멘트"""
+    gene = rng.choice(GENES)
+    body = []
+    for i in range(words):
+        if i % 9 == 4:
+            body.append(rng.choice(GENES))
+        elif i % 2:
+            body.append("임상적으로")
+        else:
+            body.append(rng.choice(("variant", "의미가", "reported", "치료", "response", "있는")))
+    return f"{gene} p.G{12 + index}D mutation: " + " ".join(body) + "."
+
+
+def make_report(panel="GE", v2=False, variants=None, comments=6, comment_words=40, highlight_items=1, seed=0):
+    """
+    합성 report_data를 만듭니다.
+
+    Args:
+        panel: "GE" 또는 "SA"
+        v2: V2 템플릿 사용 여부
+        variants: {섹션 키(예: "snv_unknown"): 행 수} (지정하지 않은 섹션은 2행)
+        comments: 코멘트 개수
+        comment_words: 코멘트 1개당 단어 수
+        highlight_items: 섹션 하이라이트에 들어가는 변이 수
+        seed: 난수 시드
+    """
+    rng = random.Random(seed)
+    variants = variants or {}
+
+    report_data = {
+        "clinical_info": {"검체 정보": "SYN-0001", "성별": "M", "나이": "57", "진단": "Adenocarcinoma of lung"},
+        "biomarkers": {
+            "TMB": {"value": "12.3", "unit": "/Megabase", "status": "High"},
+            "MSI": {"value": "3", "unit": "%", "status": "Stable", "usable_msi_sites": "100"},
+            "Tumor_Fraction": {"value": "0.4", "pathological": "50", "unit": ""},
+            "Ploidy": {"value": "2.1", "unit": ""},
+            "GIS": {"value": "40", "unit": ""},
+        },
+        "failed_gene": "None",
+        "comments": [_make_comment(rng, i, comment_words) for i in range(comments)],
+        "diagnostic_info": {"검사기기": "NovaSeq Dx [Illumina]"},
+        "drna_qubit": {"DNA": "12.1", "RNA": "3.4"},
+        "diagnosis_user": {"Tested by": "A, B", "Signed by": "C, D", "Analyzed by": "E", "분자접수번호": "M-0001"},
+        "panel_type": panel,
+        "sequence_date": "2025-12-03",
+        "is_v2": v2,
+        "run_name": "SYN_RUN",
+        "qc": {"headers": ["Metric (UOM)", "LSL Guideline", "Value"], "data": [["PCT_PF_READS (%)", "80", "95"]]},
+    }
+
+    for kind, headers in SECTION_HEADERS.items():
+        for section_type in SECTION_TYPES:
+            key = f"{kind}_{section_type}"
+            count = variants.get(key, 2)
+            report_data[key] = {
+                "highlight": _make_highlight(rng, highlight_items) if count else [],
+                "headers": headers,
+                "data": [_make_row(kind, rng, i) for i in range(count)],
+            }
+
+    return report_data
+
+
+def _scaled(count):
+    return {f"{kind}_{section_type}": count for kind in SECTION_HEADERS for section_type in SECTION_TYPES}
+
+
+# 벤치마크 케이스: 이름 -> make_report 인자
+CASES = {
+    "ge_v1_small": dict(panel="GE", v2=False),
+    "ge_v2_small": dict(panel="GE", v2=True),
+    "sa_v1_small": dict(panel="SA", v2=False),
+    "sa_v2_small": dict(panel="SA", v2=True),
+    "ge_v1_snv300": dict(panel="GE", v2=False, variants={"snv_unknown": 300}),
+    "sa_v2_snv300": dict(panel="SA", v2=True, variants={"snv_unknown": 300}),
+    "ge_v2_all40": dict(panel="GE", v2=True, variants=_scaled(40), highlight_items=8),
+    "sa_v1_all40": dict(panel="SA", v2=False, variants=_scaled(40), highlight_items=8),
+    "ge_v1_comments40": dict(panel="GE", v2=False, comments=40, comment_words=80),
+    "sa_v2_longhighlight": dict(panel="SA", v2=True, variants=_scaled(6), highlight_items=30, comments=12),
+}
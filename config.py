@@ -11,6 +11,33 @@ TMP_DIR = BASE_DIR / "tmp"
 STATIC_DIR = BASE_DIR / "static"
 TEMPLATE_DIR = BASE_DIR / "templates"
 
+# 보고서 버전 이력: N 버전마다 전체 스냅샷 저장 (그 사이는 델타만 저장)
+VERSION_SNAPSHOT_INTERVAL = 10
+
+# 렌더링된 PPTX 캐시 (보고서 데이터 + 템플릿 해시 기반), 총 용량 초과 시 LRU 삭제
+RENDER_CACHE_DIR = BASE_DIR / "cache" / "pptx"
+RENDER_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# 업로드 직후 PPTX 사전 렌더링 (동시 렌더링 수 제한)
+PRERENDER_ENABLED = True
+PRERENDER_MAX_WORKERS = 2
+
+# PPTX 렌더 워커 프로세스 수 (None: CPU 수), 대기열 길이, 렌더링 1건의 제한 시간(초, 워커에서 작업이 시작된 시점부터)
+RENDER_MAX_WORKERS = None
+RENDER_QUEUE_MAX = 16
+RENDER_TIMEOUT_SECONDS = 60
+
+# PPTX 저장 시 템플릿에서 재사용하는 파트가 실제로 바뀌지 않았는지 검사 (개발/디버그용, 저장 시간 증가)
+PPTX_VERIFY_REUSED_PARTS = False
+
+# 코멘트 레이아웃 텍스트 측정용 폰트 (파일이 없으면 내장 근사 폭 테이블 사용, 경고 로그)
+# 보고서 본문 폰트(맑은 고딕)는 재배포할 수 없어 폭이 비슷한 나눔고딕(SIL OFL 1.1)을 번들.
+# 맑은 고딕 파일을 둘 수 있는 환경에서는 이 경로를 malgun.ttf로 바꾸면 됩니다.
+TEXT_METRICS_FONT_PATH = BASE_DIR / "resources" / "fonts" / "NanumGothic.ttf"
+
+# JSON 백업 형식: "pretty"(indent=4), "compact"(공백 제거), "gzip"(compact + gzip 압축)
+JSON_BACKUP_FORMAT = "pretty"
+
 # 2. 로깅(Console) 설정
 # print() 대신 사용할 로거 설정을 여기서 정의합니다.
 def setup_logging():
@@ -2,32 +2,69 @@ import sqlite3
 import config
 from contextlib import contextmanager
 
-def init_db():
-    if not config.DB_PATH.exists():
-        conn = sqlite3.connect(config.DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute('''
-                       CREATE TABLE IF NOT EXISTS reports
-                       (
-                           id
-                           INTEGER
-                           PRIMARY
-                           KEY
-                           AUTOINCREMENT,
-                           specimen_id
-                           TEXT
-                           UNIQUE,
-                           report_data
-                           TEXT,
-                           created_at
-                           TIMESTAMP
-                           DEFAULT
-                           CURRENT_TIMESTAMP
-                       )
-                       ''')
+def init_db(db_path=None):
+    conn = sqlite3.connect(db_path or config.DB_PATH)
+    cursor = conn.cursor()
 
-        conn.commit()
-        conn.close()
+    cursor.execute('''
+                   CREATE TABLE IF NOT EXISTS reports
+                   (
+                       id
+                       INTEGER
+                       PRIMARY
+                       KEY
+                       AUTOINCREMENT,
+                       specimen_id
+                       TEXT
+                       UNIQUE,
+                       report_data
+                       TEXT,
+                       created_at
+                       TIMESTAMP
+                       DEFAULT
+                       CURRENT_TIMESTAMP
+                   )
+                   ''')
+
+    # 보고서 버전 이력 (스냅샷 + 구조적 델타)
+    cursor.execute('''
+                   CREATE TABLE IF NOT EXISTS report_versions
+                   (
+                       id INTEGER PRIMARY KEY AUTOINCREMENT,
+                       specimen_id TEXT NOT NULL,
+                       version INTEGER NOT NULL,
+                       kind TEXT NOT NULL,
+                       payload TEXT NOT NULL,
+                       created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                       UNIQUE (specimen_id, version)
+                   )
+                   ''')
+
+    # JSON 백업 매니페스트 (목록 조회 시 디렉토리 스캔 방지)
+    cursor.execute('''
+                   CREATE TABLE IF NOT EXISTS json_backups
+                   (
+                       specimen_id TEXT PRIMARY KEY,
+                       path TEXT NOT NULL,
+                       format TEXT NOT NULL,
+                       size INTEGER NOT NULL,
+                       updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                   )
+                   ''')
+
+    # 페이지 배치 계획 (HTML 보고서와 PPTX가 같은 분할을 사용)
+    cursor.execute('''
+                   CREATE TABLE IF NOT EXISTS page_plans
+                   (
+                       specimen_id TEXT PRIMARY KEY,
+                       plan_key TEXT NOT NULL,
+                       plan TEXT NOT NULL,
+                       updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                   )
+                   ''')
+
+    conn.commit()
+    conn.close()
 
 def get_db():
     # check_same_thread=False: 비동기/동기 혼용 시 스레드 에러 방지 옵션
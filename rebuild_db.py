@@ -0,0 +1,200 @@
+"""
+JSON 백업(json/)으로부터 ngs_reports.db를 재구성하는 도구
+
+사용법:
+    python rebuild_db.py                 # json/ 전체를 읽어 DB 재구성
+    python rebuild_db.py --workers 8     # 프로세스 수 지정
+
+동작:
+    1. json/ 아래의 백업(평면 구조 + 해시 샤딩 구조, .json/.json.gz)을 수집
+    2. 프로세스 풀에서 백업을 읽고 검증하며, 결과를 받는 즉시 새 DB 파일의 인덱스 없는 스테이징 테이블에 삽입
+       (같은 검체의 백업이 여러 개면 최신 파일만 남김, 보고서 본문은 메모리에 모아두지 않음)
+    3. 스테이징 테이블을 specimen_id 순으로 정렬하여 reports 테이블에 옮김 (init_db와 같은 스키마를 유지하므로
+       UNIQUE 인덱스가 있는 테이블에 넣되, 키 순서로 넣어 인덱스 B-tree에는 끝에 추가만 일어남)
+    4. json_backups 매니페스트, report_versions(v1 스냅샷), page_plans(HTML/PPTX 페이지 배치 계획, 워커에서 계산) 백필
+    5. PRAGMA integrity_check 통과 시 기존 DB와 교체 (기존 파일은 .bak으로 보존)
+"""
+import argparse
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import config
+from database import init_db
+from services.page_plan_service import compute_page_plan
+
+config.setup_logging()
+logger = logging.getLogger("app")
+
+# 백업으로 인정하기 위한 최소 키
+REQUIRED_KEYS = ("clinical_info", "panel_type")
+
+
+def _specimen_id_from_path(path: Path) -> str:
+    name = path.name
+    for suffix in (".json.gz", ".json"):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return path.stem
+
+
+def collect_backup_files(json_dir: Path) -> list:
+    """백업 파일 목록 수집 (작성 중인 임시 파일 제외)"""
+    files = []
+    for pattern in ("*.json", "*.json.gz"):
+        files.extend(p for p in json_dir.rglob(pattern) if not p.name.startswith(".tmp_"))
+    return files
+
+
+def load_backup(path_str: str):
+    """
+    프로세스 풀 워커: 백업 하나를 읽고 검증합니다.
+
+    Returns:
+        (specimen_id, compact JSON 문자열, 페이지 배치 계획 (plan_key, 계획 JSON) 또는 None,
+         mtime, 상대 경로 문자열, 형식, 크기, 오류 메시지)
+    """
+    path = Path(path_str)
+    specimen_id = _specimen_id_from_path(path)
+    try:
+        raw = path.read_bytes()
+        if path.name.endswith(".gz"):
+            backup_format = "gzip"
+            report_data = json.loads(gzip.decompress(raw).decode("utf-8"))
+        else:
+            text = raw.decode("utf-8")
+            backup_format = "pretty" if text.startswith("{\n") else "compact"
+            report_data = json.loads(text)
+
+        if not isinstance(report_data, dict):
+            raise ValueError("최상위 객체가 dict가 아닙니다.")
+        missing = [key for key in REQUIRED_KEYS if key not in report_data]
+        if missing:
+            raise ValueError(f"필수 키 누락: {missing}")
+
+        # 업로드 시 DB에 저장하는 형식(json.dumps 기본값)과 동일하게 직렬화
+        payload = json.dumps(report_data)
+    except Exception as e:
+        return specimen_id, None, None, 0.0, path_str, None, 0, str(e)
+
+    # 배치 계획 계산 실패는 보고서 복구를 막지 않음 (HTML 조회 시 다시 계산)
+    try:
+        page_plan = compute_page_plan(report_data)
+    except Exception as e:
+        logger.warning(f"페이지 배치 계획 계산 실패 ({specimen_id}): {e}")
+        page_plan = None
+    return specimen_id, payload, page_plan, path.stat().st_mtime, path_str, backup_format, len(raw), None
+
+
+def rebuild(json_dir: Path, db_path: Path, workers: int = None) -> bool:
+    started = time.perf_counter()
+    files = collect_backup_files(json_dir)
+    logger.info(f"백업 파일 {len(files)}개 발견: {json_dir}")
+
+    # 1. 새 DB 파일 준비
+    tmp_db_path = db_path.with_name(db_path.name + ".rebuild")
+    if tmp_db_path.exists():
+        tmp_db_path.unlink()
+    init_db(tmp_db_path)
+
+    conn = sqlite3.connect(tmp_db_path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA cache_size = -200000")
+
+        # 인덱스 없는 스테이징 테이블에 먼저 적재한 뒤 specimen_id 순으로 옮김
+        # (reports/report_versions는 init_db가 만든 UNIQUE 제약이 있으므로, 키 순서로 넣어 인덱스 페이지 분할을 최소화)
+        conn.execute(
+            "CREATE TEMP TABLE reports_staging "
+            "(specimen_id TEXT, report_data TEXT, plan_key TEXT, plan TEXT, created_at TIMESTAMP)"
+        )
+
+        # 2. 프로세스 풀에서 읽기/검증하며 결과를 받는 즉시 스테이징에 기록
+        # (보고서 본문은 메모리에 모아두지 않고, 중복 판단용 메타데이터만 유지: 백업 전체 크기와 무관한 메모리 사용)
+        latest = {}  # {specimen_id: (mtime, 스테이징 rowid, 경로 문자열, 형식, 크기)}
+        failures = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(files) // ((workers or os.cpu_count() or 1) * 8))
+            for result in pool.map(load_backup, [str(f) for f in files], chunksize=chunksize):
+                specimen_id, payload, page_plan, mtime, path_str, backup_format, size, error = result
+                if error:
+                    failures.append((path_str, error))
+                    continue
+                # 평면/샤딩 구조에 같은 검체가 모두 있으면 최신 파일 우선 (먼저 적재한 이전 파일은 스테이징에서 삭제)
+                previous = latest.get(specimen_id)
+                if previous is not None and mtime <= previous[0]:
+                    continue
+                if previous is not None:
+                    conn.execute("DELETE FROM reports_staging WHERE rowid = ?", (previous[1],))
+                rowid = conn.execute(
+                    "INSERT INTO reports_staging VALUES (?, ?, ?, ?, datetime(?, 'unixepoch'))",
+                    (specimen_id, payload, *(page_plan or (None, None)), mtime)
+                ).lastrowid
+                latest[specimen_id] = (mtime, rowid, path_str, backup_format, size)
+
+        for path_str, error in failures:
+            logger.warning(f"백업 검증 실패, 건너뜀: {path_str} - {error}")
+        logger.info(f"검증 완료: {len(latest)}건 사용, {len(failures)}건 실패 ({time.perf_counter() - started:.1f}s)")
+
+        conn.execute(
+            "INSERT INTO reports (specimen_id, report_data, created_at) "
+            "SELECT specimen_id, report_data, created_at FROM reports_staging ORDER BY specimen_id"
+        )
+
+        # 3. 매니페스트 및 버전 이력 백필
+        conn.executemany(
+            "INSERT INTO json_backups (specimen_id, path, format, size, updated_at) "
+            "VALUES (?, ?, ?, ?, datetime(?, 'unixepoch'))",
+            (
+                (sid, Path(entry[2]).relative_to(json_dir).as_posix(), entry[3], entry[4], entry[0])
+                for sid, entry in sorted(latest.items())
+            )
+        )
+        conn.execute(
+            "INSERT INTO report_versions (specimen_id, version, kind, payload, created_at) "
+            "SELECT specimen_id, 1, 'snapshot', report_data, created_at FROM reports_staging ORDER BY specimen_id"
+        )
+        conn.execute(
+            "INSERT INTO page_plans (specimen_id, plan_key, plan, updated_at) "
+            "SELECT specimen_id, plan_key, plan, created_at FROM reports_staging "
+            "WHERE plan IS NOT NULL ORDER BY specimen_id"
+        )
+        conn.execute("DROP TABLE reports_staging")
+        conn.commit()
+
+        # 4. 무결성 검사
+        integrity = conn.execute("PRAGMA integrity_check").fetchone()[0]
+        count = conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+    finally:
+        conn.close()
+
+    if integrity != "ok" or count != len(latest):
+        logger.error(f"재구성 DB 검증 실패: integrity={integrity}, reports={count}/{len(latest)}")
+        return False
+
+    # 5. 기존 DB 보존 후 교체
+    if db_path.exists():
+        backup_path = db_path.with_name(f"{db_path.name}.{time.strftime('%Y%m%d%H%M%S')}.bak")
+        os.replace(db_path, backup_path)
+        logger.info(f"기존 DB 보존: {backup_path}")
+    os.replace(tmp_db_path, db_path)
+
+    logger.info(f"DB 재구성 완료: {count}건 ({time.perf_counter() - started:.1f}s) -> {db_path}")
+    return True
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="JSON 백업으로부터 ngs_reports.db 재구성")
+    arg_parser.add_argument("--json-dir", type=Path, default=config.JSON_DIR, help="JSON 백업 디렉토리")
+    arg_parser.add_argument("--db-path", type=Path, default=config.DB_PATH, help="재구성할 DB 경로")
+    arg_parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    args = arg_parser.parse_args()
+
+    ok = rebuild(args.json_dir, args.db_path, args.workers)
+    raise SystemExit(0 if ok else 1)
@@ -1,81 +1,191 @@
-from fastapi import APIRouter, Form, Depends
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import APIRouter, Form, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 import sqlite3
+import base64
 import json
 import logging
+import os
+import re
+from datetime import datetime
 from database import get_db
+from services.render_service import (
+    generator, render_cache, render_pptx_cached_async, build_pptx_filename, prerender_queue,
+    RenderQueueFull, RenderTimeout
+)
+from services.render_profiler import RenderProfiler
+from services.bulk_export import bulk_exporter
 
 logger = logging.getLogger("app")
 
-try:
-    from services.pptx_generator import NGS_PPT_Generator
-except ImportError as e:
-    logger.warning("경고: ppt_generator 모듈을 찾을 수 없습니다. PPT 다운로드 기능이 작동하지 않을 수 있습니다.")
-    NGS_PPT_Generator = None
+PPTX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+FILE_CHUNK_SIZE = 256 * 1024
 
 router = APIRouter()
 
-@router.post("/api/download-pptx")
-def download_pptx(specimen_id: str = Form(...), conn: sqlite3.Connection = Depends(get_db)):
-    """
-    특정 검체의 PPT 보고서를 생성하여 다운로드합니다.
-    """
-    if NGS_PPT_Generator is None:
-        return JSONResponse({"success": False, "error": "PPT 생성 모듈이 로드되지 않았습니다."}, status_code=500)
 
-    cursor = conn.cursor()
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in [tag.strip() for tag in if_none_match.split(",")]
 
-    try:
-        # 1. DB에서 리포트 데이터 조회
-        cursor.execute("SELECT report_data FROM reports WHERE specimen_id = ?", (specimen_id,))
-        result = cursor.fetchone()
 
-        if not result:
+def _iter_file(source):
+    """연 파일을 FILE_CHUNK_SIZE씩 읽어 응답 본문으로 내보내고 닫습니다 (StreamingResponse가 스레드풀에서 소비)."""
+    with source:
+        while True:
+            chunk = source.read(FILE_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+
+def _repr_digest(content_hash: str) -> str:
+    """SHA-256 hex를 Repr-Digest 헤더 값(RFC 9530)으로 변환"""
+    return f"sha-256=:{base64.b64encode(bytes.fromhex(content_hash)).decode('ascii')}:"
+
+
+def _load_report(conn: sqlite3.Connection, specimen_id: str):
+    """DB에서 보고서를 읽어 (report_data, 다운로드 파일명, 렌더 키)를 반환합니다. 없으면 None."""
+    result = conn.execute("SELECT report_data FROM reports WHERE specimen_id = ?", (specimen_id,)).fetchone()
+    if not result:
+        return None
+    report_data = json.loads(result["report_data"])
+    return report_data, build_pptx_filename(specimen_id, report_data), generator.get_render_key(report_data)
+
+
+async def _download_response(request: Request, specimen_id: str, conn: sqlite3.Connection):
+    if generator is None:
+        return JSONResponse({"success": False, "error": "PPT 생성 모듈이 로드되지 않았습니다."}, status_code=500)
+
+    try:
+        # 1~2. DB 조회, 파일명, 렌더 키 계산 (동기 I/O와 템플릿 해시는 스레드풀에서)
+        loaded = await run_in_threadpool(_load_report, conn, specimen_id)
+        if loaded is None:
             return JSONResponse({"success": False, "error": f"보고서를 찾을 수 없습니다: {specimen_id}"}, status_code=404)
+        report_data, filename, render_key = loaded
 
-        # 2. JSON 데이터 파싱
-        report_data = json.loads(result["report_data"])
-
-        # 3. PPT 생성 (메모리 상에서)
-        generator = NGS_PPT_Generator()
-        ppt_buffer = generator.generate(report_data)
-
-        # 4. 파일 다운로드 응답 (StreamingResponse 사용)
-        from datetime import datetime
-        
-        panel_type = report_data.get('panel_type', 'GE') # Default to GE if not present
-        
-        # Desired format: {specimen_id}_{Type}_report_{yymmdd}_auto.pptx
-        # Extract sequence date from report_data and format it
-        formatted_date = ""
-        sequence_date_str = report_data.get('sequence_date', '').strip()
-        
-        if sequence_date_str:
-            try:
-                # Try parsing "2025-12-03" -> "251203"
-                dt = datetime.strptime(sequence_date_str, "%Y-%m-%d")
-                formatted_date = dt.strftime("%y%m%d")
-            except Exception as e:
-                logger.warning(f"Sequence Date 파싱 실패 ({sequence_date_str}): {e}")
-                formatted_date = ""
-                
-        date_suffix = f"_{formatted_date}" if formatted_date else ""
-        
-        # Check if v2 report
-        is_v2 = report_data.get('is_v2', False)
-        report_str = "v2report" if is_v2 else "report"
-        
-        filename = f"{specimen_id}_{panel_type}_{report_str}{date_suffix}_auto.pptx"
-
-        return StreamingResponse(
-            ppt_buffer,
-            media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            headers={
+        # 3. 클라이언트가 이미 같은 버전을 가지고 있으면 304 (렌더링/전송 생략)
+        etag = f'"{render_key}"'
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        # 4. PPT 생성 (캐시 적중 시 파일 전송만 수행, 렌더링은 워커 프로세스에서 수행)
+        profiler = RenderProfiler()
+        pptx_file, render_key = await render_pptx_cached_async(report_data, profiler)
+        try:
+            headers = {
                 "Content-Disposition": f"attachment; filename={filename}",
-                "Access-Control-Expose-Headers": "Content-Disposition"
+                "Content-Length": str(os.fstat(pptx_file.fileno()).st_size),
+                "ETag": f'"{render_key}"',
+                "Cache-Control": "private, no-cache",
+                "Server-Timing": profiler.server_timing(),
+                "Access-Control-Expose-Headers": "Content-Disposition, ETag, Repr-Digest"
             }
-        )
+
+            # 5. 결과 PPTX의 콘텐츠 해시 (렌더링 결과가 결정적이므로 문서 저장소 중복 판단에 사용 가능)
+            # 새로 렌더링한 결과는 워커가 계산한 값, 재시작 전 캐시 파일은 처음 한 번 읽어서 계산 (이벤트 루프 밖에서)
+            content_hash = await run_in_threadpool(render_cache.content_hash, render_key)
+            if content_hash:
+                headers["Repr-Digest"] = _repr_digest(content_hash)
+        except BaseException:
+            pptx_file.close()
+            raise
+
+        # 6. 파일 다운로드 응답 (경로가 아닌 열린 파일에서 전송: 전송 전 캐시 정리로 삭제되어도 안전)
+        return StreamingResponse(_iter_file(pptx_file), media_type=PPTX_MEDIA_TYPE, headers=headers)
+
+    except RenderQueueFull as e:
+        logger.warning(f"PPT 생성 대기열 초과: {specimen_id}")
+        return JSONResponse({"success": False, "error": str(e)}, status_code=503, headers={"Retry-After": "5"})
+
+    except RenderTimeout as e:
+        logger.error(f"PPT 생성 시간 초과: {specimen_id}")
+        return JSONResponse({"success": False, "error": str(e)}, status_code=504)
 
     except Exception as e:
         logger.error(f"PPT 생성 중 오류 발생: {e}")
         return JSONResponse({"success": False, "error": str(e)}, status_code=500)
+
+
+@router.post("/api/download-pptx")
+async def download_pptx(request: Request, specimen_id: str = Form(...), conn: sqlite3.Connection = Depends(get_db)):
+    """
+    특정 검체의 PPT 보고서를 생성하여 다운로드합니다.
+    """
+    return await _download_response(request, specimen_id, conn)
+
+
+@router.get("/api/download-pptx/{specimen_id}")
+async def download_pptx_get(request: Request, specimen_id: str, conn: sqlite3.Connection = Depends(get_db)):
+    """
+    GET 버전의 PPT 다운로드 (브라우저/프록시의 If-None-Match 조건부 요청 지원)
+    """
+    return await _download_response(request, specimen_id, conn)
+
+
+@router.get("/api/pptx-status/{specimen_id}")
+def get_pptx_status(specimen_id: str, conn: sqlite3.Connection = Depends(get_db)):
+    """
+    업로드 후 백그라운드 사전 렌더링 상태 조회 (none / queued / rendering / ready / failed)
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT report_data FROM reports WHERE specimen_id = ?", (specimen_id,))
+    result = cursor.fetchone()
+
+    if not result:
+        return JSONResponse({"success": False, "error": f"보고서를 찾을 수 없습니다: {specimen_id}"}, status_code=404)
+
+    report_data = json.loads(result["report_data"])
+    return JSONResponse({"success": True, "specimen_id": specimen_id, **prerender_queue.status(specimen_id, report_data)})
+
+
+@router.post("/api/bulk-export")
+def bulk_export(specimen_ids: str = Form(""), run_name: str = Form(""), conn: sqlite3.Connection = Depends(get_db)):
+    """
+    여러 검체의 PPT 보고서를 ZIP으로 묶어 스트리밍합니다.
+    specimen_ids(쉼표/공백/줄바꿈 구분) 또는 run_name(V2 Batch Run Name) 중 하나를 지정합니다.
+    실패한 검체는 ZIP 안의 manifest.json에 기록됩니다.
+    """
+    if generator is None:
+        return JSONResponse({"success": False, "error": "PPT 생성 모듈이 로드되지 않았습니다."}, status_code=500)
+
+    cursor = conn.cursor()
+    run_name = run_name.strip()
+
+    if run_name:
+        cursor.execute(
+            "SELECT specimen_id, report_data FROM reports WHERE json_extract(report_data, '$.run_name') = ? "
+            "ORDER BY specimen_id",
+            (run_name,)
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            return JSONResponse({"success": False, "error": f"Run에 해당하는 보고서가 없습니다: {run_name}"}, status_code=404)
+        ids = [row["specimen_id"] for row in rows]
+    else:
+        # 입력 순서를 유지하며 중복 제거
+        ids = list(dict.fromkeys(sid for sid in re.split(r"[,\s]+", specimen_ids) if sid))
+        if not ids:
+            return JSONResponse({"success": False, "error": "specimen_ids 또는 run_name을 지정하세요."}, status_code=400)
+        placeholders = ",".join("?" * len(ids))
+        cursor.execute(f"SELECT specimen_id, report_data FROM reports WHERE specimen_id IN ({placeholders})", ids)
+        rows = cursor.fetchall()
+
+    # DB 연결은 응답 스트리밍 전에 닫히므로 보고서 데이터를 미리 읽어둠
+    reports = {row["specimen_id"]: json.loads(row["report_data"]) for row in rows}
+
+    label = re.sub(r"[^\w.-]", "_", run_name) if run_name else "bulk"
+    filename = f"{label}_pptx_{datetime.now().strftime('%y%m%d_%H%M%S')}.zip"
+
+    return StreamingResponse(
+        bulk_exporter.stream(ids, reports),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Access-Control-Expose-Headers": "Content-Disposition"
+        }
+    )
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Request, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
 import sqlite3
@@ -6,6 +7,8 @@ import json
 import logging
 import config
 from database import get_db
+from services.version_service import list_versions, get_version
+from services.page_plan_service import get_page_plan
 
 router = APIRouter()
 templates = Jinja2Templates(directory=config.TEMPLATE_DIR)
@@ -19,12 +22,16 @@ async def show_report(request: Request, specimen_id: str, conn: sqlite3.Connecti
 
     if result:
         report_data = json.loads(result["report_data"])
+        # 서버에서 계산한 페이지 분할을 그대로 사용 (PPTX와 동일, 브라우저에서 DOM 측정 없음)
+        # 템플릿 로드/계획 계산이 포함될 수 있으므로 이벤트 루프 밖에서 수행
+        page_plan = await run_in_threadpool(get_page_plan, cursor, specimen_id, report_data)
         return templates.TemplateResponse(
             "report.html",
             {
                 "request": request,
                 "specimen_id": specimen_id,
                 "report_data": report_data,
+                "pages": page_plan.pages(),
                 "debug": False
             }
         )
@@ -68,7 +75,7 @@ async def search_reports(q: str = "", conn: sqlite3.Connection = Depends(get_db)
             }
             results.append(result_item)
         except (json.JSONDecodeError, KeyError) as e:
-            print(f"데이터 파싱 오류: {e}")
+            logger.warning(f"데이터 파싱 오류: {e}")
             continue
 
     return JSONResponse({"success": True, "results": results})
@@ -82,10 +89,9 @@ async def get_reports(conn: sqlite3.Connection = Depends(get_db)):
 
     reports = [{"specimen_id": row["specimen_id"], "created_at": row["created_at"]} for row in rows]
 
-    # JSON 파일 목록도 확인
-    json_files = []
-    if config.JSON_DIR.exists():
-        json_files = [f.name for f in config.JSON_DIR.glob('*.json')]
+    # JSON 백업 목록은 매니페스트에서 조회 (디렉토리 스캔 없음)
+    cursor.execute("SELECT path FROM json_backups ORDER BY updated_at DESC")
+    json_files = [row["path"] for row in cursor.fetchall()]
 
     logger.info(f"\n=== 보고서 목록 호출 ===")
     logger.info(f"DB에 저장된 보고서 수: {len(reports)}")
@@ -95,3 +101,25 @@ async def get_reports(conn: sqlite3.Connection = Depends(get_db)):
     logger.info(f"==================\n")
 
     return JSONResponse({"success": True, "reports": reports, "json_files": json_files})
+
+@router.get("/api/reports/{specimen_id}/versions")
+async def get_report_versions(specimen_id: str, conn: sqlite3.Connection = Depends(get_db)):
+    """
+    보고서의 버전 이력 목록을 반환합니다.
+    """
+    versions = list_versions(conn.cursor(), specimen_id)
+    if not versions:
+        return JSONResponse({"success": False, "error": f"버전 이력을 찾을 수 없습니다: {specimen_id}"}, status_code=404)
+
+    return JSONResponse({"success": True, "specimen_id": specimen_id, "versions": versions})
+
+@router.get("/api/reports/{specimen_id}/versions/{version}")
+async def get_report_version(specimen_id: str, version: int, conn: sqlite3.Connection = Depends(get_db)):
+    """
+    특정 버전의 보고서 데이터를 스냅샷 + 델타로 재구성하여 반환합니다.
+    """
+    report_data = get_version(conn.cursor(), specimen_id, version)
+    if report_data is None:
+        return JSONResponse({"success": False, "error": f"버전을 찾을 수 없습니다: {specimen_id} v{version}"}, status_code=404)
+
+    return JSONResponse({"success": True, "specimen_id": specimen_id, "version": version, "report_data": report_data})
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Request, Form, File, UploadFile, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
 import sqlite3
@@ -10,6 +11,9 @@ from database import get_db
 from services.excel_parser import NGS_EXCEL2DB
 from services.report_service import extract_report_data
 from services.file_service import save_json_file, safe_remove_file
+from services.version_service import record_version
+from services.render_service import prerender_queue
+from services.page_plan_service import store_page_plan, get_page_plan
 
 router = APIRouter()
 templates = Jinja2Templates(directory=config.TEMPLATE_DIR)
@@ -23,12 +27,15 @@ async def generate_report(request: Request, specimen_id: str = Form(...), conn:
 
     if result:
         report_data = json.loads(result["report_data"])
+        # 템플릿 로드/계획 계산이 포함될 수 있으므로 이벤트 루프 밖에서 수행
+        page_plan = await run_in_threadpool(get_page_plan, cursor, specimen_id, report_data)
         return templates.TemplateResponse(
             "report.html",
             {
                 "request": request,
                 "specimen_id": specimen_id,
                 "report_data": report_data,
+                "pages": page_plan.pages(),
                 "debug": False
             }
         )
@@ -73,23 +80,42 @@ def upload_excel(file: UploadFile = File(...), conn: sqlite3.Connection = Depend
 
         cursor = conn.cursor()
 
-        # 중복 확인
-        cursor.execute("SELECT specimen_id FROM reports WHERE specimen_id = ?", (specimen_id,))
-        if cursor.fetchone():
+        # 중복 확인 (기존 데이터는 버전 델타 계산에 사용)
+        cursor.execute("SELECT report_data FROM reports WHERE specimen_id = ?", (specimen_id,))
+        existing = cursor.fetchone()
+        previous_data = None
+        if existing:
             logger.warning(f"경고: {specimen_id} 보고서가 이미 존재합니다. 덮어쓰기(Replace)를 수행합니다.")
+            previous_data = json.loads(existing["report_data"])
+
+        # 버전 이력 기록 (이전 보고서는 델타로 보존)
+        version = record_version(cursor, specimen_id, report_data, previous_data)
 
         # DB 저장 (Insert or Replace)
         cursor.execute(
             "INSERT OR REPLACE INTO reports (specimen_id, report_data) VALUES (?, ?)",
             (specimen_id, json.dumps(report_data))
         )
+
+        # 페이지 배치 계획 저장 (HTML 보고서/PPT 공통, 실패해도 조회 시 다시 계산)
+        try:
+            store_page_plan(cursor, specimen_id, report_data)
+        except Exception as e:
+            logger.warning(f"페이지 배치 계획 계산 실패 ({specimen_id}): {e}")
+
         conn.commit()
 
         logger.info(f"데이터베이스 저장 완료: {specimen_id}")
         logger.info(f"======================================\n")
 
-        # JSON 파일 백업
-        json_saved = save_json_file(specimen_id, report_data)
+        # JSON 파일 백업 (백그라운드 writer에 요청만 함, 응답의 값은 기록 성공 여부가 아님)
+        json_backup_queued = save_json_file(specimen_id, report_data)
+
+        # PPT 사전 렌더링 예약 (다운로드 시 캐시 적중)
+        prerender_status = None
+        if config.PRERENDER_ENABLED:
+            prerender_queue.submit(specimen_id, report_data)
+            prerender_status = prerender_queue.status(specimen_id, report_data)["status"]
 
         # 리소스 정리
         parser.close()
@@ -98,7 +124,9 @@ def upload_excel(file: UploadFile = File(...), conn: sqlite3.Connection = Depend
         return JSONResponse({
             "success": True,
             "specimen_id": specimen_id,
-            "json_saved": json_saved
+            "version": version,
+            "json_backup_queued": json_backup_queued,
+            "pptx_status": prerender_status
         })
 
     except Exception as e:
@@ -0,0 +1,193 @@
+import hashlib
+import json
+import logging
+import os
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import wait, FIRST_COMPLETED
+from datetime import datetime
+from services.render_service import generator, render_cache, render_executor, build_pptx_filename
+
+logger = logging.getLogger("app")
+
+MANIFEST_NAME = "manifest.json"
+
+
+class _ZipStreamBuffer:
+    """
+    ZipFile이 기록한 바이트를 모아두었다가 응답 청크로 내보내는 쓰기 전용 버퍼.
+    tell/seek을 제공하지 않으므로 ZipFile은 데이터 디스크립터 방식(스트리밍)으로 기록합니다.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class BulkExporter:
+    """
+    여러 검체의 PPTX를 렌더 워커 프로세스에서 병렬 렌더링하고, 끝나는 순서대로 ZIP 엔트리로 스트리밍합니다.
+    렌더 캐시에 있는 덱은 렌더링 없이 바로 담고, 실패한 검체는 ZIP 안의 manifest.json에 기록합니다.
+    동시에 진행하는 렌더링은 워커 수만큼만 제출하여 다른 다운로드 요청의 대기열 자리를 남겨둡니다.
+    """
+
+    CHUNK_SIZE = 256 * 1024  # 덱 파일을 ZIP에 옮겨 담는 단위 (덱 전체를 메모리에 올리지 않음)
+    START_POLL_SECONDS = 1.0  # 아직 시작되지 않은 렌더링의 시작 여부 확인 간격
+
+    def __init__(self, executor):
+        self.executor = executor
+
+    def _stream_entry(self, archive, buffer, filename, source):
+        """
+        열린 PPTX 파일을 ZIP 엔트리로 CHUNK_SIZE씩 옮겨 담으며 응답 청크를 내보내는 제너레이터.
+        PPTX는 이미 압축된 zip이므로 다시 압축하지 않습니다.
+        옮겨 담으면서 계산한 덱의 SHA-256(hex)을 반환합니다 (manifest 기록용).
+        """
+        sha256 = hashlib.sha256()
+        zinfo = zipfile.ZipInfo(filename, date_time=time.localtime()[:6])
+        zinfo.compress_type = zipfile.ZIP_STORED
+        zinfo.file_size = os.fstat(source.fileno()).st_size
+        with archive.open(zinfo, "w") as entry:
+            while True:
+                chunk = source.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                entry.write(chunk)
+                sha256.update(chunk)
+                yield buffer.drain()
+        yield buffer.drain()
+        return sha256.hexdigest()
+
+    def stream(self, specimen_ids, reports: dict):
+        """
+        ZIP 바이트 청크를 생성하는 제너레이터 (StreamingResponse용).
+
+        Args:
+            specimen_ids: 요청된 검체 번호 목록 (순서 유지)
+            reports: {specimen_id: report_data} (DB에서 찾은 보고서만 포함)
+        """
+        started = time.perf_counter()
+        buffer = _ZipStreamBuffer()
+        archive = zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED)
+        succeeded, failed = [], []
+        cached, pending = [], deque()
+        in_flight = {}  # {future: (specimen_id, filename, render_key, 실행 시작 시각 또는 None)}
+        # 렌더링 제한 시간은 워커가 작업 시작 시점부터 적용하므로, 여기서는 그 시간이 지나도 끝나지 않는 작업만 포기
+        hung_after = self.executor.timeout + self.executor.HUNG_GRACE_SECONDS
+
+        try:
+            # 1. 캐시 확인 (없는 검체만 렌더링 대상)
+            for specimen_id in specimen_ids:
+                report_data = reports.get(specimen_id)
+                if report_data is None:
+                    failed.append({"specimen_id": specimen_id, "error": "보고서를 찾을 수 없습니다."})
+                    continue
+
+                filename = build_pptx_filename(specimen_id, report_data)
+                render_key = generator.get_render_key(report_data)
+                if render_cache.contains(render_key):
+                    cached.append((specimen_id, filename, render_key, report_data))
+                else:
+                    pending.append((specimen_id, filename, render_key, report_data))
+
+            def fill_window():
+                while pending and len(in_flight) < self.executor.max_workers:
+                    specimen_id, filename, render_key, report_data = pending.popleft()
+                    try:
+                        future = self.executor.submit(report_data, block=True)
+                    except Exception as e:
+                        logger.error(f"일괄 내보내기 렌더링 요청 실패 ({specimen_id}): {e}")
+                        failed.append({"specimen_id": specimen_id, "error": str(e) or type(e).__name__})
+                        continue
+                    in_flight[future] = (specimen_id, filename, render_key, None)
+
+            # 렌더링을 먼저 제출해야 캐시된 덱 전송과 렌더링이 겹침
+            fill_window()
+
+            # 2. 캐시된 덱부터 전송
+            for specimen_id, filename, render_key, report_data in cached:
+                try:
+                    source = render_cache.open(render_key)
+                except OSError as e:
+                    failed.append({"specimen_id": specimen_id, "error": f"캐시 파일 읽기 실패: {e}"})
+                    continue
+                if source is None:
+                    # 확인 이후 다른 요청의 LRU 정리로 삭제됨: 다시 렌더링
+                    pending.append((specimen_id, filename, render_key, report_data))
+                    fill_window()
+                    continue
+                with source:
+                    content_hash = yield from self._stream_entry(archive, buffer, filename, source)
+                succeeded.append({"specimen_id": specimen_id, "filename": filename, "cached": True, "sha256": content_hash})
+
+            # 3. 렌더링이 끝나는 순서대로 전송
+            while in_flight:
+                # 대기열에서 기다린 시간은 제외하고 실행이 시작된 시점부터 계산
+                now = time.monotonic()
+                waits = []
+                for future, (specimen_id, filename, render_key, running_since) in list(in_flight.items()):
+                    if running_since is None and future.running():
+                        running_since = now
+                        in_flight[future] = (specimen_id, filename, render_key, running_since)
+                    waits.append(self.START_POLL_SECONDS if running_since is None else running_since + hung_after - now)
+                done, _ = wait(list(in_flight), timeout=max(0.0, min(waits)), return_when=FIRST_COMPLETED)
+
+                if not done:
+                    # 워커 제한 시간이 지나도 끝나지 않는 작업 정리
+                    now = time.monotonic()
+                    for future, (specimen_id, _, _, running_since) in list(in_flight.items()):
+                        if running_since is not None and now - running_since >= hung_after:
+                            del in_flight[future]
+                            self.executor.abandon(future)
+                            failed.append({"specimen_id": specimen_id, "error": f"렌더링 시간 초과 ({self.executor.timeout}s)"})
+
+                for future in done:
+                    specimen_id, filename, render_key, _ = in_flight.pop(future)
+                    try:
+                        tmp_path, rendered_hash, _, _ = self.executor.result(future, timeout=0)
+                        source = render_cache.adopt_open(render_key, tmp_path, rendered_hash)
+                    except Exception as e:
+                        logger.error(f"일괄 내보내기 렌더링 실패 ({specimen_id}): {e}")
+                        failed.append({"specimen_id": specimen_id, "error": str(e) or type(e).__name__})
+                        continue
+
+                    with source:
+                        content_hash = yield from self._stream_entry(archive, buffer, filename, source)
+                    succeeded.append({"specimen_id": specimen_id, "filename": filename, "cached": False, "sha256": content_hash})
+
+                fill_window()
+
+            # 4. 결과 요약 (실패 목록 포함)
+            manifest = {
+                "generated_at": datetime.now().isoformat(timespec="seconds"),
+                "requested": len(specimen_ids),
+                "succeeded": succeeded,
+                "failed": failed
+            }
+            archive.writestr(MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=4))
+            archive.close()
+            yield buffer.drain()
+
+            logger.info(
+                f"일괄 내보내기 완료: 성공 {len(succeeded)}건, 실패 {len(failed)}건 "
+                f"({time.perf_counter() - started:.1f}s)"
+            )
+        finally:
+            # 클라이언트 연결 종료 등으로 중단되면 남은 렌더링 취소 (이미 실행 중이면 끝난 뒤 임시 파일 삭제)
+            for future in in_flight:
+                self.executor.abandon(future)
+
+
+bulk_exporter = BulkExporter(render_executor)
@@ -1,8 +1,11 @@
+import logging
 import pandas as pd
 from typing import Tuple, List, Dict, Any
 import warnings
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger("app")
+
 class NGS_EXCEL2DB:
     def __init__(self, file):
         self.df = pd.ExcelFile(file, engine='openpyxl')
@@ -17,7 +20,7 @@ class NGS_EXCEL2DB:
         try:
             self.CNVarm = self.df.parse('CNVarm', dtype=str).fillna('')
         except Exception as e:
-            print(f"CNVarm 시트 로드 실패, 빈 DataFrame 사용: {e}")
+            logger.warning(f"CNVarm 시트 로드 실패, 빈 DataFrame 사용: {e}")
             self.CNVarm = pd.DataFrame()
             
         self.CNV_allFC = self.df.parse('CNV_allFC', dtype=str).fillna('')
@@ -35,7 +38,7 @@ class NGS_EXCEL2DB:
                 if cell_e4 == "TSO500_v2":
                     self.is_v2 = True
         except Exception as e:
-            print(f"V2 판별 중 오류 발생: {e}")
+            logger.warning(f"V2 판별 중 오류 발생: {e}")
 
     def _parse_highlight_structure(self, highlight_text: str, gene_names: List[str] = None) -> List[Dict[str, Any]]:
         if not highlight_text:
@@ -114,9 +117,9 @@ class NGS_EXCEL2DB:
         try:
             if hasattr(self.df, 'close'):
                 self.df.close()
-            print(f"Excel 파일 닫기 완료: {self._file_path}")
+            logger.debug("Excel 파일 닫기 완료: %s", self._file_path)
         except Exception as e:
-            print(f"Excel 파일 닫기 실패: {e}")
+            logger.warning(f"Excel 파일 닫기 실패: {e}")
     
     def __enter__(self):
         return self
@@ -227,13 +230,16 @@ class NGS_EXCEL2DB:
         if self.is_v2:
             try:
                 # tumor % 키 디버깅
-                tumor_keys = [k for k in self.clinical_dict.keys() if 'tumor' in str(k).lower()]
-                print(f"[DEBUG] clinical_dict tumor-related keys: {tumor_keys}")
+                debug = logger.isEnabledFor(logging.DEBUG)
+                if debug:
+                    tumor_keys = [k for k in self.clinical_dict.keys() if 'tumor' in str(k).lower()]
+                    logger.debug("clinical_dict tumor-related keys: %s", tumor_keys)
                 pathological_val = ''
                 for k in self.clinical_dict:
                     if 'tumor' in str(k).lower():
                         pathological_val = str(self.clinical_dict[k]).strip()
-                        print(f"[DEBUG] Found tumor key: '{k}' -> '{pathological_val}'")
+                        if debug:
+                            logger.debug("Found tumor key: '%s' -> '%s'", k, pathological_val)
                         break
                 
                 biomarkers['Tumor_Fraction'] = {
@@ -250,7 +256,7 @@ class NGS_EXCEL2DB:
                     'unit': ''
                 }
             except Exception as e:
-                print(f"V2 Biomarker (Tumor Fraction/Ploidy) 추출 실패: {e}")
+                logger.warning(f"V2 Biomarker (Tumor Fraction/Ploidy) 추출 실패: {e}")
                 
         return biomarkers
 
@@ -282,7 +288,7 @@ class NGS_EXCEL2DB:
                 return str(val).strip()
             return ""
         except Exception as e:
-            print(f"Sequence Date 추출 실패: {e}")
+            logger.warning(f"Sequence Date 추출 실패: {e}")
             return ""
 
 
@@ -299,7 +305,7 @@ class NGS_EXCEL2DB:
                 return str(val).strip()
             return ""
         except Exception as e:
-            print(f"Run Name 추출 실패: {e}")
+            logger.warning(f"Run Name 추출 실패: {e}")
             return ""
     
 
@@ -362,49 +368,3 @@ class NGS_EXCEL2DB:
             'Analyzed by': '이청',
             '분자접수번호': self.clinical_dict["분자접수번호"]
         }
-
-
-def split_variants_into_pages(variants_data: Dict[str, Any], max_items_per_page: int = 5) -> List[Dict[str, Any]]:
-    """
-    변이 데이터를 페이지별로 분할합니다.
-    
-    Args:
-        variants_data: 변이 데이터 딕셔너리
-        max_items_per_page: 페이지당 최대 항목 수
-    
-    Returns:
-        페이지별로 분할된 데이터 리스트
-    """
-    pages = []
-    current_page = {'clinical': {}, 'unknown': {}}
-    item_count = 0
-    
-    # Clinical significance 변이들
-    for key in ['snv_clinical', 'fusion_clinical', 'cnv_clinical', 'lr_brca_clinical', 'splice_clinical']:
-        if key in variants_data and variants_data[key]['data']:
-            if item_count + len(variants_data[key]['data']) > max_items_per_page:
-                if current_page['clinical']:
-                    pages.append(current_page)
-                current_page = {'clinical': {}, 'unknown': {}}
-                item_count = 0
-            
-            current_page['clinical'][key] = variants_data[key]
-            item_count += len(variants_data[key]['data'])
-    
-    # Unknown significance 변이들
-    for key in ['snv_unknown', 'fusion_unknown', 'cnv_unknown', 'lr_brca_unknown', 'splice_unknown']:
-        if key in variants_data and variants_data[key]['data']:
-            if item_count + len(variants_data[key]['data']) > max_items_per_page:
-                if current_page['clinical'] or current_page['unknown']:
-                    pages.append(current_page)
-                current_page = {'clinical': {}, 'unknown': {}}
-                item_count = 0
-            
-            current_page['unknown'][key] = variants_data[key]
-            item_count += len(variants_data[key]['data'])
-    
-    # 마지막 페이지 추가
-    if current_page['clinical'] or current_page['unknown']:
-        pages.append(current_page)
-    
-    return pages
\ No newline at end of file
@@ -1,7 +1,13 @@
 import os
+import gzip
 import json
 import time
+import queue
+import sqlite3
+import hashlib
 import logging
+import tempfile
+import threading
 import config
 
 logger = logging.getLogger("app")
@@ -39,14 +45,191 @@ def safe_remove_file(file_path: str, max_retries: int = 5, delay: float = 0.5) -
     return False
 
 
+def json_backup_path(specimen_id, backup_format=None):
+    """
+    검체 번호의 해시로 샤딩된 JSON 백업 경로를 반환합니다.
+    예: json/3f/a2/{specimen_id}.json (gzip 형식은 .json.gz)
+    """
+    backup_format = backup_format or config.JSON_BACKUP_FORMAT
+    digest = hashlib.sha1(str(specimen_id).encode("utf-8")).hexdigest()
+    suffix = ".json.gz" if backup_format == "gzip" else ".json"
+    return config.JSON_DIR / digest[:2] / digest[2:4] / f"{specimen_id}{suffix}"
+
+
+def _serialize_report(report_data, backup_format):
+    if backup_format == "pretty":
+        return json.dumps(report_data, indent=4, ensure_ascii=False).encode("utf-8")
+
+    payload = json.dumps(report_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if backup_format == "gzip":
+        # mtime=0: 같은 데이터는 항상 같은 바이트로 저장
+        return gzip.compress(payload, mtime=0)
+    return payload
+
+
+def write_json_backup(specimen_id, report_data, backup_format=None):
+    """
+    JSON 백업을 임시 파일에 쓴 뒤 rename하여 원자적으로 교체합니다.
+    (쓰는 도중 중단되어도 기존 백업이 깨지지 않음)
+
+    Returns:
+        (Path, int): 저장된 백업 파일 경로와 바이트 크기
+    """
+    backup_format = backup_format or config.JSON_BACKUP_FORMAT
+    target_path = json_backup_path(specimen_id, backup_format)
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+
+    data = _serialize_report(report_data, backup_format)
+
+    fd, tmp_path = tempfile.mkstemp(dir=target_path.parent, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, target_path)
+    except Exception:
+        safe_remove_file(tmp_path)
+        raise
+
+    return target_path, len(data)
+
+
+class JsonBackupWriter:
+    """
+    업로드 요청 경로 밖에서 JSON 백업을 기록하는 백그라운드 writer.
+    단일 스레드가 큐를 소비하며 파일을 원자적으로 쓰고 json_backups 매니페스트를 갱신합니다.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()  # 동시 업로드(스레드풀)에서 writer 스레드가 둘 뜨지 않도록 보호
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="json-backup-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """큐에 남은 백업을 모두 기록한 뒤 스레드를 종료합니다."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join()
+
+    def submit(self, specimen_id, report_data):
+        # 단일 writer가 순서대로 기록해야 하므로 (lifespan 밖에서 호출된 경우에만) 여기서 시작
+        self.start()
+        self._queue.put((specimen_id, report_data, config.JSON_BACKUP_FORMAT))
+
+    def flush(self):
+        """현재까지 제출된 백업이 모두 기록될 때까지 대기합니다."""
+        self._queue.join()
+
+    def _run(self):
+        conn = sqlite3.connect(config.DB_PATH, timeout=30)
+        try:
+            while True:
+                item = self._queue.get()
+                try:
+                    if item is None:
+                        return
+                    self._write(conn, *item)
+                finally:
+                    self._queue.task_done()
+        finally:
+            conn.close()
+
+    def _write(self, conn, specimen_id, report_data, backup_format):
+        try:
+            path, size = write_json_backup(specimen_id, report_data, backup_format)
+            previous = conn.execute(
+                "SELECT path FROM json_backups WHERE specimen_id = ?", (specimen_id,)
+            ).fetchone()
+            relative_path = path.relative_to(config.JSON_DIR).as_posix()
+            conn.execute(
+                "INSERT OR REPLACE INTO json_backups (specimen_id, path, format, size, updated_at) "
+                "VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)",
+                (specimen_id, relative_path, backup_format, size)
+            )
+            conn.commit()
+
+            # 형식 변경 등으로 경로가 바뀐 경우 이전 백업 정리
+            if previous and previous[0] != relative_path:
+                safe_remove_file(str(config.JSON_DIR / previous[0]))
+
+            logger.info(f"JSON 파일 저장 완료: {path}")
+        except Exception as e:
+            logger.error(f"JSON 파일 저장 실패 ({specimen_id}): {str(e)}")
+
+
+backup_writer = JsonBackupWriter()
+
+
+def backfill_legacy_backups():
+    """
+    샤딩 이전의 평면 구조 백업(json/*.json) 중 매니페스트에 없는 파일을 json_backups에 등록합니다 (서버 시작 시 1회).
+    이미 샤딩 경로로 다시 백업된 검체는 매니페스트의 기존 행을 유지하고,
+    이후 같은 검체가 업로드되면 writer가 평면 파일을 정리합니다.
+
+    Returns:
+        int: 새로 등록한 백업 수
+    """
+    if not config.JSON_DIR.exists():
+        return 0
+
+    rows = []
+    for path in config.JSON_DIR.glob("*.json"):
+        if path.name.startswith(".tmp_"):
+            continue
+        try:
+            with open(path, "rb") as f:
+                head = f.read(2)
+            size = os.path.getsize(path)
+        except OSError as e:
+            logger.warning(f"평면 구조 백업 확인 실패, 건너뜀: {path} - {e}")
+            continue
+        # rebuild_db.load_backup과 같은 형식 판별 (pretty는 indent=4로 저장)
+        backup_format = "pretty" if head == b"{\n" else "compact"
+        rows.append((path.stem, path.name, backup_format, size, os.path.getmtime(path)))
+
+    if not rows:
+        return 0
+
+    conn = sqlite3.connect(config.DB_PATH, timeout=30)
+    try:
+        before = conn.total_changes
+        conn.executemany(
+            "INSERT OR IGNORE INTO json_backups (specimen_id, path, format, size, updated_at) "
+            "VALUES (?, ?, ?, ?, datetime(?, 'unixepoch'))",
+            rows
+        )
+        conn.commit()
+        added = conn.total_changes - before
+    finally:
+        conn.close()
+
+    if added:
+        logger.info(f"평면 구조 JSON 백업 {added}건을 매니페스트에 등록")
+    return added
+
+
 def save_json_file(specimen_id, report_data):
-    """JSON 파일로 저장하는 함수"""
+    """
+    JSON 백업을 백그라운드 writer에 요청하는 함수 (요청 경로에서 파일 I/O 없음)
+
+    Returns:
+        bool: 요청이 대기열에 들어갔는지 여부 (기록 성공 여부가 아님, 기록 실패는 writer가 로그로 남기고
+              json_backups 매니페스트가 갱신되지 않음)
+    """
     try:
-        json_file_path = config.JSON_DIR / f"{specimen_id}.json"
-        with open(json_file_path, "w", encoding="utf-8") as json_file:
-            json.dump(report_data, json_file, indent=4, ensure_ascii=False)
-        logger.info(f"JSON 파일 저장 완료: {json_file_path}")
+        backup_writer.submit(specimen_id, report_data)
         return True
     except Exception as e:
-        logger.error(f"JSON 파일 저장 실패: {str(e)}")
+        logger.error(f"JSON 파일 저장 요청 실패: {str(e)}")
         return False
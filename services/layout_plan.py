@@ -0,0 +1,140 @@
+"""
+변이 섹션 배치 계획 (HTML 보고서/PPTX 공유)
+
+python-pptx에 의존하지 않으므로, PPT 생성 모듈을 불러올 수 없어도 HTML 보고서는 이 모듈만으로 페이지를 구성합니다.
+"""
+from dataclasses import dataclass
+
+# 섹션 시작점을 찾기 위한 텍스트 매핑 (템플릿의 메인 섹션 제목)
+SECTION_START_MARKERS = {
+    "clinical": "1. Variants of clinical significance",
+    "unknown": "2. Variants of unknown significance"
+}
+
+# 섹션 순서 및 키
+VARIANT_SECTIONS = [
+    # 1. Clinical Significance
+    {"key": "snv_clinical", "title": "SNVs & Indels", "type": "clinical", "prototype_key": "snv_clinical"},
+    {"key": "fusion_clinical", "title": "Fusion gene", "type": "clinical", "prototype_key": "fusion_clinical"},
+    {"key": "cnv_clinical", "title": "Copy number variation", "type": "clinical", "prototype_key": "cnv_clinical"},
+    {"key": "lr_brca_clinical", "title": "Large rearrangements in BRCA1/2", "type": "clinical",
+     "prototype_key": "lr_brca_clinical"},
+    {"key": "splice_clinical", "title": "Splice variant", "type": "clinical", "prototype_key": "splice_clinical"},
+
+    # 2. Unknown Significance
+    {"key": "snv_unknown", "title": "SNVs & Indels", "type": "unknown", "prototype_key": "snv_clinical"},
+    {"key": "fusion_unknown", "title": "Fusion gene", "type": "unknown", "prototype_key": "fusion_clinical"},
+    {"key": "cnv_unknown", "title": "Copy number variation", "type": "unknown", "prototype_key": "cnv_clinical"},
+    {"key": "lr_brca_unknown", "title": "Large rearrangements in BRCA1/2", "type": "unknown",
+     "prototype_key": "lr_brca_clinical"},
+    {"key": "splice_unknown", "title": "Splice variant", "type": "unknown", "prototype_key": "splice_clinical"}
+]
+
+
+@dataclass(frozen=True)
+class VariantLayoutPlan:
+    """변이 섹션 배치 계획 (report_data + CompiledLayout만으로 계산되는 순수 결과)
+
+    steps는 실행 순서대로의 (동작, *인자) 튜플입니다.
+    - ("move_to_section", section_type): 템플릿 앵커 위치로 이동
+    - ("remove_anchor_title", section_type): 사용하지 않는 템플릿 메인 제목 제거
+    - ("new_slide",): 현재 슬라이드 다음에 새 슬라이드 추가 (메인 제목 반복 포함)
+    - ("main_title", text): 메인 섹션 제목
+    - ("set_main_title", text): 새 슬라이드에서 반복할 메인 제목 지정
+    - ("section_header", title, highlight, is_none, is_clinical): 소제목
+    - ("table", section_key, start, end): 프로토타입 테이블 조각 (data[start:end])
+    - ("scratch_table", section_key): 프로토타입이 없는 섹션의 테이블
+    - ("space", height): 세로 간격
+    """
+    steps: tuple
+    new_slides: int
+
+    def to_dict(self) -> dict:
+        """JSON 저장용"""
+        return {"steps": [list(step) for step in self.steps], "new_slides": self.new_slides}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "VariantLayoutPlan":
+        return cls(steps=tuple(tuple(step) for step in data["steps"]), new_slides=data["new_slides"])
+
+    def pages(self) -> list:
+        """
+        HTML 보고서용 페이지 구성 (PPTX 슬라이드 분할과 동일).
+
+        Returns:
+            [{"anchor": section_type 또는 None(추가 슬라이드), "blocks": [...]}, ...]
+            blocks: main_title / section_header / table (table의 end가 None이면 전체 행)
+        """
+        marker_types = {text: section_type for section_type, text in SECTION_START_MARKERS.items()}
+        section_types = {section["key"]: section["type"] for section in VARIANT_SECTIONS}
+
+        def main_title_block(text, repeat=False):
+            return {"type": "main_title", "text": text, "section_type": marker_types.get(text), "repeat": repeat}
+
+        pages = [{"anchor": None, "blocks": []}]  # 시작 슬라이드 (템플릿 첫 슬라이드)
+        main_title = None
+
+        for step in self.steps:
+            action = step[0]
+            if action == "move_to_section":
+                section_type = step[1]
+                if len(pages) == 1 and not pages[0]["blocks"]:
+                    pages[0]["anchor"] = section_type
+                else:
+                    pages.append({"anchor": section_type, "blocks": []})
+                pages[-1]["blocks"].append(main_title_block(SECTION_START_MARKERS[section_type]))
+            elif action == "new_slide":
+                pages.append({"anchor": None, "blocks": []})
+                if main_title:
+                    pages[-1]["blocks"].append(main_title_block(main_title, repeat=True))
+            elif action == "main_title":
+                pages[-1]["blocks"].append(main_title_block(step[1]))
+            elif action == "set_main_title":
+                main_title = step[1]
+            elif action == "section_header":
+                _, title, highlight, is_none, is_clinical = step
+                pages[-1]["blocks"].append({
+                    "type": "section_header", "title": title, "highlight": highlight,
+                    "is_none": is_none, "is_clinical": is_clinical
+                })
+            elif action in ("table", "scratch_table"):
+                key = step[1]
+                start, end = (step[2], step[3]) if action == "table" else (0, None)
+                pages[-1]["blocks"].append({
+                    "type": "table", "key": key, "start": start, "end": end,
+                    "is_clinical": section_types[key] == "clinical"
+                })
+
+        return pages
+
+
+def unsplit_layout_plan(report_data: dict) -> VariantLayoutPlan:
+    """
+    템플릿 없이 만드는 분할 없는 배치 계획 (PPT 생성 모듈/템플릿을 쓸 수 없을 때 HTML 보고서용).
+    메인 섹션마다 한 페이지에 모든 테이블을 전체 행으로 배치하므로 행이 누락되지 않습니다.
+    """
+    steps = []
+    current_section_group = None
+
+    for section_config in VARIANT_SECTIONS:
+        key = section_config["key"]
+        style_type = section_config["type"]
+
+        if current_section_group != style_type:
+            current_section_group = style_type
+            steps.append(("move_to_section", style_type))
+            steps.append(("set_main_title", SECTION_START_MARKERS[style_type]))
+
+        section_data = report_data.get(key, {})
+        # LR-BRCA (Clinical) 데이터가 없으면 섹션 자체를 스킵 (PPTX 배치 계획과 동일)
+        if key == "lr_brca_clinical" and not section_data.get("data"):
+            continue
+
+        if section_data.get("data"):
+            steps.append(("section_header", section_config["title"], section_data.get("highlight", []),
+                          False, style_type == "clinical"))
+            steps.append(("scratch_table", key))
+        else:
+            steps.append(("section_header", section_config["title"], None, True, True))
+
+    return VariantLayoutPlan(steps=tuple(steps), new_slides=0)
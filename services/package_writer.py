@@ -0,0 +1,187 @@
+import struct
+import zipfile
+import zlib
+from collections import namedtuple
+
+from pptx.opc.package import XmlPart
+from pptx.opc.serialized import PackageWriter
+
+# 미리 압축한 zip 엔트리 (data: deflate 압축 바이트, source: 바이너리 파트의 원본 blob, XML 파트는 None)
+CompressedEntry = namedtuple("CompressedEntry", ["data", "crc", "size", "source"])
+
+# 모든 엔트리에 기록하는 고정 수정 시각 (zip 형식이 표현할 수 있는 최소값).
+# 같은 보고서는 언제 어느 서버에서 렌더링해도 바이트 단위로 같은 PPTX가 되어 콘텐츠 해시로 비교할 수 있습니다.
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def compress_blob(blob: bytes, source=None) -> CompressedEntry:
+    """zipfile(ZIP_DEFLATED, 기본 압축 레벨)과 같은 설정으로 압축"""
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    data = compressor.compress(blob) + compressor.flush()
+    return CompressedEntry(data, zlib.crc32(blob), len(blob), source)
+
+
+class TemplatePartStore:
+    """
+    템플릿 1개의 '렌더링 중 바뀌지 않는 파트'를 미리 압축해 둔 zip 엔트리 모음 (템플릿당 1회 생성).
+    저장할 때 이 파트들은 다시 직렬화/압축하지 않고 엔트리를 그대로 복사합니다.
+
+    - 바이너리 파트(이미지, 테마 등): 렌더링 결과의 blob이 템플릿과 같은 객체일 때만 재사용
+    - XML 파트: presentation.xml과 mutable_slide_ids(값을 채우거나 흐름에 속한 슬라이드)를 제외하고 재사용
+    파트는 clone_presentation이 기록한 템플릿 파트명(_template_partname)으로 찾으므로,
+    렌더링 중 슬라이드 파트명이 바뀌어도(슬라이드 삽입) 그대로 찾을 수 있습니다.
+    """
+
+    def __init__(self, prs, mutable_slide_ids):
+        """prs: 템플릿 원본 (읽기만 함)"""
+        presentation_part = prs.part
+        mutable_partnames = {presentation_part.partname}
+        for sld_id in presentation_part._element.sldIdLst:
+            if sld_id.id in mutable_slide_ids:
+                mutable_partnames.add(presentation_part.related_part(sld_id.rId).partname)
+
+        self._entries = {}
+        for part in presentation_part.package.iter_parts():
+            if part.partname in mutable_partnames:
+                continue
+            blob = part.blob
+            partname = getattr(part, "_template_partname", part.partname)
+            self._entries[partname] = compress_blob(blob, None if isinstance(part, XmlPart) else blob)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def reusable_entry(self, part):
+        """part가 템플릿에서 바뀌지 않았으면 미리 압축한 엔트리, 아니면 None"""
+        entry = self._entries.get(getattr(part, "_template_partname", None))
+        if entry is None:
+            return None
+        if entry.source is not None and part.blob is not entry.source:
+            return None
+        return entry
+
+
+class ZipPartWriter:
+    """
+    OPC 패키지용 zip 작성기 (python-pptx의 물리 패키지 작성기와 같은 write(pack_uri, blob) 인터페이스).
+    미리 압축한 엔트리는 write_compressed로 압축 없이 그대로 기록합니다.
+    크기를 미리 알고 쓰므로 출력 파일은 쓰기만 가능하면 되며(seek 불필요), ZIP64는 지원하지 않습니다.
+    시각/생성 OS 등 메타데이터는 고정값을 기록하므로 같은 파트를 같은 순서로 쓰면 결과 바이트도 같습니다.
+    """
+
+    _VERSION = 20  # deflate 압축 해제에 필요한 최소 버전 (zipfile 기본값과 동일)
+    _CREATE_SYSTEM = 3  # 생성 OS (Unix, 서버 OS와 무관하게 고정)
+    _EXTERNAL_ATTR = 0o600 << 16  # zipfile.writestr 기본 권한
+
+    def __init__(self, fileobj, date_time=FIXED_DATE_TIME):
+        self._fp = fileobj
+        self._offset = 0
+        self._entries = []  # [(이름 바이트, flag, CompressedEntry, 로컬 헤더 위치)]
+        year, month, day, hour, minute, second = date_time
+        self._dos_time = (hour << 11) | (minute << 5) | (second // 2)
+        self._dos_date = ((year - 1980) << 9) | (month << 5) | day
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+
+    def write(self, pack_uri, blob: bytes):
+        self.write_compressed(pack_uri, compress_blob(blob))
+
+    def write_compressed(self, pack_uri, entry: CompressedEntry):
+        name = pack_uri.membername.encode("utf-8")
+        flag_bits = 0 if pack_uri.membername.isascii() else 0x800  # UTF-8 파일명
+        header = struct.pack(
+            zipfile.structFileHeader, zipfile.stringFileHeader,
+            self._VERSION, 0, flag_bits, zipfile.ZIP_DEFLATED, self._dos_time, self._dos_date,
+            entry.crc, len(entry.data), entry.size, len(name), 0
+        )
+        self._fp.write(header)
+        self._fp.write(name)
+        self._fp.write(entry.data)
+        self._entries.append((name, flag_bits, entry, self._offset))
+        self._offset += len(header) + len(name) + len(entry.data)
+
+    def close(self):
+        """중앙 디렉토리와 끝 레코드를 기록합니다."""
+        if self._offset > zipfile.ZIP64_LIMIT or len(self._entries) >= zipfile.ZIP_FILECOUNT_LIMIT:
+            raise ValueError("PPTX 패키지가 ZIP64가 필요할 만큼 큽니다.")
+
+        central_start = self._offset
+        for name, flag_bits, entry, header_offset in self._entries:
+            self._fp.write(struct.pack(
+                zipfile.structCentralDir, zipfile.stringCentralDir,
+                self._VERSION, self._CREATE_SYSTEM, self._VERSION, 0, flag_bits, zipfile.ZIP_DEFLATED,
+                self._dos_time, self._dos_date, entry.crc, len(entry.data), entry.size,
+                len(name), 0, 0, 0, 0, self._EXTERNAL_ATTR, header_offset
+            ))
+            self._fp.write(name)
+            self._offset += zipfile.sizeCentralDir + len(name)
+
+        self._fp.write(struct.pack(
+            zipfile.structEndArchive, zipfile.stringEndArchive,
+            0, 0, len(self._entries), len(self._entries), self._offset - central_start, central_start, 0
+        ))
+
+
+class TemplatePackageWriter(PackageWriter):
+    """
+    python-pptx PackageWriter와 같은 순서/내용으로 패키지를 기록하되,
+    템플릿에서 바뀌지 않은 파트는 TemplatePartStore의 압축 엔트리를 그대로 복사합니다.
+    ([Content_Types].xml, .rels, 바뀐 파트만 직렬화/압축)
+    """
+
+    def __init__(self, pkg_file, pkg_rels, parts, part_store: TemplatePartStore = None, verify: bool = False):
+        super().__init__(pkg_file, pkg_rels, parts)
+        self._part_store = part_store
+        self._verify = verify
+        self.reused_parts = 0
+
+    @classmethod
+    def save(
+        cls, prs, fileobj, part_store: TemplatePartStore = None, verify: bool = False
+    ) -> "TemplatePackageWriter":
+        """
+        prs를 fileobj(처음 위치)에 PPTX로 저장하고 작성기(재사용한 파트 수 확인용)를 반환합니다.
+
+        verify=True이면 재사용하는 XML 파트도 직렬화하여 템플릿 엔트리와 내용(CRC/크기)이 같은지 확인합니다.
+        (prs.save가 기록할 바이트와 비교, 다르면 AssertionError)
+        값을 채우는 슬라이드가 mutable_slide_ids에 빠져 변경 내용이 조용히 버려지는 경우를 잡기 위한 검사용이며,
+        재사용으로 아낀 직렬화 비용을 다시 쓰므로 운영 렌더링에서는 끕니다.
+        """
+        package = prs.part.package
+        writer = cls(fileobj, package._rels, tuple(package.iter_parts()), part_store, verify)
+        writer._write()
+        return writer
+
+    def _write(self):
+        with ZipPartWriter(self._pkg_file) as phys_writer:
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            self._write_parts(phys_writer)
+
+    def _write_parts(self, phys_writer: ZipPartWriter):
+        for part in self._parts:
+            entry = self._part_store.reusable_entry(part) if self._part_store is not None else None
+            if entry is not None and self._verify and entry.source is None:
+                self._verify_reused(part, entry)
+            if entry is not None:
+                phys_writer.write_compressed(part.partname, entry)
+                self.reused_parts += 1
+            else:
+                phys_writer.write(part.partname, part.blob)
+            if part._rels:
+                phys_writer.write(part.partname.rels_uri, part.rels.xml)
+
+    @staticmethod
+    def _verify_reused(part, entry: CompressedEntry):
+        """재사용할 XML 파트가 템플릿 엔트리와 같은 바이트로 직렬화되는지 확인"""
+        blob = part.blob
+        if len(blob) != entry.size or zlib.crc32(blob) != entry.crc:
+            raise AssertionError(
+                f"템플릿 엔트리를 재사용하는 파트가 렌더링 중 변경되었습니다: {part.partname} "
+                f"(값을 채우는 슬라이드는 TemplatePartStore의 mutable_slide_ids에 포함해야 합니다)"
+            )
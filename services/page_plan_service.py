@@ -0,0 +1,129 @@
+import json
+import logging
+import sqlite3
+import config
+from services.layout_plan import VariantLayoutPlan, unsplit_layout_plan
+from services.render_service import generator
+
+logger = logging.getLogger("app")
+
+# 시작 시 백필에서 한 번에 커밋하는 계획 수
+PAGE_PLAN_BACKFILL_BATCH = 50
+
+
+def _dumps_plan(plan: VariantLayoutPlan) -> str:
+    return json.dumps(plan.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+
+def compute_page_plan(report_data: dict):
+    """
+    page_plans 테이블에 저장할 (plan_key, 계획 JSON 문자열). PPT 생성 모듈이 없으면 None.
+    (rebuild_db의 프로세스 풀 워커에서도 호출)
+    """
+    if generator is None:
+        return None
+    return generator.get_render_key(report_data), _dumps_plan(generator.plan_layout(report_data))
+
+
+def store_page_plan(cursor, specimen_id: str, report_data: dict):
+    """
+    보고서의 변이 섹션 배치 계획을 계산하여 page_plans 테이블에 저장합니다 (업로드 시 호출).
+    계획은 렌더 키(보고서 데이터 + 템플릿 + 렌더러 버전) 단위로 유효합니다.
+
+    Args:
+        cursor: DB 커서 (commit은 호출자가 수행)
+
+    Returns:
+        VariantLayoutPlan (PPT 생성 모듈이 없으면 저장하지 않고 None)
+    """
+    if generator is None:
+        return None
+
+    plan_key = generator.get_render_key(report_data)
+    plan = generator.plan_layout(report_data)
+    cursor.execute(
+        "INSERT OR REPLACE INTO page_plans (specimen_id, plan_key, plan) VALUES (?, ?, ?)",
+        (specimen_id, plan_key, _dumps_plan(plan))
+    )
+    return plan
+
+
+def backfill_page_plans():
+    """
+    저장된 배치 계획이 없거나 키가 현재 보고서/템플릿/렌더러 버전과 다른 보고서의 계획을 계산하여 저장합니다
+    (서버 시작 시 백그라운드 스레드에서 1회).
+    계획은 업로드 시에만 저장되므로, 도입 이전 보고서나 템플릿 변경 후에는 HTML 조회마다 다시 계산하지 않도록 채워 둡니다.
+    계산하는 동안 같은 검체가 다시 업로드되었으면 (업로드가 새 계획을 저장하므로) 덮어쓰지 않습니다.
+
+    Returns:
+        int: 새로 저장한 계획 수
+    """
+    if generator is None:
+        return 0
+
+    conn = sqlite3.connect(config.DB_PATH, timeout=30)
+    stored = pending = 0
+    try:
+        specimen_ids = [row[0] for row in conn.execute("SELECT specimen_id FROM reports ORDER BY specimen_id")]
+        for specimen_id in specimen_ids:
+            row = conn.execute(
+                "SELECT r.report_data, p.plan_key FROM reports r "
+                "LEFT JOIN page_plans p ON p.specimen_id = r.specimen_id WHERE r.specimen_id = ?",
+                (specimen_id,)
+            ).fetchone()
+            if row is None:
+                continue
+            report_json, stored_key = row
+            try:
+                report_data = json.loads(report_json)
+                if stored_key is not None and stored_key == generator.get_render_key(report_data):
+                    continue
+                plan_key, plan = compute_page_plan(report_data)
+            except Exception as e:
+                logger.warning(f"페이지 배치 계획 백필 실패, 건너뜀 ({specimen_id}): {e}")
+                continue
+
+            cursor = conn.execute(
+                "INSERT OR REPLACE INTO page_plans (specimen_id, plan_key, plan) "
+                "SELECT ?, ?, ? WHERE EXISTS (SELECT 1 FROM reports WHERE specimen_id = ? AND report_data = ?)",
+                (specimen_id, plan_key, plan, specimen_id, report_json)
+            )
+            stored += cursor.rowcount
+            pending += 1
+            if pending >= PAGE_PLAN_BACKFILL_BATCH:
+                conn.commit()
+                pending = 0
+        conn.commit()
+    finally:
+        conn.close()
+
+    if stored:
+        logger.info(f"페이지 배치 계획 {stored}건 백필")
+    return stored
+
+
+def get_page_plan(cursor, specimen_id: str, report_data: dict) -> VariantLayoutPlan:
+    """
+    HTML 보고서용 배치 계획을 반환합니다 (조회 전용, DB에 쓰지 않음).
+
+    - 저장된 계획의 키가 현재 보고서/템플릿과 같으면 그대로 사용
+    - 다르거나 없으면 메모리에서 다시 계산 (저장은 업로드 시에만)
+    - PPT 생성 모듈이 없거나 템플릿/계획 계산이 실패하면 분할 없는 배치로 대체 (HTML 보고서는 항상 표시)
+
+    템플릿 로드와 계획 계산이 포함될 수 있으므로 스레드풀에서 호출합니다.
+    """
+    if generator is None:
+        return unsplit_layout_plan(report_data)
+
+    try:
+        plan_key = generator.get_render_key(report_data)
+        cursor.execute("SELECT plan_key, plan FROM page_plans WHERE specimen_id = ?", (specimen_id,))
+        row = cursor.fetchone()
+        if row is not None and row[0] == plan_key:
+            return VariantLayoutPlan.from_dict(json.loads(row[1]))
+
+        logger.info(f"{specimen_id}: 페이지 배치 계획 계산")
+        return generator.plan_layout(report_data)
+    except Exception as e:
+        logger.warning(f"페이지 배치 계획 계산 실패, 분할 없이 표시 ({specimen_id}): {e}")
+        return unsplit_layout_plan(report_data)
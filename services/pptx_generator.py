@@ -1,13 +1,42 @@
 import copy
+import gc
+import logging
 import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from io import BytesIO
+from types import MappingProxyType
 from lxml import etree
 
-from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE, MSO_ANCHOR
+from pptx.oxml.table import CT_Table
+from pptx.oxml.text import CT_RegularTextRun
 from pptx.oxml.xmlchemy import OxmlElement
-from pptx.util import Pt, Cm
+from pptx.oxml.ns import qn
+from pptx.table import _Cell
+from pptx.text.text import _Run
+from pptx.util import Pt, Cm, Emu
+
+from services.layout_plan import SECTION_START_MARKERS, VARIANT_SECTIONS, VariantLayoutPlan
+from services.package_writer import TemplatePackageWriter, TemplatePartStore
+from services.render_cache import compute_render_key
+from services.render_profiler import RenderProfiler
+from services.text_metrics import text_metrics
+from services.template_cache import TemplateCache
+
+logger = logging.getLogger("app")
+
+# 렌더링 결과에 영향을 주는 코드 변경 시 올려서 렌더 캐시를 무효화
+RENDERER_VERSION = "6"
+
+
+@lru_cache(maxsize=64)
+def _compile_keyword_pattern(keywords: tuple):
+    """강조 키워드 교대 패턴 (긴 키워드 우선이므로 겹치는 키워드는 가장 긴 것으로 매칭)"""
+    ordered = sorted(keywords, key=lambda kw: (-len(kw), kw))
+    return re.compile("|".join(re.escape(kw) for kw in ordered))
 
 
 class PPTReportConfig:
@@ -39,6 +68,24 @@ class PPTReportConfig:
     SPACE_TABLE_BOTTOM = Cm(0.1)  # 테이블 하단 간격
     SPACE_TITLE_BOTTOM = Cm(0.05)  # 제목 하단 간격
 
+    # 높이 설정 (배치 계획과 실제 그리기에서 공유)
+    HEIGHT_MAIN_TITLE = Cm(0.6)  # 메인 섹션 제목
+    HEIGHT_SECTION_HEADER = Cm(0.8)  # 소제목 1줄
+    HEIGHT_HEADER_WRAP_LINE = Cm(0.5)  # 소제목 줄바꿈 1줄당 추가 높이
+    HEADER_CHARS_PER_LINE = 80  # 소제목 한 줄 글자 수 (12pt 맑은 고딕, 17cm 너비 기준 보수적 측정치)
+    HEADER_MAX_WRAP_LINES = 2  # 최대 3줄(기본 1줄 + 추가 2줄)까지만 공간 할당
+    HEIGHT_ORPHAN_GUARD = Cm(2.0)  # 소제목 + 최소 행 공간 (부족하면 섹션 전체를 다음 슬라이드로)
+    HEIGHT_SPLIT_HEADER = Cm(0.8)  # 테이블 분할 계산용 헤더 행 높이
+    HEIGHT_SPLIT_ROW = Cm(0.7)  # 테이블 분할 계산용 데이터 행 높이
+    NEW_SLIDE_TOP = Cm(0.5)  # 추가 슬라이드의 시작 위치
+    NEW_SLIDE_BOTTOM_LIMIT = Cm(24.5)  # 추가 슬라이드는 테두리 끝까지 사용
+
+    # Comment 박스 (줄 수는 글리프 폭으로 측정)
+    COMMENT_BOX_WIDTH = Cm(17.55)
+    COMMENT_BOX_MARGIN = Cm(0.2)
+    COMMENT_FONT_SIZE = Pt(8)
+    COMMENT_WIDTH_FILL = 0.97  # 굵은 글씨/커닝 오차 여유 (텍스트 영역의 97%까지만 채운다고 가정)
+
     # 스타일 프리셋 정의
     STYLES = {
         "clinical": {"color": COLOR_RED, "bold": True},
@@ -47,11 +94,8 @@ class PPTReportConfig:
 
     MARKER_BIOMARKERS = "Other Biomarkers"
 
-    # 섹션 시작점을 찾기 위한 텍스트 매핑
-    SECTION_START_MARKERS = {
-        "clinical": "1. Variants of clinical significance",
-        "unknown": "2. Variants of unknown significance"
-    }
+    # 섹션 시작점을 찾기 위한 텍스트 매핑 (HTML 보고서와 공유, services/layout_plan.py)
+    SECTION_START_MARKERS = SECTION_START_MARKERS
 
     # 고지문 시작 마커
     MARKER_DISCLAIMER = "*본 기관의 유전자 정보 검색"
@@ -68,24 +112,8 @@ class PPTReportConfig:
         "Microsatellite Instability": "msi"
     }
 
-    # 섹션 순서 및 키
-    VARIANT_SECTIONS = [
-        # 1. Clinical Significance
-        {"key": "snv_clinical", "title": "SNVs & Indels", "type": "clinical", "prototype_key": "snv_clinical"},
-        {"key": "fusion_clinical", "title": "Fusion gene", "type": "clinical", "prototype_key": "fusion_clinical"},
-        {"key": "cnv_clinical", "title": "Copy number variation", "type": "clinical", "prototype_key": "cnv_clinical"},
-        {"key": "lr_brca_clinical", "title": "Large rearrangements in BRCA1/2", "type": "clinical",
-         "prototype_key": "lr_brca_clinical"},
-        {"key": "splice_clinical", "title": "Splice variant", "type": "clinical", "prototype_key": "splice_clinical"},
-
-        # 2. Unknown Significance
-        {"key": "snv_unknown", "title": "SNVs & Indels", "type": "unknown", "prototype_key": "snv_clinical"},
-        {"key": "fusion_unknown", "title": "Fusion gene", "type": "unknown", "prototype_key": "fusion_clinical"},
-        {"key": "cnv_unknown", "title": "Copy number variation", "type": "unknown", "prototype_key": "cnv_clinical"},
-        {"key": "lr_brca_unknown", "title": "Large rearrangements in BRCA1/2", "type": "unknown",
-         "prototype_key": "lr_brca_clinical"},
-        {"key": "splice_unknown", "title": "Splice variant", "type": "unknown", "prototype_key": "splice_clinical"}
-    ]
+    # 섹션 순서 및 키 (HTML 보고서와 공유, services/layout_plan.py)
+    VARIANT_SECTIONS = VARIANT_SECTIONS
 
     # 테이블 식별 규칙 (확장성 핵심)
     # required: 반드시 포함되어야 할 헤더 키워드 (OR 조건은 튜플로 묶음)
@@ -122,40 +150,498 @@ class PPTReportConfig:
     REMOVE_KEYWORDS = ["SNVs", "Fusion", "Copy", "Splice", "Rearrangement", "Failed gene"]
 
 
+class RunStyleRegistry:
+    """
+    run 서식(a:rPr) 템플릿 저장소 (프로세스 전체에서 공유).
+    서식 조합마다 python-pptx 속성 setter로 a:rPr를 한 번만 만들어 두고, run에는 복사본만 붙입니다.
+    조합은 속성 값 자체가 키이므로 기존 호출부는 이름 없이 그대로 같은 템플릿을 공유합니다.
+    """
+
+    def __init__(self, font_name):
+        self.font_name = font_name
+        self._rPrs = {}
+
+    def apply(self, run, text, font_size=None, bold=None, italic=None, color=None,
+              proofing_off=False, theme_body=False):
+        """
+        Args:
+            font_size / bold / italic / color: None이면 지정하지 않음 (상속)
+            proofing_off: 맞춤법 검사 끄기 + 한국어(ko-KR) 표시
+            theme_body: Latin/East Asian 글꼴을 테마 본문 폰트(+mn)로 설정
+        """
+        key = (font_size, bold, italic, color, proofing_off, theme_body)
+        rPr = self._rPrs.get(key)
+        if rPr is None:
+            rPr = self._rPrs[key] = self._build(*key)
+
+        r = run._r
+        if r.rPr is not None:
+            r.remove(r.rPr)
+        r.insert(0, copy.deepcopy(rPr))
+        run.text = text
+
+    def _build(self, font_size, bold, italic, color, proofing_off, theme_body):
+        scratch = OxmlElement('a:p')
+        run = _Run(scratch.add_r(), None)
+        font = run.font
+
+        font.name = self.font_name
+        if font_size: font.size = font_size
+        if color: font.color.rgb = color
+        if bold is not None: font.bold = bold
+        if italic is not None: font.italic = italic
+
+        rPr = run._r.get_or_add_rPr()
+        if proofing_off:
+            # 빨간 밑줄(맞춤법 검사) 끄기
+            rPr.set('err', '0')
+            rPr.set('dirty', '0')
+            rPr.set('noProof', '1')
+
+            # lang 속성에 한국어(ko-KR) 명시
+            lang = OxmlElement('a:lang')
+            lang.set('val', 'ko-KR')
+            rPr.append(lang)
+
+        if theme_body:
+            font.name = '+mn-lt'
+            ea = rPr.find(qn('a:ea'))
+            if ea is None:
+                ea = OxmlElement('a:ea')
+                latin = rPr.find(qn('a:latin'))
+                if latin is not None:
+                    latin.addnext(ea)
+                else:
+                    rPr.append(ea)
+            ea.set('typeface', '+mn-ea')
+
+        scratch.remove(run._r)
+        return run._r.rPr
+
+
+run_styles = RunStyleRegistry(PPTReportConfig.FONT_NAME)
+
+
+@dataclass(frozen=True)
+class CompiledLayout:
+    """템플릿 1개에 대한 LayoutAnalyzer 분석 결과 (템플릿이 바뀌지 않는 한 재사용)
+
+    - section_locations: {section_type: {slide_index, slide_id, top, has_title, title_shape_id}}
+    - prototypes: {prototype_key: 테이블 graphicFrame XML} (렌더링 간 공유, 읽기 전용)
+    - table_prototypes: {prototype_key: PreparedTablePrototype} (열 서식 + 행 템플릿)
+    - disclaimer: 고지문 shape XML
+    - remove_targets: 렌더링 시작 시 제거할 (slide_id, shape_id) 목록
+    - slide_bottom_limits: {slide_id: 하단 한계선}
+    - slide_ids: 템플릿 슬라이드 ID (순서대로)
+    - flow_slide_ids: 변이/코멘트 흐름에 속한 템플릿 슬라이드 ID (섹션 시작 또는 제거 대상 shape가 있는 슬라이드)
+    """
+    body_top: int
+    body_bottom: int
+    section_locations: MappingProxyType
+    prototypes: MappingProxyType
+    table_prototypes: MappingProxyType
+    disclaimer: object
+    remove_targets: tuple
+    slide_bottom_limits: MappingProxyType
+    slide_ids: tuple
+    flow_slide_ids: frozenset
+
+
+_A_NS = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+
+
+@dataclass(frozen=True)
+class PreparedTablePrototype:
+    """테이블 프로토타입에서 미리 추출한 서식과 행 템플릿 (템플릿당 1회 계산, 렌더링 간 공유)
+
+    - tblPr / tblGrid: 프로토타입의 표 속성과 열 폭
+    - header_tr: 서식과 헤더 텍스트가 모두 적용된 헤더 행
+    - data_tr: 서식만 적용된 빈 데이터 행 (행마다 한 번 deepcopy)
+    요소들은 읽기 전용으로 취급하며, 슬라이드에는 항상 복사본을 삽입합니다.
+    """
+    col_widths: tuple
+    header_row_height: int
+    data_row_height: int
+    tblPr: object
+    tblGrid: object
+    header_tr: object
+    data_tr: object
+
+    @property
+    def total_width(self) -> int:
+        return sum(self.col_widths)
+
+    @property
+    def num_cols(self) -> int:
+        return len(self.col_widths)
+
+    @classmethod
+    def compile(cls, prototype_xml) -> "PreparedTablePrototype":
+        """프로토타입 graphicFrame XML에서 열 서식을 추출하고, add_table() 기본 행에 적용해 행 템플릿을 만듭니다."""
+        ns = _A_NS
+
+        proto_tbl = prototype_xml.find(f'.//{ns}tbl')
+        proto_tblGrid = proto_tbl.find(f'{ns}tblGrid')
+        proto_tblPr = proto_tbl.find(f'{ns}tblPr')
+        proto_rows = proto_tbl.findall(f'{ns}tr')
+
+        col_widths = tuple(int(gc.get('w')) for gc in proto_tblGrid.findall(f'{ns}gridCol'))
+        header_row_height = int(proto_rows[0].get('h', '258360'))
+        data_row_height = int(proto_rows[1].get('h', '258360')) if len(proto_rows) > 1 else header_row_height
+
+        # 헤더/데이터 행의 셀 서식 추출 (tcPr, pPr, endParaRPr, bodyPr)
+        def _extract_cell_formats(tr):
+            tcPrs, pPrs, endParaRPrs, bodyPrs = [], [], [], []
+            for tc in tr.findall(f'{ns}tc'):
+                tcPrs.append(tc.find(f'{ns}tcPr'))
+                txBody = tc.find(f'{ns}txBody')
+                if txBody is not None:
+                    bodyPrs.append(txBody.find(f'{ns}bodyPr'))
+                    p = txBody.find(f'{ns}p')
+                    pPrs.append(p.find(f'{ns}pPr') if p is not None else None)
+                    endParaRPrs.append(p.find(f'{ns}endParaRPr') if p is not None else None)
+                else:
+                    bodyPrs.append(None)
+                    pPrs.append(None)
+                    endParaRPrs.append(None)
+            return tcPrs, pPrs, endParaRPrs, bodyPrs
+
+        header_formats = _extract_cell_formats(proto_rows[0])
+        data_formats = _extract_cell_formats(proto_rows[1]) if len(proto_rows) > 1 else ([], [], [], [])
+
+        # 헤더 행의 run properties 및 텍스트 추출
+        header_rPrs, header_texts = [], []
+        for tc in proto_rows[0].findall(f'{ns}tc'):
+            txBody = tc.find(f'{ns}txBody')
+            p = txBody.find(f'{ns}p') if txBody is not None else None
+            r = p.find(f'{ns}r') if p is not None else None
+            header_rPrs.append(r.find(f'{ns}rPr') if r is not None else None)
+
+            text = ''
+            if txBody is not None:
+                for p in txBody.findall(f'{ns}p'):
+                    for r in p.findall(f'{ns}r'):
+                        t = r.find(f'{ns}t')
+                        if t is not None and t.text:
+                            text += t.text
+            header_texts.append(text)
+
+        # add_table()이 만드는 것과 같은 기본 행 2개(헤더/데이터)에 서식 적용
+        scratch_tbl = CT_Table.new_tbl(2, len(col_widths), sum(col_widths), Cm(1.6))
+        header_tr, data_tr = scratch_tbl.findall(f'{ns}tr')
+        cls._apply_row_formats(header_tr, header_row_height, *header_formats)
+        cls._apply_row_formats(data_tr, data_row_height, *data_formats)
+
+        # 헤더 텍스트 채우기 (프로토타입의 rPr 사용)
+        for c_idx, tc in enumerate(header_tr.findall(f'{ns}tc')):
+            if c_idx >= len(header_texts):
+                break
+            p = tc.find(f'{ns}txBody').find(f'{ns}p')
+
+            # 기존 run 제거
+            for r in list(p.findall(f'{ns}r')):
+                p.remove(r)
+
+            # 새 run 생성 (endParaRPr 앞에 삽입하여 OOXML 순서 준수)
+            new_r = etree.Element(f'{ns}r')
+            endParaRPr = p.find(f'{ns}endParaRPr')
+            if endParaRPr is not None:
+                endParaRPr.addprevious(new_r)
+            else:
+                p.append(new_r)
+
+            if header_rPrs[c_idx] is not None:
+                new_r.append(copy.deepcopy(header_rPrs[c_idx]))
+            else:
+                rPr = etree.SubElement(new_r, f'{ns}rPr')
+                rPr.set('lang', 'en-US')
+                rPr.set('sz', '800')
+                rPr.set('b', '1')
+
+            new_t = etree.SubElement(new_r, f'{ns}t')
+            new_t.text = header_texts[c_idx]
+
+        return cls(
+            col_widths=col_widths,
+            header_row_height=header_row_height,
+            data_row_height=data_row_height,
+            tblPr=copy.deepcopy(proto_tblPr),
+            tblGrid=copy.deepcopy(proto_tblGrid),
+            header_tr=header_tr,
+            data_tr=data_tr,
+        )
+
+    @staticmethod
+    def _apply_row_formats(tr, row_height, tcPr_list, pPr_list, endParaRPr_list, bodyPr_list):
+        """행의 각 셀에 프로토타입 서식(tcPr, bodyPr, pPr, endParaRPr)을 적용"""
+        ns = _A_NS
+        tr.set('h', str(row_height))
+
+        for col_idx, tc in enumerate(tr.findall(f'{ns}tc')):
+            if col_idx >= len(tcPr_list):
+                break
+
+            # tcPr 교체
+            old_tcPr = tc.find(f'{ns}tcPr')
+            if tcPr_list[col_idx] is not None:
+                new_tcPr = copy.deepcopy(tcPr_list[col_idx])
+                if old_tcPr is not None:
+                    tc.replace(old_tcPr, new_tcPr)
+                else:
+                    tc.insert(0, new_tcPr)
+
+            # txBody 내부 서식 적용
+            txBody = tc.find(f'{ns}txBody')
+            if txBody is not None:
+                # bodyPr 교체
+                old_bodyPr = txBody.find(f'{ns}bodyPr')
+                if col_idx < len(bodyPr_list) and bodyPr_list[col_idx] is not None:
+                    if old_bodyPr is not None:
+                        txBody.replace(old_bodyPr, copy.deepcopy(bodyPr_list[col_idx]))
+
+                # 각 p 요소의 pPr, endParaRPr 교체
+                for p in txBody.findall(f'{ns}p'):
+                    if col_idx < len(pPr_list) and pPr_list[col_idx] is not None:
+                        old_pPr = p.find(f'{ns}pPr')
+                        new_pPr = copy.deepcopy(pPr_list[col_idx])
+                        if old_pPr is not None:
+                            p.replace(old_pPr, new_pPr)
+                        else:
+                            p.insert(0, new_pPr)
+
+                    if col_idx < len(endParaRPr_list) and endParaRPr_list[col_idx] is not None:
+                        old_endParaRPr = p.find(f'{ns}endParaRPr')
+                        new_endParaRPr = copy.deepcopy(endParaRPr_list[col_idx])
+                        if old_endParaRPr is not None:
+                            p.replace(old_endParaRPr, new_endParaRPr)
+                        else:
+                            p.append(new_endParaRPr)
+
+
+@dataclass(frozen=True)
+class TemplateAnchors:
+    """템플릿 1개의 값 채우기 위치 (템플릿당 1회 계산, 렌더링 시 shape/셀 주소로 바로 조회)
+
+    - clinical_cells: {PPT 라벨: (shape_id, row, col)} 1번 슬라이드 검체 정보 표에서 라벨 바로 아래 셀
+    - diagnostic: (slide_index, shape_id, paragraph_index) '검사기기' 문단
+    - drna_frames: ((shape_id, row, col), ...) 4번 슬라이드 DNA/RNA 농도 텍스트 (텍스트 상자는 row/col이 None)
+    - footer_slide_id: Footer 정보(Tested by 등)를 채울 마지막 템플릿 슬라이드
+    - footer_texts: ((shape_id, 'Tested by:' 등), ...) shape 순서대로
+    - receipt_cells: ((shape_id, row, col), ...) 분자 접수 번호 값 셀
+    - filled_slide_ids: 값을 채우는 템플릿 슬라이드 (1번, 검사기기, 4번 QC, Footer)
+    """
+    clinical_cells: MappingProxyType
+    diagnostic: tuple
+    drna_frames: tuple
+    footer_slide_id: int
+    footer_texts: tuple
+    receipt_cells: tuple
+    filled_slide_ids: frozenset
+
+    DRNA_LABELS = ("DNA (ng/ul)", "RNA (ng/ul)")
+    FOOTER_KEYS = ("Tested by:", "Analyzed by:", "Signed by:")
+    RECEIPT_LABELS = ("분자 접수 번호", "분자접수번호")
+
+    @classmethod
+    def compile(cls, prs) -> "TemplateAnchors":
+        """
+        템플릿을 한 번 훑어 각 필드의 위치를 찾습니다 (prs는 수정하지 않음).
+        찾지 못한 필드가 있으면 렌더링 시점이 아니라 템플릿 로드 시점에 ValueError를 발생시킵니다.
+        """
+        slides = list(prs.slides)
+        missing = []
+
+        # 1. 검체 정보: 라벨(공백 무시, 부분 일치)이 있는 셀의 바로 아래 셀 (표/행/열 순서로 첫 번째)
+        clinical_cells = {}
+        tables = [shape for shape in slides[0].shapes if shape.has_table] if slides else []
+        cell_texts = [
+            (shape.shape_id, r_idx, c_idx, cell.text_frame.text.replace(" ", "").lower(), len(shape.table.rows))
+            for shape in tables
+            for r_idx, row in enumerate(shape.table.rows)
+            for c_idx, cell in enumerate(row.cells)
+        ]
+        for ppt_label in PPTReportConfig.CLINICAL_INFO_MAPPING:
+            clean_label = ppt_label.replace(" ", "").lower()
+            address = next(
+                ((shape_id, r_idx + 1, c_idx) for shape_id, r_idx, c_idx, text, n_rows in cell_texts
+                 if clean_label in text and r_idx + 1 < n_rows),
+                None
+            )
+            if address is None:
+                missing.append(f"검체 정보 '{ppt_label}'")
+            else:
+                clinical_cells[ppt_label] = address
+
+        # 2. 검사기기: 모든 슬라이드에서 '검사기기'가 들어간 첫 문단
+        diagnostic = next(
+            ((slide_idx, shape.shape_id, p_idx)
+             for slide_idx, slide in enumerate(slides)
+             for shape in slide.shapes if shape.has_text_frame
+             for p_idx, p in enumerate(shape.text_frame.paragraphs) if "검사기기" in p.text),
+            None
+        )
+        if diagnostic is None:
+            missing.append("검사기기")
+
+        # 3. DNA/RNA 농도: 4번 슬라이드의 텍스트 상자/표 셀
+        drna_frames = []
+        for shape in (slides[3].shapes if len(slides) > 3 else ()):
+            if shape.has_text_frame and any(t in shape.text_frame.text for t in cls.DRNA_LABELS):
+                drna_frames.append((shape.shape_id, None, None))
+            if shape.has_table:
+                for r_idx, row in enumerate(shape.table.rows):
+                    for c_idx, cell in enumerate(row.cells):
+                        if any(t in cell.text_frame.text for t in cls.DRNA_LABELS):
+                            drna_frames.append((shape.shape_id, r_idx, c_idx))
+        if len(slides) > 3 and not drna_frames:
+            missing.append("DNA/RNA (ng/ul)")
+
+        # 4. Footer: 마지막 슬라이드의 Tested/Analyzed/Signed by 텍스트 상자와 분자 접수 번호 표
+        footer_texts, receipt_cells = [], []
+        for shape in (slides[-1].shapes if slides else ()):
+            if shape.has_text_frame:
+                text = shape.text_frame.text.strip()
+                footer_texts.extend((shape.shape_id, key) for key in cls.FOOTER_KEYS if key in text)
+            elif shape.has_table:
+                row0 = shape.table.rows[0].cells if len(shape.table.rows) > 0 else []
+                if len(row0) > 1 and any(label in row0[0].text_frame.text.strip() for label in cls.RECEIPT_LABELS):
+                    receipt_cells.append((shape.shape_id, 0, 1))
+        found_keys = {key for _, key in footer_texts}
+        missing.extend(f"Footer '{key}'" for key in cls.FOOTER_KEYS if key not in found_keys)
+        if not receipt_cells:
+            missing.append("분자 접수 번호")
+
+        if missing:
+            raise ValueError(f"템플릿에서 채울 위치를 찾지 못했습니다: {', '.join(missing)}")
+
+        return cls(
+            clinical_cells=MappingProxyType(clinical_cells),
+            diagnostic=diagnostic,
+            drna_frames=tuple(drna_frames),
+            footer_slide_id=slides[-1].slide_id,
+            footer_texts=tuple(footer_texts),
+            receipt_cells=tuple(receipt_cells),
+            filled_slide_ids=frozenset(
+                slides[index].slide_id for index in (0, diagnostic[0], 3, len(slides) - 1) if index < len(slides)
+            ),
+        )
+
+    @staticmethod
+    def text_frame(shapes_by_id, shape_id, row=None, col=None):
+        """주소(shape_id, row, col)의 text_frame (row가 None이면 shape 자체의 text_frame)"""
+        shape = shapes_by_id[shape_id]
+        if row is None:
+            return shape.text_frame
+        return shape.table.cell(row, col).text_frame
+
+
+def _shapes_by_id(slide):
+    return {shape.shape_id: shape for shape in slide.shapes}
+
+
 class LayoutAnalyzer:
-    def __init__(self, prs):
+    def __init__(self, prs, compiled: CompiledLayout = None):
         self.prs = prs
         self.page_width = prs.slide_width
         self.page_height = prs.slide_height
         self.config = PPTReportConfig()
 
+        # 사전 컴파일된 결과가 없으면 현재 프레젠테이션을 직접 분석
+        if compiled is None:
+            compiled = self.compile(prs)
+        self._apply(compiled)
+
+    @classmethod
+    def compile(cls, prs) -> CompiledLayout:
+        """
+        템플릿의 모든 슬라이드를 순회하여 섹션 마커, 테이블 프로토타입, 고지문,
+        슬라이드별 하단 한계선, 제거 대상 shape를 찾아 CompiledLayout으로 반환합니다.
+        (prs는 수정하지 않음)
+        """
+        state = {
+            "config": PPTReportConfig(),
+            "page_height": prs.slide_height,
+            "body_top": PPTReportConfig.BODY_TOP_START,
+            "body_bottom": PPTReportConfig.BODY_BOTTOM_LIMIT,
+            "section_locations": {},
+            "prototypes": {},
+            "disclaimer": None,
+            "remove_targets": [],
+            "slide_bottom_limits": {},
+        }
+        for slide_idx, slide in enumerate(prs.slides):
+            cls._analyze_single_slide(state, slide, slide_idx)
+
+        return CompiledLayout(
+            body_top=state["body_top"],
+            body_bottom=state["body_bottom"],
+            section_locations=MappingProxyType(
+                {k: MappingProxyType(v) for k, v in state["section_locations"].items()}
+            ),
+            prototypes=MappingProxyType(state["prototypes"]),
+            table_prototypes=MappingProxyType(
+                {k: PreparedTablePrototype.compile(v) for k, v in state["prototypes"].items()}
+            ),
+            disclaimer=state["disclaimer"],
+            remove_targets=tuple(state["remove_targets"]),
+            slide_bottom_limits=MappingProxyType(state["slide_bottom_limits"]),
+            slide_ids=tuple(slide.slide_id for slide in prs.slides),
+            flow_slide_ids=frozenset(
+                {loc["slide_id"] for loc in state["section_locations"].values()}
+                | {slide_id for slide_id, _ in state["remove_targets"]}
+            ),
+        )
+
+    def _apply(self, compiled: CompiledLayout):
+        """컴파일된 분석 결과를 현재 프레젠테이션(템플릿 복제본)에 적용"""
+        self.compiled = compiled
+
         # 위치 초기화
-        self.body_top = self.config.BODY_TOP_START
-        self.body_bottom = self.config.BODY_BOTTOM_LIMIT
+        self.body_top = compiled.body_top
+        self.body_bottom = compiled.body_bottom
 
-        # 슬라이드별 하단 제한선 저장소 {slide_index: bottom_limit}
-        self.slide_bottom_limits = {}
+        # 슬라이드별 하단 제한선 저장소 {slide_id: bottom_limit} (새 슬라이드 추가 시 갱신되므로 복사)
+        self.slide_bottom_limits = dict(compiled.slide_bottom_limits)
 
         self.existing_elements = {
-            "prototypes": {},
-            "disclaimer": None  # 고지문 요소 저장용
+            "prototypes": compiled.prototypes,
+            "table_prototypes": compiled.table_prototypes,
+            "disclaimer": compiled.disclaimer  # 고지문 요소 저장용
         }
 
-        # 섹션별 시작 위치 저장소
+        slides_by_id = {slide.slide_id: slide for slide in self.prs.slides}
+        shape_cache = {}
+
+        def _find_shape(slide_id, shape_id):
+            if slide_id not in shape_cache:
+                slide = slides_by_id.get(slide_id)
+                shape_cache[slide_id] = {sh.shape_id: sh for sh in slide.shapes} if slide else {}
+            return shape_cache[slide_id].get(shape_id)
+
+        # 섹션별 시작 위치 저장소 (title_shape는 이 프레젠테이션의 shape로 연결)
         self.section_locations = {}
-        self.slide_bottom_limits = {}
-        self._analyze_all_slides()
+        for section_type, loc in compiled.section_locations.items():
+            resolved = dict(loc)
+            resolved["title_shape"] = _find_shape(loc["slide_id"], loc["title_shape_id"])
+            self.section_locations[section_type] = resolved
 
-    def _analyze_all_slides(self):
-        for slide_idx, slide in enumerate(self.prs.slides):
-            self._analyze_single_slide(slide, slide_idx)
+        # 추출된 요소 제거
+        for slide_id, shape_id in compiled.remove_targets:
+            shape = _find_shape(slide_id, shape_id)
+            if shape is None:
+                continue
+            sp = shape._element
+            if sp.getparent() is not None:
+                sp.getparent().remove(sp)
 
-    def _analyze_single_slide(self, slide, slide_idx):
-        shapes_to_remove = []
+    @classmethod
+    def _analyze_single_slide(cls, state, slide, slide_idx):
+        config = state["config"]
         found_section_on_this_slide = False
+        shapes_to_remove = []
 
-        # 이 슬라이드에서 사용할 하단 한계선 초기화 (기본값: 전역 설정 18cm)
-        current_slide_limit = self.config.BODY_BOTTOM_LIMIT
+        # 이 슬라이드에서 사용할 하단 한계선 초기화 (기본값: 전역 설정)
+        current_slide_limit = config.BODY_BOTTOM_LIMIT
 
         # 1. 텍스트 분석 (섹션 마커 및 Footer)
         for shape in slide.shapes:
@@ -171,44 +657,44 @@ class LayoutAnalyzer:
                         current_slide_limit = limit
 
                 # 섹션 시작 마커 찾기
-                for section_type, marker in self.config.SECTION_START_MARKERS.items():
+                for section_type, marker in config.SECTION_START_MARKERS.items():
                     if marker in text:
-                        self.section_locations[section_type] = {
+                        state["section_locations"][section_type] = {
                             "slide_index": slide_idx,
                             "slide_id": slide.slide_id,
-                            "top": shape.top + shape.height + self.config.SPACE_TITLE_BOTTOM,
+                            "top": shape.top + shape.height + config.SPACE_TITLE_BOTTOM,
                             "has_title": True,
-                            "title_shape": shape  # 제거를 위해 shape 참조 저장
+                            "title_shape_id": shape.shape_id  # 제거를 위해 shape id 저장
                         }
                         found_section_on_this_slide = True
 
                         # Clinical 섹션인 경우 기본 시작점 업데이트
                         if section_type == "clinical":
-                            self.body_top = self.section_locations[section_type]["top"]
+                            state["body_top"] = state["section_locations"][section_type]["top"]
 
                 # Footer 위치 파악 (전역 설정도 업데이트)
                 if "검사기관" in text or "세브란스병원" in text:
-                    if shape.top < self.page_height:
+                    if shape.top < state["page_height"]:
                         limit = shape.top - Cm(0.5)
                         if limit < current_slide_limit:
                             current_slide_limit = limit
                         # 하위 호환성을 위해 전역 변수도 업데이트
-                        self.body_bottom = current_slide_limit
+                        state["body_bottom"] = current_slide_limit
 
                 # 소제목 삭제 대상 수집
                 if found_section_on_this_slide:
                     text_lower = text.lower()
-                    is_remove_target = any(k.lower() in text_lower for k in self.config.REMOVE_KEYWORDS)
+                    is_remove_target = any(k.lower() in text_lower for k in config.REMOVE_KEYWORDS)
                     if is_remove_target:
-                        shapes_to_remove.append(shape)
-                
+                        shapes_to_remove.append(shape.shape_id)
+
                 # 고지문(Disclaimer) 감지 -> 저장 후 제거 (나중에 동적으로 다시 그림)
-                if text.startswith(self.config.MARKER_DISCLAIMER):
-                    self.existing_elements['disclaimer'] = copy.deepcopy(shape.element)
-                    shapes_to_remove.append(shape)
+                if text.startswith(config.MARKER_DISCLAIMER):
+                    state["disclaimer"] = copy.deepcopy(shape.element)
+                    shapes_to_remove.append(shape.shape_id)
 
         # 분석된 슬라이드의 한계선을 ID 기반으로 저장
-        self.slide_bottom_limits[slide.slide_id] = current_slide_limit
+        state["slide_bottom_limits"][slide.slide_id] = current_slide_limit
 
         # 2. 테이블 요소 분석 및 프로토타입 추출
         for shape in slide.shapes:
@@ -219,29 +705,24 @@ class LayoutAnalyzer:
                         headers = [cell.text_frame.text.strip().upper() for cell in tbl.rows[0].cells]
                         header_str = " ".join(headers)
 
-                        target_key = self._identify_table_type(header_str)
+                        target_key = cls._identify_table_type(header_str)
 
                         if target_key:
-                            if target_key not in self.existing_elements['prototypes']:
-                                self.existing_elements['prototypes'][target_key] = copy.deepcopy(shape.element)
+                            if target_key not in state["prototypes"]:
+                                state["prototypes"][target_key] = copy.deepcopy(shape.element)
 
                             if found_section_on_this_slide:
-                                shapes_to_remove.append(shape)
+                                shapes_to_remove.append(shape.shape_id)
 
                 except Exception as e:
-                    print(f"Table analysis warning: {e}")
+                    logger.warning(f"Table analysis warning: {e}")
 
-        # 추출된 요소 제거
-        for shape in shapes_to_remove:
-            try:
-                sp = shape._element
-                sp.getparent().remove(sp)
-            except ValueError:
-                pass
+        state["remove_targets"].extend((slide.slide_id, shape_id) for shape_id in shapes_to_remove)
 
-    def _identify_table_type(self, header_str: str) -> str:
+    @staticmethod
+    def _identify_table_type(header_str: str) -> str:
         """Config 규칙에 따라 테이블 타입을 식별하는 헬퍼 메서드"""
-        for rule in self.config.TABLE_IDENTIFICATION_RULES:
+        for rule in PPTReportConfig.TABLE_IDENTIFICATION_RULES:
             # Required 조건 체크 (모든 조건 만족해야 함)
             is_match = True
             for req in rule["required"]:
@@ -283,10 +764,26 @@ class LayoutContext:
             self.top = analyzer.body_top
 
         self.current_slide = prs.slides[self.current_slide_index]
+        self.inserted_slides = 0  # 새로 삽입한 슬라이드 수 (배치 계획과 실제 그리기 비교용)
         self.margin = analyzer.config.MARGIN_LEFT_L3 # Default for content/tables
         self.width = analyzer.config.DEFAULT_WIDTH
         self.config = analyzer.config
 
+        # 슬라이드 ID -> 슬라이드 인덱스 (슬라이드가 늘어나도 조회/삽입 비용이 커지지 않도록 유지)
+        self._slides_by_id = {slide.slide_id: slide for slide in prs.slides}
+
+        # 이 레이아웃이 내용을 그리는 슬라이드 {slide_id: sldId 요소}
+        # (흐름에 속한 템플릿 슬라이드 + 새로 만든 슬라이드만 빈 슬라이드 정리 대상, 정적 슬라이드는 제외)
+        flow_slide_ids = analyzer.compiled.flow_slide_ids
+        self.flow_slides = {
+            sld_id.id: sld_id for sld_id in prs.slides._sldIdLst.sldId_lst if sld_id.id in flow_slide_ids
+        }
+        self._blank_layout = prs.slide_layouts[6 if len(prs.slide_layouts) > 6 else -1]
+
+        # [테두리 복사] 템플릿의 2번째 슬라이드(인덱스 1)의 배경/테두리 도형을 미리 골라둠
+        # (템플릿이 1장뿐이면 복사할 도형 없음)
+        self._style_elements = self._collect_template_style(prs.slides[1]) if len(prs.slides) > 1 else ()
+
     @property
     def bottom_limit(self):
         """현재 보고 있는 슬라이드의 하단 한계선을 동적으로 가져옴"""
@@ -313,44 +810,45 @@ class LayoutContext:
             self.add_new_slide()
 
     def add_new_slide(self):
-        # 1. 새 슬라이드 생성 (기본적으로 맨 뒤에 추가됨)
-        layout_idx = 6 if len(self.prs.slide_layouts) > 6 else -1
-        blank_layout = self.prs.slide_layouts[layout_idx]
-        new_slide = self.prs.slides.add_slide(blank_layout)
-
-        # [테두리 복사] 템플릿의 2번째 슬라이드(인덱스 1)에서 배경/테두리 스타일 복사
-        if len(self.prs.slides) > 1:
-            reference_slide = self.prs.slides[1]
-            self._copy_template_style(new_slide, reference_slide)
-        
-        # [공간 확장] 새로 생성된 슬라이드는 테두리 끝까지 쓸 수 있도록 하단 한계선을 24.5cm로 확장
-        self.analyzer.slide_bottom_limits[new_slide.slide_id] = Cm(24.5)
-
-        # 2. 목표 인덱스 계산 (현재 + 1)
+        # 1. 현재 슬라이드 바로 뒤에 새 슬라이드 삽입
         target_index = self.current_slide_index + 1
+        self.current_slide = self.insert_slide(target_index)
 
-        # 3. 목표가 맨 뒤가 아니라면 슬라이드 이동
-        if target_index < len(self.prs.slides) - 1:
-            xml_slides = self.prs.slides._sldIdLst
-            slides = list(xml_slides)
-            xml_slides.remove(slides[-1])  # 마지막(방금 추가한 것) 제거
-            xml_slides.insert(target_index, slides[-1])  # 목표 위치에 삽입
-            
-            # 새 위치에서 슬라이드 객체 다시 가져오기
-            self.current_slide = self.prs.slides[target_index]
-        else:
-            self.current_slide = new_slide
-
-        # 4. 트래킹 정보 업데이트
+        # 2. 트래킹 정보 업데이트
         self.current_slide_index = target_index
-        self.top = Cm(0.5)
+        self.top = self.config.NEW_SLIDE_TOP
 
         # [Repeat Main Header] 새 슬라이드에서도 메인 섹션 제목 그리기
         if self.current_main_title and self.generator:
             self.generator._draw_main_section_title(self, self.current_main_title)
 
-    def _copy_template_style(self, target_slide, source_slide):
-        """소스 슬라이드에서 배경이나 테두리 같은 정적 도형을 복사"""
+    def insert_slide(self, index):
+        """
+        빈 슬라이드를 index 위치에 삽입하고 반환합니다 (템플릿 테두리 복사, 하단 한계선 확장 포함).
+        sldIdLst를 복사하지 않고 새 sldId 요소만 목표 위치로 옮깁니다.
+        """
+        slides = self.prs.slides
+        new_slide = slides.add_slide(self._blank_layout)
+        sld_id_lst = slides._sldIdLst
+        new_sld_id = sld_id_lst[-1]
+        if index < len(sld_id_lst) - 1:
+            sld_id_lst.insert(index, new_sld_id)  # lxml insert는 요소를 이동시킴
+
+        spTree = new_slide.shapes._spTree
+        for el in self._style_elements:
+            spTree.append(copy.deepcopy(el))
+
+        # [공간 확장] 새로 생성된 슬라이드는 테두리 끝까지 쓸 수 있도록 하단 한계선을 24.5cm로 확장
+        self.analyzer.slide_bottom_limits[new_slide.slide_id] = self.config.NEW_SLIDE_BOTTOM_LIMIT
+        self._slides_by_id[new_slide.slide_id] = new_slide
+        self.flow_slides[new_slide.slide_id] = new_sld_id
+        self.inserted_slides += 1
+        return new_slide
+
+    @staticmethod
+    def _collect_template_style(source_slide):
+        """소스 슬라이드에서 새 슬라이드로 복사할 배경이나 테두리 같은 정적 도형 요소를 고릅니다."""
+        elements = []
         for shape in source_slide.shapes:
             # 텍스트나 테이블이 아닌, 오토쉐이프(도형)나 그림만 복사 대상
             # (테두리는 보통 직사각형 도형으로 구현됨)
@@ -360,24 +858,91 @@ class LayoutContext:
                 # 우선 텍스트가 없는 도형을 복사하는 것으로 단순화
                 if not shape.has_table:
                      if not shape.has_text_frame or not shape.text_frame.text.strip():
-                         new_el = copy.deepcopy(shape.element)
-                         target_slide.shapes._spTree.append(new_el)
+                         # 이후 원본 슬라이드가 수정되어도 영향받지 않도록 복제본 보관
+                         elements.append(copy.deepcopy(shape.element))
+        return tuple(elements)
 
     def add_space(self, height):
         self.top += height
 
     def _find_slide_by_id(self, slide_id):
-        for slide in self.prs.slides:
-            if slide.slide_id == slide_id:
-                return slide
-        return None
+        return self._slides_by_id.get(slide_id)
+
+
+class _LayoutCursor:
+    """LayoutContext의 위치 계산만 따라 하는 배치 계획용 커서 (프레젠테이션을 수정하지 않음)"""
+
+    def __init__(self, compiled: CompiledLayout, config: PPTReportConfig):
+        self.compiled = compiled
+        self.config = config
+        self.steps = []
+        self.new_slides = 0
+        self.main_title = None
+
+        start_loc = compiled.section_locations.get("clinical")
+        if start_loc:
+            self.slide_index = start_loc["slide_index"]
+            self.top = start_loc["top"]
+        else:
+            self.slide_index = 0
+            self.top = compiled.body_top
+        self.slide_id = compiled.slide_ids[self.slide_index]
+        self.bottom_limit = self._template_bottom(self.slide_id)
+
+    def _template_bottom(self, slide_id):
+        return self.compiled.slide_bottom_limits.get(slide_id, self.config.BODY_BOTTOM_LIMIT)
+
+    def move_to_section(self, section_type):
+        loc = self.compiled.section_locations[section_type]
+        self.steps.append(("move_to_section", section_type))
+        self.slide_index = loc["slide_index"]
+        self.slide_id = loc["slide_id"]
+        self.top = loc["top"]
+        self.bottom_limit = self._template_bottom(self.slide_id)
+
+    def check_space(self, height):
+        if self.top + height > self.bottom_limit:
+            self.add_new_slide()
+
+    def add_new_slide(self):
+        self.steps.append(("new_slide",))
+        self.new_slides += 1
+        self.slide_index += 1
+        self.slide_id = None  # 새 슬라이드는 템플릿 앵커와 일치하지 않음
+        self.top = self.config.NEW_SLIDE_TOP
+        self.bottom_limit = self.config.NEW_SLIDE_BOTTOM_LIMIT
+        if self.main_title:
+            self.add_main_title(self.main_title, record=False)
+
+    def add_main_title(self, text, record=True):
+        self.check_space(self.config.HEIGHT_MAIN_TITLE)
+        if record:
+            self.steps.append(("main_title", text))
+        self.top += self.config.HEIGHT_MAIN_TITLE + self.config.SPACE_TITLE_BOTTOM
+
+    def add_section_header(self, title, height, highlight=None, is_none=False, is_clinical=True):
+        """소제목 단계를 추가하고 그 위치(steps 인덱스)를 반환 (페이지 번호를 나중에 채우기 위함)"""
+        self.check_space(self.config.HEIGHT_SECTION_HEADER)
+        self.steps.append(("section_header", title, highlight, is_none, is_clinical))
+        self.top += height
+        return len(self.steps) - 1
+
+    def add(self, step, height):
+        self.steps.append(step)
+        self.top += height
+
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 class NGS_PPT_Generator:
     def __init__(self):
-        self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.template_dir = os.path.join(self.base_dir, "resources")
+        self.base_dir = _BASE_DIR
+        self.template_dir = template_cache.template_dir
+        self.template_cache = template_cache
         self.config = PPTReportConfig()  # 설정 인스턴스
+        # 저장 시 재사용하는 템플릿 파트가 실제로 바뀌지 않았는지 검사 (TemplatePackageWriter.save의 verify)
+        self.verify_reused_parts = False
 
     def _set_cell_border(self, cell, border_color="000000", border_width='12700'):
         tc = cell._tc
@@ -396,12 +961,14 @@ class NGS_PPT_Generator:
             tcPr.append(ln)
         return cell
 
-    def _fix_theme_font_distinction(self, prs):
+    @staticmethod
+    def _fix_theme_font_distinction(prs):
         """테마의 majorFont와 minorFont가 동일할 경우, majorFont를 변경하여
         PowerPoint UI에서 '+본문'/'+제목' 구분이 정상 작동하도록 함.
         동시에 기존 슬라이드에서 +mj-lt/+mj-ea 참조를 명시적 폰트명으로 변환.
 
-        [개선] 패키지 내 모든 theme 파트를 처리하고, endParaRPr/테이블 셀 포함."""
+        [개선] 패키지 내 모든 theme 파트를 처리하고, endParaRPr/테이블 셀 포함.
+        결과는 템플릿에만 의존하므로 템플릿 캐시 로드 시 원본에 한 번만 적용됨."""
         ns = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
 
         # 1. 패키지 내 모든 theme 파트 수집
@@ -522,125 +1089,188 @@ class NGS_PPT_Generator:
                 theme_xml, xml_declaration=True, encoding='UTF-8', standalone=True
             )
 
-    def generate(self, report_data: dict) -> BytesIO:
+    def _compile_layout(self, prs) -> CompiledLayout:
+        """템플릿 복제본(테마 폰트 보정 완료)으로 LayoutAnalyzer 결과를 미리 계산"""
+        return LayoutAnalyzer.compile(prs)
+
+    def _compile_anchors(self, prs) -> TemplateAnchors:
+        """템플릿 복제본에서 값 채우기 위치(검체 정보/검사기기/DNA·RNA/Footer)를 미리 계산"""
+        return TemplateAnchors.compile(prs)
+
+    def _template_part_store(self, entry) -> TemplatePartStore:
+        """
+        템플릿에서 렌더링 중 바뀌지 않는 파트(정적 슬라이드, 이미지, 레이아웃/마스터, 테마 등)의 압축 엔트리.
+        레이아웃이 내용을 그리는 흐름 슬라이드와 값을 채우는 슬라이드는 저장할 때마다 다시 직렬화합니다.
+        새로운 채우기 단계가 다른 슬라이드/파트를 수정하면 여기(anchors.filled_slide_ids 등)에 추가해야 하며,
+        빠뜨리면 verify_reused_parts 검사(벤치마크에서 항상 실행)가 실패합니다.
+        """
+        compiled_layout = self.template_cache.compiled(entry, "layout", self._compile_layout)
+        anchors = self.template_cache.compiled(entry, "anchors", self._compile_anchors)
+        mutable_slide_ids = compiled_layout.flow_slide_ids | anchors.filled_slide_ids
+        return self.template_cache.compiled(
+            entry, "parts", lambda prs: TemplatePartStore(prs, mutable_slide_ids), read_only=True
+        )
+
+    def preload(self):
+        """보고서 템플릿을 모두 미리 로드하고 레이아웃을 컴파일합니다 (렌더 워커 예열용)."""
+        for template_name in sorted(os.listdir(self.template_dir)):
+            if template_name.startswith("NGS_") and template_name.endswith(".pptx"):
+                entry = self.template_cache.entry(template_name)
+                self._template_part_store(entry)
+
+    def get_template_name(self, report_data: dict) -> str:
         panel_type = report_data.get('panel_type', 'GE')
+        v2_suffix = "_v2" if report_data.get('is_v2', False) else ""
+        return f"NGS_{panel_type}_report_baseline{v2_suffix}.pptx"
+
+    def get_render_key(self, report_data: dict) -> str:
+        """보고서 데이터 + 템플릿 버전 + 렌더러 버전으로 만든 렌더 캐시 키"""
+        template_version = self.template_cache.version(self.get_template_name(report_data))
+        return compute_render_key(report_data, template_version, RENDERER_VERSION)
+
+    def plan_layout(self, report_data: dict) -> VariantLayoutPlan:
+        """변이 섹션 배치 계획 (렌더링 없이 템플릿 레이아웃만 사용, HTML 보고서와 공유)"""
+        entry = self.template_cache.entry(self.get_template_name(report_data))
+        compiled_layout = self.template_cache.compiled(entry, "layout", self._compile_layout)
+        return self._plan_variant_sections(report_data, compiled_layout)
+
+    def generate(self, report_data: dict, layout_plan: VariantLayoutPlan = None,
+                 profiler: RenderProfiler = None, output=None):
+        """
+        Args:
+            layout_plan: 미리 계산(저장)된 배치 계획. 없으면 렌더링 중에 계산합니다.
+            profiler: 단계별 소요 시간을 기록할 RenderProfiler (없으면 기록하지 않음)
+            output: PPTX를 기록할 쓰기 가능한 바이너리 파일 객체. 없으면 BytesIO에 저장합니다.
+                    (파일을 넘기면 zip 엔트리가 파트 단위로 바로 기록되어 덱 전체를 메모리에 두지 않음)
+
+        Returns:
+            처음 위치로 되돌린 output (또는 새 BytesIO)
+        """
+        profiler = profiler or RenderProfiler()
         is_v2 = report_data.get('is_v2', False)
-        
-        v2_suffix = "_v2" if is_v2 else ""
-        template_name = f"NGS_{panel_type}_report_baseline{v2_suffix}.pptx"
-        template_path = os.path.join(self.template_dir, template_name)
 
-        if not os.path.exists(template_path):
-            raise FileNotFoundError(f"템플릿 파일을 찾을 수 없습니다: {template_path}")
+        with profiler.phase("template"):
+            # 캐시된 템플릿의 복제본 사용 (파일이 없으면 FileNotFoundError)
+            entry = self.template_cache.entry(self.get_template_name(report_data))
+            prs = self.template_cache.clone(entry)
 
-        prs = Presentation(template_path)
+            # 레이아웃 분석 결과와 값 채우기 위치는 템플릿당 한 번만 계산
+            compiled_layout = self.template_cache.compiled(entry, "layout", self._compile_layout)
+            anchors = self.template_cache.compiled(entry, "anchors", self._compile_anchors)
+            part_store = self._template_part_store(entry)
 
-        # 테마의 majorFont/minorFont가 동일하면 PowerPoint UI에서 "+본문"/"+제목" 구분 불가.
-        # majorFont Latin을 변경하여 "+본문" 표시가 정상 작동하도록 함.
-        self._fix_theme_font_distinction(prs)
+            # 테마 폰트 보정(_fix_theme_font_distinction)은 템플릿 캐시 로드 시 이미 적용됨
 
-        if len(prs.slides) > 0:
-            self._fill_clinical_info(prs.slides[0], report_data)
-            
-            # [Added] 기존 템플릿의 Other Biomarkers 섹션 업데이트
-            biomarkers = report_data.get('biomarkers', {})
-            self._update_existing_biomarkers(prs.slides[0], biomarkers)
+        with profiler.phase("fills"):
+            if len(prs.slides) > 0:
+                self._fill_clinical_info(prs.slides[0], report_data, anchors)
 
-            # [Added] 검사기기 등 Diagnostic Info 업데이트
-            self._fill_diagnostic_info(prs, report_data)
+                # [Added] 기존 템플릿의 Other Biomarkers 섹션 업데이트
+                biomarkers = report_data.get('biomarkers', {})
+                self._update_existing_biomarkers(prs.slides[0], biomarkers)
 
-        # QC 및 DNA/RNA 정보는 4번째 페이지(Index 3)에 위치함
-        if len(prs.slides) > 3:
-            self._fill_qc_table(prs.slides[3], report_data)
-            self._fill_dna_rna_info(prs.slides[3], report_data)
-            
-            # V2 전용: Tumor Fraction / Ploidy 테이블 채우기
-            if is_v2:
-                print(f"[DEBUG] V2 detected. Calling _fill_v2_qc_table...")
-                print(f"[DEBUG] biomarkers keys: {list(report_data.get('biomarkers', {}).keys())}")
-                self._fill_v2_qc_table(prs.slides[3], report_data)
-                
-                # V2 전용: Batch (Run Name) 채우기
-                self._fill_v2_batch(prs.slides[3], report_data)
-            else:
-                print(f"[DEBUG] is_v2={is_v2}, skipping V2 QC table")
+                # [Added] 검사기기 등 Diagnostic Info 업데이트
+                self._fill_diagnostic_info(prs, report_data, anchors)
 
+            # QC 및 DNA/RNA 정보는 4번째 페이지(Index 3)에 위치함
+            if len(prs.slides) > 3:
+                self._fill_qc_table(prs.slides[3], report_data)
+                self._fill_dna_rna_info(prs.slides[3], report_data, anchors)
 
-        analyzer = LayoutAnalyzer(prs)
-        self._process_all_variants(prs, report_data, analyzer)
-        
-        # 코멘트 섹션의 빈 슬라이드(Ghost Page)만 안전하게 제거
-        self._remove_ghost_comment_slides(prs)
-        
-        # 마지막 페이지에 Footer 정보(Tested by, Signed by 등) 기입
-        if len(prs.slides) > 0:
-            self._fill_footer_info(prs.slides[-1], report_data)
+                # V2 전용: Tumor Fraction / Ploidy 테이블 채우기
+                if is_v2:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("V2 detected. biomarkers keys: %s", list(report_data.get('biomarkers', {}).keys()))
+                    self._fill_v2_qc_table(prs.slides[3], report_data)
 
-        output = BytesIO()
-        prs.save(output)
-        output.seek(0)
+                    # V2 전용: Batch (Run Name) 채우기
+                    self._fill_v2_batch(prs.slides[3], report_data)
+                else:
+                    logger.debug("is_v2=%s, skipping V2 QC table", is_v2)
+
+        with profiler.phase("variants"):
+            analyzer = LayoutAnalyzer(prs, compiled_layout)
+        layout = self._process_all_variants(prs, report_data, analyzer, layout_plan, profiler)
+
+        with profiler.phase("ghost"):
+            # 레이아웃이 사용한 슬라이드 중 빈 슬라이드(Ghost Page)만 제거
+            self._remove_ghost_comment_slides(prs, layout)
+
+        with profiler.phase("fills"):
+            # 마지막 페이지에 Footer 정보(Tested by, Signed by 등) 기입
+            footer_slide = prs.slides.get(anchors.footer_slide_id)
+            if footer_slide is not None:
+                self._fill_footer_info(footer_slide, report_data, anchors)
+
+        with profiler.phase("save"):
+            if output is None:
+                output = BytesIO()
+            # 템플릿에서 바뀌지 않은 파트는 미리 압축한 zip 엔트리를 그대로 복사
+            TemplatePackageWriter.save(prs, output, part_store, verify=self.verify_reused_parts)
+            output.seek(0)
+
+        with profiler.phase("release"):
+            # python-pptx의 Part/Relationship/Slide 객체는 서로 참조(순환)하므로 참조 카운트만으로는 해제되지 않고,
+            # 다음 전체 GC까지 복제한 템플릿의 lxml 트리가 통째로 남습니다 (연속 렌더링 시 워커 메모리가 계속 증가).
+            # 저장이 끝났으니 바로 수거합니다.
+            del prs, layout, analyzer, footer_slide
+            gc.collect()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"PPTX 렌더링 단계별 시간: {profiler.summary()}")
         return output
 
-    def _remove_ghost_comment_slides(self, prs):
+    def _remove_ghost_comment_slides(self, prs, layout):
         """
-        'Comments' 헤더는 있지만 실제 코멘트 내용(본문 박스)이 비어있는 슬라이드를 찾아 삭제합니다.
-        (정적 슬라이드인 Method, Gene Content 등은 건드리지 않음)
+        레이아웃이 사용한 슬라이드(흐름에 속한 템플릿 슬라이드 + 새로 만든 슬라이드) 중
+        'Comments' 헤더나 Footer만 남고 실제 본문이 없는 슬라이드를 한 번에 삭제합니다.
+        (정적 슬라이드인 Method, Gene Content 등은 검사 대상이 아님)
         """
-        slides_to_remove = []
-        
+        ghost_sld_ids = [
+            sld_id for slide_id, sld_id in layout.flow_slides.items()
+            if not self._has_meaningful_content(layout._find_slide_by_id(slide_id))
+        ]
+
+        # 슬라이드 관계는 sldId 하나만 참조하므로 참조 수 확인(drop_rel) 없이 바로 해제
+        sld_id_lst = prs.slides._sldIdLst
+        rels = prs.part.rels
+        for sld_id in ghost_sld_ids:
+            sld_id_lst.remove(sld_id)
+            rels.pop(sld_id.rId)
+
+    @staticmethod
+    def _has_meaningful_content(slide):
+        """Comment 헤더/Raw data Footer 외의 텍스트가 있는지 (없으면 Ghost Page)"""
         # 헤더 키워드 (부분 일치 허용)
         # '3. Comments', '▣ Comment', '▣ Comment (continued)' 등 모두 커버
         HEADER_KEYWORDS = ["Comment", "Comments"]
-        
-        for i, slide in enumerate(prs.slides):
-            # print(f"DEBUG: Checking Slide {i} for ghost content...")
-            has_comment_header = False
-            has_meaningful_content = False
-            
-            for shape in slide.shapes:
-                if not shape.has_text_frame:
-                    continue
-                
-                text = shape.text_frame.text.strip()
-                if not text:
-                    continue
-                
-                # print(f"  - Found Text: '{text[:30]}...' (Len: {len(text)})")
 
-                # 헤더 확인 (유연한 매칭)
-                if any(k in text for k in HEADER_KEYWORDS) and len(text) < 40:
-                    if "▣" in text or text.startswith("3."): # 3. Comments
-                         has_comment_header = True
-                         continue
-                
-                # Footer 확인 (무시)
-                # "• 본 검사의 raw data" 혹은 "* 본 검사의 raw data" 등 다양한 불렛 대응
-                if "raw data" in text and "보관" in text:
+        for shape in slide.shapes:
+            if not shape.has_text_frame:
+                continue
+
+            text = shape.text_frame.text.strip()
+            if not text:
+                continue
+
+            # 헤더 확인 (유연한 매칭)
+            if any(k in text for k in HEADER_KEYWORDS) and len(text) < 40:
+                if "▣" in text or text.startswith("3."): # 3. Comments
                     continue
-                    
-                # 그 외 텍스트가 있다면 의미있는 콘텐츠로 간주 (코멘트 본문, 고지문 등)
-                has_meaningful_content = True
-            
-            # 헤더 유무와 상관없이, '의미 있는 본문'이 없으면 Ghost Page로 간주하고 삭제
-            # (Header만 있거나, Footer만 있거나, 아예 빈 슬라이드인 경우 모두 포함)
-            if not has_meaningful_content:
-                slides_to_remove.append(i)
-        
-        # 역순 삭제
-        for idx in sorted(slides_to_remove, reverse=True):
-            try:
-                # Slide 객체가 아닌 _sldIdLst(XML 요소)에서 rId를 가져와야 함
-                slide_id_elem = prs.slides._sldIdLst[idx]
-                rId = slide_id_elem.rId
-                prs.part.drop_rel(rId)
-                del prs.slides._sldIdLst[idx]
-            except Exception:
-                 pass
-
-    def _fill_clinical_info(self, slide, report_data):
+
+            # Footer 확인 (무시)
+            # "• 본 검사의 raw data" 혹은 "* 본 검사의 raw data" 등 다양한 불렛 대응
+            if "raw data" in text and "보관" in text:
+                continue
+
+            # 그 외 텍스트가 있다면 의미있는 콘텐츠로 간주 (코멘트 본문, 고지문 등)
+            return True
+        return False
+
+    def _fill_clinical_info(self, slide, report_data, anchors: TemplateAnchors):
         # 1. clinical_info 딕셔너리 추출 (없으면 빈 딕셔너리)
         inner_info = report_data.get('clinical_info', {})
-        tables = [shape.table for shape in slide.shapes if shape.has_table]
+        shapes_by_id = _shapes_by_id(slide)
 
         for ppt_label, data_key in self.config.CLINICAL_INFO_MAPPING.items():
             # 1순위: clinical_info 내부 검색
@@ -663,7 +1293,9 @@ class NGS_PPT_Generator:
 
             final_value = str(value) if value is not None else ""
 
-            self._search_and_fill_cell_below(tables, ppt_label, final_value, font_size=Pt(8))
+            shape_id, row, col = anchors.clinical_cells[ppt_label]
+            target_cell = shapes_by_id[shape_id].table.cell(row, col)
+            self._fill_value_cell(target_cell, final_value, font_size=Pt(8))
 
     def _update_existing_biomarkers(self, slide, biomarkers):
         """
@@ -789,27 +1421,14 @@ class NGS_PPT_Generator:
         p.alignment = PP_ALIGN.CENTER
         p.text = "" # 기존 텍스트 클리어
 
-        # Value
-        run_val = p.add_run()
-        run_val.text = str(value)
-        run_val.font.name = self.config.FONT_NAME
-        run_val.font.size = Pt(8) # [Changed] 10pt -> 8pt
-        
-        if is_high:
-            run_val.font.bold = True
-            run_val.font.color.rgb = self.config.COLOR_RED
-        else:
-            run_val.font.bold = False
-            run_val.font.color.rgb = self.config.COLOR_BLACK
+        # Value ([Changed] 10pt -> 8pt, High면 빨간색 Bold)
+        run_styles.apply(p.add_run(), str(value), font_size=Pt(8), bold=is_high,
+                         color=self.config.COLOR_RED if is_high else self.config.COLOR_BLACK)
             
         # Unit (공백 추가)
         if unit:
-            run_unit = p.add_run()
-            run_unit.text = f" {str(unit)}"
-            run_unit.font.name = self.config.FONT_NAME
-            run_unit.font.size = Pt(8) # [Changed] 10pt -> 8pt
-            run_unit.font.bold = False
-            run_unit.font.color.rgb = self.config.COLOR_BLACK
+            run_styles.apply(p.add_run(), f" {str(unit)}", font_size=Pt(8), bold=False,
+                             color=self.config.COLOR_BLACK)
 
         self._set_cell_border(cell)
 
@@ -856,10 +1475,12 @@ class NGS_PPT_Generator:
         tf_pathological = str(tf_data.get('pathological', '')).strip()
         ploidy_val = str(ploidy_data.get('value', '')).strip()
         
-        print(f"[DEBUG V2 QC] tf_val='{tf_val}', tf_pathological='{tf_pathological}', ploidy_val='{ploidy_val}'")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("[V2 QC] tf_val='%s', tf_pathological='%s', ploidy_val='%s'", tf_val, tf_pathological, ploidy_val)
         
         if not tf_val and not ploidy_val:
-            print(f"[DEBUG V2 QC] Both values empty, returning early")
+            logger.debug("[V2 QC] Both values empty, returning early")
             return
         
         # 슬라이드의 모든 테이블을 순회하며 3열 이상 + 첫 번째 열에 'tumor'가 있는 테이블을 찾음
@@ -881,15 +1502,18 @@ class NGS_PPT_Generator:
                     break
             
             if not has_tumor_row:
-                print(f"[DEBUG V2 QC] Table skipped (3+cols but no 'tumor' in first col). cols={len(table.columns)}")
+                if debug:
+                    logger.debug("[V2 QC] Table skipped (3+cols but no 'tumor' in first col). cols=%d", len(table.columns))
                 continue
             
-            print(f"[DEBUG V2 QC] Found target table! cols={len(table.columns)}, rows={len(table.rows)}")
+            if debug:
+                logger.debug("[V2 QC] Found target table! cols=%d, rows=%d", len(table.columns), len(table.rows))
             # 해당 테이블 발견 — 각 행을 순회하며 값 채우기
             filled_count = 0
             for row in table.rows:
                 first_cell_text = row.cells[0].text_frame.text.strip().lower()
-                print(f"[DEBUG V2 QC] Row first cell: '{first_cell_text}', num cells: {len(row.cells)}")
+                if debug:
+                    logger.debug("[V2 QC] Row first cell: '%s', num cells: %d", first_cell_text, len(row.cells))
                 
                 if 'tumor' in first_cell_text:
                     # Pathological estimation for Tumor fraction
@@ -897,23 +1521,26 @@ class NGS_PPT_Generator:
                         self._set_cell_text_preserving_style(row.cells[1], tf_pathological)
                     # SNP based estimation for Tumor fraction
                     self._set_cell_text_preserving_style(row.cells[2], tf_val, is_bold=True)
-                    print(f"[DEBUG V2 QC] -> Filled Tumor Fraction: pathological='{tf_pathological}', snp='{tf_val}'")
+                    if debug:
+                        logger.debug("[V2 QC] -> Filled Tumor Fraction: pathological='%s', snp='%s'", tf_pathological, tf_val)
                     filled_count += 1
                 
                 elif 'ploidy' in first_cell_text:
                     # SNP based estimation for Ploidy
                     self._set_cell_text_preserving_style(row.cells[2], ploidy_val, is_bold=True)
-                    print(f"[DEBUG V2 QC] -> Filled Ploidy: {ploidy_val}")
+                    if debug:
+                        logger.debug("[V2 QC] -> Filled Ploidy: %s", ploidy_val)
                     filled_count += 1
             
-            print(f"[DEBUG V2 QC] Total cells filled: {filled_count}")
+            if debug:
+                logger.debug("[V2 QC] Total cells filled: %d", filled_count)
             break  # 첫 번째 매칭 테이블에서만 처리
 
     def _fill_v2_batch(self, slide, report_data):
         """V2 전용: Batch (Run Name) 값을 'Batch :' 텍스트 뒤에 채우기"""
         run_name = str(report_data.get('run_name', '')).strip()
         if not run_name:
-            print("[DEBUG V2 Batch] run_name is empty, skipping")
+            logger.debug("[V2 Batch] run_name is empty, skipping")
             return
         
         for shape in slide.shapes:
@@ -934,28 +1561,25 @@ class NGS_PPT_Generator:
                             new_run.font.size = src_font.size
                         if src_font.name:
                             new_run.font.name = src_font.name
-                    print(f"[DEBUG V2 Batch] Filled Batch: '{run_name}'")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[V2 Batch] Filled Batch: '%s'", run_name)
                     return
         
-        print("[DEBUG V2 Batch] 'Batch :' text not found on slide")
+        logger.warning("[V2 Batch] 'Batch :' text not found on slide")
 
-    def _fill_dna_rna_info(self, slide, report_data):
+    def _fill_dna_rna_info(self, slide, report_data, anchors: TemplateAnchors):
         drna = report_data.get('drna_qubit', {})
         if not drna: return
         
         dna_val = drna.get('DNA')
         rna_val = drna.get('RNA')
         
-        t_dna = "DNA (ng/ul)"
-        t_rna = "RNA (ng/ul)"
+        t_dna, t_rna = TemplateAnchors.DRNA_LABELS
 
-        for shape in slide.shapes:
-            if shape.has_text_frame:
-                self._process_text_frame_for_drna(shape.text_frame, t_dna, t_rna, dna_val, rna_val)
-            if shape.has_table:
-                for row in shape.table.rows:
-                    for cell in row.cells:
-                        self._process_text_frame_for_drna(cell.text_frame, t_dna, t_rna, dna_val, rna_val)
+        shapes_by_id = _shapes_by_id(slide)
+        for address in anchors.drna_frames:
+            text_frame = TemplateAnchors.text_frame(shapes_by_id, *address)
+            self._process_text_frame_for_drna(text_frame, t_dna, t_rna, dna_val, rna_val)
 
     def _process_text_frame_for_drna(self, text_frame, t_dna, t_rna, v_dna, v_rna):
         if t_dna not in text_frame.text and t_rna not in text_frame.text:
@@ -1060,63 +1684,92 @@ class NGS_PPT_Generator:
         final_keywords = [k for k in keywords if len(k) > 2]
         return list(set(final_keywords))
 
-    def _process_all_variants(self, prs, report_data, analyzer):
-        layout = LayoutContext(prs, analyzer, generator=self)
+    def _build_highlight_pattern(self, report_data):
+        """
+        코멘트 강조 키워드를 한 번에 찾는 컴파일된 패턴 (보고서당 1회 생성, 모든 Comment 박스에서 재사용).
+        같은 키워드 집합은 컴파일 결과를 공유합니다. 키워드가 없으면 None.
+        """
+        keywords = self._extract_highlight_keywords(report_data)
+        if not keywords:
+            return None
+        return _compile_keyword_pattern(tuple(sorted(keywords)))
+
+    def _process_all_variants(self, prs, report_data, analyzer, plan=None, profiler: RenderProfiler = None):
+        profiler = profiler or RenderProfiler()
+
+        with profiler.phase("variants"):
+            layout = LayoutContext(prs, analyzer, generator=self)
+
+            # 1단계: 슬라이드 분할/제목/(n/N) 표기/테이블 조각을 높이만으로 미리 계산
+            if plan is None:
+                plan = self._plan_variant_sections(report_data, analyzer.compiled)
+            # 2단계: 계획대로 그리기 (되돌아가기 없음)
+            self._emit_variant_plan(layout, plan, report_data)
+
+            # [Safety Reset] Variants 섹션 종료 후, 후속 섹션(Failed Gene 등)에 이전 타이틀이 반복되지 않도록 초기화
+            layout.current_main_title = None
+
+            # 3. Failed gene 섹션 (Variants 처리 루프 종료 후)
+            failed_gene = report_data.get('failed_gene')
+            self._draw_failed_gene(layout, failed_gene)
+
+        # 5. Other Biomarkers
+        # [Refactoring] 기존 템플릿(Slide 1)에 있는 섹션을 업데이트하므로 여기서는 그리지 않음.
+        # biomarkers = report_data.get('biomarkers', {})
+        # self._draw_biomarkers(layout, biomarkers)
+
+        # Comments 섹션
+        with profiler.phase("comments"):
+            comments = report_data.get('comments', [])
+            highlight_pattern = self._build_highlight_pattern(report_data)
+            self._draw_comments(layout, comments, highlight_pattern)
+
+        return layout
+
+    def _plan_variant_sections(self, report_data, compiled: CompiledLayout) -> VariantLayoutPlan:
+        """
+        변이 섹션의 배치 계획을 계산합니다 (프레젠테이션을 수정하지 않는 순수 함수).
+        LayoutContext와 같은 위치 계산을 커서로 수행하여 슬라이드 분할 위치, 메인 제목 반복,
+        테이블 조각과 (n/N) 표기를 모두 미리 결정합니다.
+        """
+        cfg = self.config
+        cursor = _LayoutCursor(compiled, cfg)
         current_section_group = None
 
-        for section_config in self.config.VARIANT_SECTIONS:
+        for section_config in cfg.VARIANT_SECTIONS:
             key = section_config['key']
             title = section_config['title']
             style_type = section_config['type']
-            prototype_key = section_config['prototype_key']
-
-            # 스타일 설정 가져오기 (clinical: Red/Bold, unknown: Black/Normal)
-            style_props = self.config.STYLES.get(style_type, self.config.STYLES["unknown"])
 
             if current_section_group != style_type:
                 current_section_group = style_type
-                
-                # [리팩토링된 흐름 로직]
+
                 # 템플릿의 앵커로 이동할지, 아니면 현재 흐름을 유지할지 결정
-                target_loc = analyzer.section_locations.get(style_type)
+                target_loc = compiled.section_locations.get(style_type)
                 should_move = False
-                
-                if target_loc:
-                    target_slide_idx = target_loc["slide_index"]
-                    target_slide_id = target_loc["slide_id"]
 
+                if target_loc:
                     # 1. 이미 현재 슬라이드가 목표 슬라이드인 경우 (예: Clinical 섹션 시작)
-                    # 별도 이동 없이 앵커를 사용하도록 허용
-                    if layout.current_slide.slide_id == target_slide_id:
+                    if cursor.slide_id == target_loc["slide_id"]:
                         should_move = True
                     # 2. 목표 슬라이드를 아직 지나지 않았을 때만 이동
                     # 엄격한 부등호(<) 사용: 오버플로우로 인해 현재 인덱스가 목표 인덱스와 같아진 경우 점프 방지
-                    elif layout.current_slide_index < target_slide_idx:
+                    elif cursor.slide_index < target_loc["slide_index"]:
                         should_move = True
-                
-                found_anchor = False
+
                 if should_move:
-                    found_anchor = layout.move_to_section(style_type)
+                    cursor.move_to_section(style_type)
                 else:
-                    # 이동하지 않기로 결정했다면(오버플로우 등), 
-                    # 중복 방지를 위해 원래 템플릿 슬라이드의 제목을 제거해야 함
-                    if target_loc and "title_shape" in target_loc:
-                        try:
-                            sp = target_loc["title_shape"]
-                            if sp.element.getparent() is not None:
-                                sp.element.getparent().remove(sp.element)
-                        except Exception as e:
-                            print(f"Warning: Failed to remove unused title shape: {e}")
-                
-                # 이동하지 않았거나(오버플로우), 앵커를 못 찾았다면 직접 타이틀 그리기
-                if not found_anchor:
-                    main_title = self.config.SECTION_START_MARKERS.get(style_type)
+                    # 이동하지 않으면(오버플로우 등) 중복 방지를 위해 템플릿의 제목을 제거하고 직접 그림
+                    if target_loc:
+                        cursor.steps.append(("remove_anchor_title", style_type))
+                    main_title = cfg.SECTION_START_MARKERS.get(style_type)
                     if main_title:
-                        # 기본값이 12pt Black으로 변경되었으므로 별도 파라미터 불필요
-                        self._draw_main_section_title(layout, main_title)
-                
+                        cursor.add_main_title(main_title)
+
                 # [Tracking] 현재 메인 타이틀 업데이트 (페이지 분할 시 반복용)
-                layout.current_main_title = self.config.SECTION_START_MARKERS.get(style_type)
+                cursor.main_title = cfg.SECTION_START_MARKERS.get(style_type)
+                cursor.steps.append(("set_main_title", cursor.main_title))
 
             section_data = report_data.get(key, {})
 
@@ -1124,83 +1777,132 @@ class NGS_PPT_Generator:
             if key == 'lr_brca_clinical' and not section_data.get('data'):
                 continue
             rows = section_data.get('data', [])
-            headers = section_data.get('headers', [])
             highlight_val = section_data.get('highlight', [])
 
-            prototype_xml = analyzer.existing_elements["prototypes"].get(prototype_key)
-
-            if rows and len(rows) > 0:
-                header_height = Cm(0.8)
-                min_table_height = Cm(0.8)
-                required_height = header_height + min_table_height
+            prototype = compiled.table_prototypes.get(section_config['prototype_key'])
 
-                # [Changed] Orphan Header Prevention
-                # 헤더(0.8) + 최소 행 높이(약 1.0) 정도의 여유 공간 확인
-                # 부족하면 아예 새 슬라이드로 넘김
-                orphan_threshold = header_height + Cm(1.2)
-                
-                if layout.top + orphan_threshold > layout.bottom_limit:
-                    layout.add_new_slide()
+            if rows:
+                # [Orphan Header Prevention] 소제목 + 최소 행 공간이 없으면 아예 새 슬라이드로 넘김
+                if cursor.top + cfg.HEIGHT_ORPHAN_GUARD > cursor.bottom_limit:
+                    cursor.add_new_slide()
 
-                # 먼저 테이블 분할 여부 계산
-                if prototype_xml is not None:
-                    total_pages = self._calculate_table_pages(layout, len(rows))
-                else:
-                    total_pages = 1  # scratch 테이블은 분할 미지원
-                
-                # 분할 시 첫 페이지 제목에 (1/N) 추가
-                display_title = f"{title} (1/{total_pages})" if total_pages > 1 else title
-                
-                # [Changed] VUS 여부 확인 (highlight plain text 처리를 위해)
-                # style_type 변수를 사용 (section_data에는 type 정보가 없을 수 있음)
+                # VUS 여부 (highlight plain text 처리)
                 is_clinical = (style_type == 'clinical')
-                
-                self._render_section_header(layout, display_title, highlight_data=highlight_val, is_clinical=is_clinical)
-                
-                if prototype_xml is not None:
-                    # 테이블 분할 시 제목과 페이지 번호 표시를 위한 정보 전달
-                    if total_pages > 1:
-                        pagination_info = {
-                            "title": title,
-                            "current_page": 1,
-                            "total_pages": total_pages,
-                            "is_first": True
-                        }
-                    else:
-                        pagination_info = None
-                    
-                    self._render_table_using_prototype(
-                        layout, prototype_xml, rows, style_props,
-                        margin_left=self.config.MARGIN_LEFT_L3,
-                        pagination_info=pagination_info
-                    )
+                header_idx = cursor.add_section_header(
+                    title, self._section_header_height(highlight_val),
+                    highlight=highlight_val, is_clinical=is_clinical
+                )
+
+                if prototype is not None:
+                    self._plan_table_chunks(cursor, key, title, header_idx, prototype, len(rows))
                 else:
-                    self._render_table_from_scratch(layout, headers, rows, margin_left=self.config.MARGIN_LEFT_L3)
+                    # scratch 테이블은 분할 미지원
+                    cursor.add(("scratch_table", key), Cm(0.8 * (len(rows) + 1)) + cfg.SPACE_TABLE_BOTTOM)
             else:
-                self._render_section_header(layout, title, is_none=True)
+                cursor.add_section_header(title, self._section_header_height(None), is_none=True)
 
-            layout.add_space(self.config.SPACE_SECTION)
+            cursor.add(("space", cfg.SPACE_SECTION), cfg.SPACE_SECTION)
 
-        # [Safety Reset] Variants 섹션 종료 후, 후속 섹션(Failed Gene 등)에 이전 타이틀이 반복되지 않도록 초기화
-        layout.current_main_title = None
+        return VariantLayoutPlan(steps=tuple(cursor.steps), new_slides=cursor.new_slides)
 
-        # 3. Failed gene 섹션 (Variants 처리 루프 종료 후)
-        failed_gene = report_data.get('failed_gene')
-        self._draw_failed_gene(layout, failed_gene)
+    def _plan_table_chunks(self, cursor, key, title, header_idx, prototype, total_rows):
+        """테이블을 슬라이드 단위 조각으로 나누고, 분할된 경우 소제목에 (n/N)을 붙입니다."""
+        cfg = self.config
+        header_indices = [header_idx]
+        start = 0
 
-        # 5. Other Biomarkers
-        # [Refactoring] 기존 템플릿(Slide 1)에 있는 섹션을 업데이트하므로 여기서는 그리지 않음.
-        # biomarkers = report_data.get('biomarkers', {})
-        # self._draw_biomarkers(layout, biomarkers)
+        while True:
+            available_height = cursor.bottom_limit - cursor.top
+            if available_height < (cfg.HEIGHT_SPLIT_HEADER + cfg.HEIGHT_SPLIT_ROW):
+                cursor.add_new_slide()
+                available_height = cursor.bottom_limit - cursor.top
 
-        # Comments 섹션
-        comments = report_data.get('comments', [])
-        highlight_keywords = self._extract_highlight_keywords(report_data)
-        self._draw_comments(layout, comments, highlight_keywords)
+            max_rows = int((available_height - cfg.HEIGHT_SPLIT_HEADER) / cfg.HEIGHT_SPLIT_ROW)
+            end = min(total_rows, start + max_rows)
+            table_height = prototype.header_row_height + prototype.data_row_height * (end - start)
+            cursor.add(("table", key, start, end), table_height + cfg.SPACE_TABLE_BOTTOM)
+
+            if end >= total_rows:
+                break
+
+            # 다음 조각은 새 슬라이드에서 (n/N) 소제목과 함께 시작 (페이지 수는 아래에서 채움)
+            cursor.add_new_slide()
+            header_indices.append(
+                cursor.add_section_header(title, self._section_header_height(None))
+            )
+            start = end
+
+        total_pages = len(header_indices)
+        if total_pages > 1:
+            for page, idx in enumerate(header_indices, start=1):
+                _, _, highlight, is_none, is_clinical = cursor.steps[idx]
+                cursor.steps[idx] = ("section_header", f"{title} ({page}/{total_pages})",
+                                     highlight, is_none, is_clinical)
+
+    def _emit_variant_plan(self, layout, plan: VariantLayoutPlan, report_data):
+        """
+        배치 계획을 순서대로 실행하여 슬라이드에 그립니다.
+        제목/소제목/테이블은 공간을 다시 확인하지 않고 현재 위치에 그리며, 슬라이드는 계획의 new_slide 단계에서만 추가합니다.
+        (HTML 보고서도 같은 계획으로 페이지를 나누므로, 계획에 없는 슬라이드가 생기면 렌더링을 실패시킴)
+        """
+        sections = {section['key']: section for section in self.config.VARIANT_SECTIONS}
+        table_prototypes = layout.analyzer.existing_elements["table_prototypes"]
+        inserted_before = layout.inserted_slides
+
+        for step in plan.steps:
+            action = step[0]
+
+            if action == "new_slide":
+                layout.add_new_slide()
+            elif action == "move_to_section":
+                layout.move_to_section(step[1])
+            elif action == "remove_anchor_title":
+                sp = layout.analyzer.section_locations[step[1]].get("title_shape")
+                if sp is not None and sp.element.getparent() is not None:
+                    sp.element.getparent().remove(sp.element)
+            elif action == "main_title":
+                self._draw_main_section_title(layout, step[1])
+            elif action == "set_main_title":
+                layout.current_main_title = step[1]
+            elif action == "section_header":
+                _, title, highlight, is_none, is_clinical = step
+                self._render_section_header(layout, title, highlight_data=highlight,
+                                            is_none=is_none, is_clinical=is_clinical)
+            elif action == "table":
+                _, key, start, end = step
+                section = sections[key]
+                style_props = self.config.STYLES.get(section['type'], self.config.STYLES["unknown"])
+                rows = report_data[key]['data'][start:end]
+                self._insert_cloned_table(layout, table_prototypes[section['prototype_key']], rows,
+                                          style_props, self.config.MARGIN_LEFT_L3)
+            elif action == "scratch_table":
+                section_data = report_data[step[1]]
+                self._render_table_from_scratch(layout, section_data.get('headers', []), section_data['data'],
+                                                margin_left=self.config.MARGIN_LEFT_L3)
+            elif action == "space":
+                layout.add_space(step[1])
+
+        inserted = layout.inserted_slides - inserted_before
+        if inserted != plan.new_slides:
+            raise AssertionError(
+                f"변이 섹션 배치 계획과 실제 슬라이드 수가 다릅니다: 계획 {plan.new_slides}장, 추가 {inserted}장"
+            )
+
+    def _section_header_height(self, highlight_data):
+        """소제목 높이 (highlight 글자 수에 따른 줄바꿈 공간 포함, 최대 3줄)"""
+        wrapped_lines = 0
+        if highlight_data:
+            total_chars = sum(len(segment['text']) for segment in highlight_data)
+            chars_per_line = self.config.HEADER_CHARS_PER_LINE
+            if total_chars > chars_per_line:
+                wrapped_lines = int((total_chars - 1) / chars_per_line)
+
+        capped_wrapped_lines = min(wrapped_lines, self.config.HEADER_MAX_WRAP_LINES)
+        return self.config.HEIGHT_SECTION_HEADER + self.config.HEIGHT_HEADER_WRAP_LINE * capped_wrapped_lines
 
     def _draw_main_section_title(self, layout, text, font_size=None, color=None):
-        height = Cm(0.6)
-        layout.check_space(height)
+        """메인 섹션 제목 (공간 확인 없음: 위치는 배치 계획 또는 새 슬라이드 상단이 결정)"""
+        height = self.config.HEIGHT_MAIN_TITLE
         tb = layout.current_slide.shapes.add_textbox(self.config.MARGIN_LEFT_L1, layout.top, layout.width, height)
         p = tb.text_frame.paragraphs[0]
         
@@ -1240,8 +1942,8 @@ class NGS_PPT_Generator:
         layout.add_space(height + self.config.SPACE_TITLE_BOTTOM)
 
     def _render_section_header(self, layout, title, highlight_data=None, is_none=False, is_clinical=True):
-        height = Cm(0.8)
-        layout.check_space(height)
+        """변이 소제목 (공간 확인 없음: 슬라이드 분할은 배치 계획의 new_slide 단계가 결정)"""
+        height = self.config.HEIGHT_SECTION_HEADER
         
         # 텍스트 박스 너비를 명시적으로 제한하여 우측 테두리 안쪽에서 안전하게 자동 줄바꿈(word wrap) 유도
         box_width = layout.width - self.config.MARGIN_LEFT_L2 - Cm(0.5)
@@ -1291,353 +1993,108 @@ class NGS_PPT_Generator:
                                         color=self.config.COLOR_BLACK,
                                         italic=False) 
 
-        # 동적 높이 계산 (Dynamic Height Calculation with constraints)
-        wrapped_lines = 0
-        if highlight_data:
-            total_chars = sum(len(segment['text']) for segment in highlight_data)
-            # 대략적인 한 줄 글자 수 (12pt 맑은 고딕, 17cm 너비 기준 보수적 측정치)
-            chars_per_line = 80 
-            if total_chars > chars_per_line:
-                wrapped_lines = int((total_chars - 1) / chars_per_line)
-                
-        # 최대 3줄(기본 1줄 + 추가 2줄)까지만 공간 할당을 허용
-        capped_wrapped_lines = min(wrapped_lines, 2)
-        
-        # 줄바꿈 1개당 0.5cm씩 추가
-        dynamic_added_height = Cm(0.5) * capped_wrapped_lines
-        layout.add_space(height + dynamic_added_height)
-
-    def _set_run_style(self, run, text, is_bold=False, font_size=None, color=None, italic=False):
-        """텍스트 스타일 적용 헬퍼 메서드"""
-        run.text = text
-        run.font.name = self.config.FONT_NAME
-        if font_size: run.font.size = font_size
-        if color: run.font.color.rgb = color
-        run.font.bold = is_bold
-        run.font.italic = italic
-        
-        # 빨간 밑줄(맞춤법 검사) 끄기
-        rPr = run.font._element
-        if rPr is not None:
-            rPr.set('err', '0')
-            rPr.set('dirty', '0')
-            rPr.set('noProof', '1')
-            
-            # lang 속성에 한국어(ko-KR) 명시
-            from pptx.oxml.xmlchemy import OxmlElement
-            lang = OxmlElement('a:lang')
-            lang.set('val', 'ko-KR')
-            rPr.append(lang)
+        # 동적 높이 계산 (배치 계획과 같은 규칙)
+        layout.add_space(self._section_header_height(highlight_data))
 
-    def _apply_theme_body_latin(self, run):
-        """Latin(영어)과 East Asian(한글) 글꼴을 모두 테마 본문 폰트(+mn)로 설정"""
-        from pptx.oxml.ns import qn
+    def _set_run_style(self, run, text, is_bold=False, font_size=None, color=None, italic=False, theme_body=False):
+        """텍스트 스타일 적용 헬퍼 메서드 (맞춤법 검사 끄기 + ko-KR 포함, theme_body면 테마 본문 폰트)"""
+        run_styles.apply(run, text, font_size=font_size, bold=is_bold, italic=italic, color=color or None,
+                         proofing_off=True, theme_body=theme_body)
 
-        run.font.name = '+mn-lt'
-
-        rPr = run._r.get_or_add_rPr()
-        ea = rPr.find(qn('a:ea'))
-        if ea is None:
-            ea = OxmlElement('a:ea')
-            latin = rPr.find(qn('a:latin'))
-            if latin is not None:
-                latin.addnext(ea)
-            else:
-                rPr.append(ea)
-        ea.set('typeface', '+mn-ea')
-
-    def _calculate_table_pages(self, layout, total_rows):
-        """테이블이 몇 페이지에 걸쳐 분할될지 미리 계산합니다."""
-        row_height = Cm(0.7)
-        header_height = Cm(0.8)
-        page_count = 0
-        remaining_rows = total_rows
-        
-        # 첫 페이지 가용 공간
-        available_height = layout.bottom_limit - layout.top
-        if available_height < (header_height + row_height):
-            available_height = layout.bottom_limit - self.config.BODY_TOP_START
-        
-        while remaining_rows > 0:
-            page_count += 1
-            max_rows = int((available_height - header_height) / row_height)
-            remaining_rows -= max(1, max_rows)  # 최소 1행은 들어감
-            # 이후 페이지는 새 슬라이드 기준
-            available_height = layout.bottom_limit - self.config.BODY_TOP_START
-        
-        return max(1, page_count)
-
-    def _render_table_using_prototype(self, layout, prototype_xml, rows, style_props, 
-                                       margin_left=None, pagination_info=None):
-        """프로토타입 XML을 사용하여 테이블을 그립니다.
-        
-        Args:
-            pagination_info: 분할 시 페이지 번호 표시를 위한 정보 dict
-                - title: 섹션 제목 (예: "SNVs & Indels")
-                - current_page: 현재 페이지 번호
-                - total_pages: 전체 페이지 수
-                - is_first: 첫 페이지 여부 (첫 페이지는 별도 렌더링되므로 제목 스킵)
-        """
-        final_margin = margin_left if margin_left else layout.margin
-        row_height = Cm(0.7)
-        header_height = Cm(0.8)
-
-        available_height = layout.bottom_limit - layout.top
-        
-        # [DEBUG]
-        from pptx.util import Length
-        avail_cm = Length(available_height).cm if isinstance(available_height, int) else available_height.cm
-        bottom_cm = Length(layout.bottom_limit).cm if isinstance(layout.bottom_limit, int) else layout.bottom_limit.cm
-        top_cm = Length(layout.top).cm if isinstance(layout.top, int) else layout.top.cm
-        
-        print(f"[DEBUG Layout] Table rendering start. Available Height: {avail_cm:.2f}cm (Bottom: {bottom_cm:.2f}cm - Top: {top_cm:.2f}cm)")
-
-        if available_height < (header_height + row_height):
-            print(f"[DEBUG Layout] Not enough space for header+1row. Adding new slide.")
-            layout.add_new_slide()
-            available_height = layout.bottom_limit - layout.top
-            avail_cm = Length(available_height).cm if isinstance(available_height, int) else available_height.cm
-
-        max_rows = int((available_height - header_height) / row_height)
-        print(f"[DEBUG Layout] Calculating max_rows: ({avail_cm:.2f} - {header_height.cm:.2f}) / {row_height.cm:.2f} = {max_rows}")
-
-        # 페이지 정보 초기화 (첫 호출 시)
-        if pagination_info is None:
-            total_pages = self._calculate_table_pages(layout, len(rows))
-            if total_pages > 1:
-                pagination_info = {
-                    "title": None,  # 호출자가 설정
-                    "current_page": 1,
-                    "total_pages": total_pages,
-                    "is_first": True
-                }
-
-        if max_rows >= len(rows):
-            # 마지막 페이지 또는 분할 없음
-            self._insert_cloned_table(layout, prototype_xml, rows, style_props, final_margin)
-        else:
-            current_batch = rows[:max_rows]
-            next_batch = rows[max_rows:]
-            self._insert_cloned_table(layout, prototype_xml, current_batch, style_props, final_margin)
-            layout.add_new_slide()
-            
-            # 다음 페이지 정보 업데이트 및 제목 렌더링
-            if pagination_info:
-                next_page = pagination_info["current_page"] + 1
-                total = pagination_info["total_pages"]
-                title = pagination_info.get("title")
-                
-                # 제목이 있으면 (n/N) 형식으로 렌더링
-                if title:
-                    title_with_page = f"{title} ({next_page}/{total})"
-                    self._render_section_header(layout, title_with_page)
-                
-                next_info = {
-                    "title": title,
-                    "current_page": next_page,
-                    "total_pages": total,
-                    "is_first": False
-                }
-            else:
-                next_info = None
-                
-            self._render_table_using_prototype(layout, prototype_xml, next_batch, style_props, 
-                                                margin_left=final_margin, pagination_info=next_info)
-
-    def _insert_cloned_table(self, layout, prototype_xml, rows, style_props, margin_left):
-        """add_table()로 네이티브 테이블 생성 후, 프로토타입 서식을 복사하여 적용.
+    def _insert_cloned_table(self, layout, prototype, rows, style_props, margin_left):
+        """add_table()로 네이티브 테이블 생성 후, 미리 준비된 프로토타입 행 템플릿으로 행을 구성.
         deep copy 방식 대신 사용하여 PowerPoint 행 삽입/삭제 호환성 확보."""
-        ns = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
-
-        # 1. 프로토타입에서 서식 정보 추출
-        proto_tbl = prototype_xml.find(f'.//{ns}tbl')
-        proto_tblGrid = proto_tbl.find(f'{ns}tblGrid')
-        proto_tblPr = proto_tbl.find(f'{ns}tblPr')
-        proto_rows = proto_tbl.findall(f'{ns}tr')
-
-        col_widths = [int(gc.get('w')) for gc in proto_tblGrid.findall(f'{ns}gridCol')]
-        header_row_height = int(proto_rows[0].get('h', '258360'))
-        data_row_height = int(proto_rows[1].get('h', '258360')) if len(proto_rows) > 1 else header_row_height
-
-        # 헤더/데이터 행의 셀 서식 추출 (tcPr, pPr, endParaRPr, bodyPr, rPr)
-        def _extract_cell_formats(tr):
-            tcPrs, pPrs, endParaRPrs, bodyPrs = [], [], [], []
-            for tc in tr.findall(f'{ns}tc'):
-                tcPr = tc.find(f'{ns}tcPr')
-                tcPrs.append(copy.deepcopy(tcPr) if tcPr is not None else None)
-                txBody = tc.find(f'{ns}txBody')
-                if txBody is not None:
-                    bodyPr = txBody.find(f'{ns}bodyPr')
-                    bodyPrs.append(copy.deepcopy(bodyPr) if bodyPr is not None else None)
-                    p = txBody.find(f'{ns}p')
-                    if p is not None:
-                        pPr = p.find(f'{ns}pPr')
-                        endParaRPr = p.find(f'{ns}endParaRPr')
-                        pPrs.append(copy.deepcopy(pPr) if pPr is not None else None)
-                        endParaRPrs.append(copy.deepcopy(endParaRPr) if endParaRPr is not None else None)
-                    else:
-                        pPrs.append(None)
-                        endParaRPrs.append(None)
-                else:
-                    bodyPrs.append(None)
-                    pPrs.append(None)
-                    endParaRPrs.append(None)
-            return tcPrs, pPrs, endParaRPrs, bodyPrs
-
-        header_tcPrs, header_pPrs, header_endParaRPrs, header_bodyPrs = _extract_cell_formats(proto_rows[0])
-        data_tcPrs, data_pPrs, data_endParaRPrs, data_bodyPrs = _extract_cell_formats(proto_rows[1]) if len(proto_rows) > 1 else ([], [], [], [])
-
-        # 헤더 행의 run properties 추출
-        header_rPrs = []
-        for tc in proto_rows[0].findall(f'{ns}tc'):
-            txBody = tc.find(f'{ns}txBody')
-            if txBody is not None:
-                p = txBody.find(f'{ns}p')
-                if p is not None:
-                    r = p.find(f'{ns}r')
-                    if r is not None:
-                        rPr = r.find(f'{ns}rPr')
-                        header_rPrs.append(copy.deepcopy(rPr) if rPr is not None else None)
-                    else:
-                        header_rPrs.append(None)
-                else:
-                    header_rPrs.append(None)
-            else:
-                header_rPrs.append(None)
+        ns = _A_NS
 
-        # 헤더 텍스트 추출
-        header_texts = []
-        for tc in proto_rows[0].findall(f'{ns}tc'):
-            txBody = tc.find(f'{ns}txBody')
-            text = ''
-            if txBody is not None:
-                for p in txBody.findall(f'{ns}p'):
-                    for r in p.findall(f'{ns}r'):
-                        t = r.find(f'{ns}t')
-                        if t is not None and t.text:
-                            text += t.text
-            header_texts.append(text)
-
-        # 2. add_table()로 네이티브 테이블 생성
-        total_width = sum(col_widths)
+        # 1. add_table()로 네이티브 테이블 생성 (행은 아래에서 템플릿 복사본으로 교체)
         num_rows = len(rows) + 1
-        num_cols = len(col_widths)
+        num_cols = prototype.num_cols
 
         shape = layout.current_slide.shapes.add_table(
-            num_rows, num_cols,
+            1, num_cols,
             int(margin_left), int(layout.top),
-            total_width, Cm(0.8 * num_rows)
+            prototype.total_width, Cm(0.8 * num_rows)
         )
         table = shape.table
         tbl = table._tbl
 
-        # 3. tblPr 교체 (프로토타입의 스타일-프리 tblPr로)
+        # 2. tblPr / tblGrid 교체 (프로토타입의 스타일-프리 tblPr, 열 폭)
         old_tblPr = tbl.find(f'{ns}tblPr')
         if old_tblPr is not None:
-            tbl.replace(old_tblPr, copy.deepcopy(proto_tblPr))
+            tbl.replace(old_tblPr, copy.deepcopy(prototype.tblPr))
 
-        # 4. tblGrid 교체 (프로토타입의 열 폭으로)
         old_tblGrid = tbl.find(f'{ns}tblGrid')
         if old_tblGrid is not None:
-            tbl.replace(old_tblGrid, copy.deepcopy(proto_tblGrid))
-
-        # 5. 각 행/셀에 서식 적용
-        for row_idx in range(num_rows):
-            tr = tbl.findall(f'{ns}tr')[row_idx]
-            if row_idx == 0:
-                tr.set('h', str(header_row_height))
-                tcPr_list, pPr_list, endParaRPr_list, bodyPr_list = header_tcPrs, header_pPrs, header_endParaRPrs, header_bodyPrs
-            else:
-                tr.set('h', str(data_row_height))
-                tcPr_list, pPr_list, endParaRPr_list, bodyPr_list = data_tcPrs, data_pPrs, data_endParaRPrs, data_bodyPrs
+            tbl.replace(old_tblGrid, copy.deepcopy(prototype.tblGrid))
 
-            for col_idx, tc in enumerate(tr.findall(f'{ns}tc')):
-                if col_idx >= len(tcPr_list):
-                    break
+        # 3. 행 구성: 서식/헤더 텍스트가 적용된 헤더 행 + 데이터 행 직접 생성
+        for tr in tbl.findall(f'{ns}tr'):
+            tbl.remove(tr)
+        tbl.append(copy.deepcopy(prototype.header_tr))
+        self._emit_data_rows(tbl, prototype, rows, style_props)
 
-                # tcPr 교체
-                old_tcPr = tc.find(f'{ns}tcPr')
-                if tcPr_list[col_idx] is not None:
-                    new_tcPr = copy.deepcopy(tcPr_list[col_idx])
-                    if old_tcPr is not None:
-                        tc.replace(old_tcPr, new_tcPr)
-                    else:
-                        tc.insert(0, new_tcPr)
-
-                # txBody 내부 서식 적용
-                txBody = tc.find(f'{ns}txBody')
-                if txBody is not None:
-                    # bodyPr 교체
-                    old_bodyPr = txBody.find(f'{ns}bodyPr')
-                    if col_idx < len(bodyPr_list) and bodyPr_list[col_idx] is not None:
-                        if old_bodyPr is not None:
-                            txBody.replace(old_bodyPr, copy.deepcopy(bodyPr_list[col_idx]))
-
-                    # 각 p 요소의 pPr, endParaRPr 교체
-                    for p in txBody.findall(f'{ns}p'):
-                        if col_idx < len(pPr_list) and pPr_list[col_idx] is not None:
-                            old_pPr = p.find(f'{ns}pPr')
-                            new_pPr = copy.deepcopy(pPr_list[col_idx])
-                            if old_pPr is not None:
-                                p.replace(old_pPr, new_pPr)
-                            else:
-                                p.insert(0, new_pPr)
-
-                        if col_idx < len(endParaRPr_list) and endParaRPr_list[col_idx] is not None:
-                            old_endParaRPr = p.find(f'{ns}endParaRPr')
-                            new_endParaRPr = copy.deepcopy(endParaRPr_list[col_idx])
-                            if old_endParaRPr is not None:
-                                p.replace(old_endParaRPr, new_endParaRPr)
-                            else:
-                                p.append(new_endParaRPr)
-
-        # 6. 헤더 텍스트 채우기 (프로토타입의 rPr 사용)
-        for c_idx, header_text in enumerate(header_texts):
-            if c_idx >= num_cols:
-                break
-            cell = table.cell(0, c_idx)
-            p = cell.text_frame.paragraphs[0]
-
-            # 기존 run 제거
-            for r in list(p._p.findall(f'{ns}r')):
-                p._p.remove(r)
+        # 4. 프레임 높이를 실제 테이블 높이와 동기화
+        table_height = Emu(prototype.header_row_height + prototype.data_row_height * len(rows))
+        shape.height = int(table_height)
+        layout.add_space(table_height + self.config.SPACE_TABLE_BOTTOM)
 
-            # 새 run 생성 (endParaRPr 앞에 삽입하여 OOXML 순서 준수)
-            new_r = etree.Element(f'{ns}r')
-            endParaRPr = p._p.find(f'{ns}endParaRPr')
-            if endParaRPr is not None:
-                endParaRPr.addprevious(new_r)
-            else:
-                p._p.append(new_r)
+    def _build_data_cell_templates(self, prototype, style_props):
+        """
+        데이터 셀 템플릿 목록 [(빈 셀, 텍스트가 채워질 셀)]을 만듭니다.
+        프로토타입 데이터 행의 각 셀에 _set_cell_text_preserving_style을 한 번 적용해 두므로
+        (빈 텍스트) 이후 행마다 같은 서식의 run을 다시 만들 필요가 없습니다.
+        """
+        templates = []
+        for empty_tc in prototype.data_tr.findall(f'{_A_NS}tc'):
+            filled_tc = copy.deepcopy(empty_tc)
+            self._set_cell_text_preserving_style(
+                _Cell(filled_tc, None),
+                "",
+                is_bold=style_props['bold'],
+                font_color=style_props['color'],
+                font_size=Pt(8)
+            )
+            templates.append((empty_tc, filled_tc))
+        return templates
 
-            if c_idx < len(header_rPrs) and header_rPrs[c_idx] is not None:
-                new_r.append(copy.deepcopy(header_rPrs[c_idx]))
+    def _emit_data_rows(self, tbl, prototype, rows, style_props):
+        """
+        데이터 행을 python-pptx 셀 API 없이 lxml로 직접 생성합니다.
+        셀마다 _set_cell_text_preserving_style을 호출한 결과와 바이트 단위로 같은 XML을 만듭니다.
+        (텍스트는 a:t에 그대로 넣으므로 &, <, > 등은 직렬화 시 이스케이프되고, 제어 문자는 python-pptx와 같은 _xHHHH_ 형식으로 변환)
+        """
+        ns = _A_NS
+        text_path = f'{ns}txBody/{ns}p/{ns}r/{ns}t'  # _set_cell_text_preserving_style이 만든 run의 a:t
+        cell_templates = self._build_data_cell_templates(prototype, style_props)
+        num_cols = len(cell_templates)
+        escape = CT_RegularTextRun._escape_ctrl_chars
+
+        # 셀이 없는 행 껍데기 (프로토타입 행의 속성 유지)
+        row_shell = copy.deepcopy(prototype.data_tr)
+        for tc in row_shell.findall(f'{ns}tc'):
+            row_shell.remove(tc)
+
+        # 모든 열이 채워지는 일반적인 행은 행 전체를 한 번에 복사
+        full_row = copy.deepcopy(row_shell)
+        for _, filled_tc in cell_templates:
+            full_row.append(copy.deepcopy(filled_tc))
+
+        for row_data in rows:
+            if len(row_data) >= num_cols:
+                tr = copy.deepcopy(full_row)
+                for tc, val in zip(tr.findall(f'{ns}tc'), row_data):
+                    tc.find(text_path).text = escape(str(val))
             else:
-                rPr = etree.SubElement(new_r, f'{ns}rPr')
-                rPr.set('lang', 'en-US')
-                rPr.set('sz', '800')
-                rPr.set('b', '1')
-
-            new_t = etree.SubElement(new_r, f'{ns}t')
-            new_t.text = header_text
-
-        # 7. 데이터 텍스트 채우기
-        for r_idx, row_data in enumerate(rows):
-            target_row = table.rows[r_idx + 1]
-            for c_idx, val in enumerate(row_data):
-                if c_idx < len(target_row.cells):
-                    self._set_cell_text_preserving_style(
-                        target_row.cells[c_idx],
-                        str(val),
-                        is_bold=style_props['bold'],
-                        font_color=style_props['color'],
-                        font_size=Pt(8)
-                    )
-
-        # 8. 프레임 높이를 실제 테이블 높이와 동기화
-        table_height = sum([row.height for row in table.rows])
-        shape.height = int(table_height)
-        layout.add_space(table_height + self.config.SPACE_TABLE_BOTTOM)
+                # 값이 모자란 행: 남는 열은 서식만 있는 빈 셀
+                tr = copy.deepcopy(row_shell)
+                for c_idx, (empty_tc, filled_tc) in enumerate(cell_templates):
+                    if c_idx < len(row_data):
+                        tc = copy.deepcopy(filled_tc)
+                        tc.find(text_path).text = escape(str(row_data[c_idx]))
+                    else:
+                        tc = copy.deepcopy(empty_tc)
+                    tr.append(tc)
+            tbl.append(tr)
 
     def _set_cell_text_preserving_style(self, cell, text, is_bold=False, font_color=None, font_size=None):
         """텍스트 입력 전 기존 내용을 초기화하여 중복/깨짐 방지"""
@@ -1650,18 +2107,9 @@ class NGS_PPT_Generator:
 
         p.alignment = PP_ALIGN.CENTER
 
-        run = p.add_run()
-        run.font.name = self.config.FONT_NAME
-        
         # [Changed] font_size 파라미터가 있으면 사용, 없으면 Default Body Size (9pt)
-        if font_size:
-            run.font.size = font_size
-        else:
-            run.font.size = self.config.FONT_SIZE_BODY
-
-        run.font.bold = is_bold
-        if font_color: run.font.color.rgb = font_color
-        run.text = text
+        run_styles.apply(p.add_run(), text, font_size=font_size or self.config.FONT_SIZE_BODY,
+                         bold=is_bold, color=font_color or None)
 
     def _duplicate_last_row(self, table):
         new_row = copy.deepcopy(table._tbl.tr_lst[-1])
@@ -1704,51 +2152,37 @@ class NGS_PPT_Generator:
 
         layout.add_space(table_height + self.config.SPACE_TABLE_BOTTOM)
 
-    def _search_and_fill_cell_below(self, tables, target_label, value, font_size=None):
-        clean_target = target_label.replace(" ", "").lower()
+    def _fill_value_cell(self, target_cell, value, font_size=None):
+        """라벨 아래 값 셀 채우기 (셀에 있던 단위 텍스트는 값 뒤에 유지)"""
+        # 기존 텍스트(단위) 가져오기 (예: "/Megabase")
+        original_text = target_cell.text_frame.text.strip()
 
-        for table in tables:
-            for r_idx, row in enumerate(table.rows):
-                for c_idx, cell in enumerate(row.cells):
-                    cell_text = cell.text_frame.text.replace(" ", "").lower()
+        # 입력할 값 문자열 정리
+        val_str = str(value).strip() if value is not None else ""
 
-                    if clean_target in cell_text:
-                        try:
-                            if r_idx + 1 < len(table.rows):
-                                target_cell = table.cell(r_idx + 1, c_idx)
-
-                                # 기존 텍스트(단위) 가져오기 (예: "/Megabase")
-                                original_text = target_cell.text_frame.text.strip()
-                                
-                                # 입력할 값 문자열 정리
-                                val_str = str(value).strip() if value is not None else ""
-
-                                if val_str:
-                                    # 1. 데이터(val_str) 안에 이미 단위(original_text)가 들어있는 경우
-                                    if original_text and original_text in val_str:
-                                        final_text = val_str
-
-                                    # 2. 데이터에 단위가 없는 경우 (숫자만 있는 경우)
-                                    elif original_text:
-                                        final_text = f"{val_str} {original_text}"
-
-                                    # 3. 기존 단위가 아예 없는 셀인 경우
-                                    else:
-                                        final_text = val_str
-                                else:
-                                    # 값이 없으면 기존 단위 유지
-                                    final_text = original_text
-
-                                # 스타일 적용하여 입력
-                                self._set_cell_text_preserving_style(
-                                    target_cell,
-                                    final_text,
-                                    is_bold=True,
-                                    font_size=font_size
-                                )
-                                return
-                        except Exception as e:
-                            print(f"Warning: Failed to fill {target_label} - {e}")
+        if val_str:
+            # 1. 데이터(val_str) 안에 이미 단위(original_text)가 들어있는 경우
+            if original_text and original_text in val_str:
+                final_text = val_str
+
+            # 2. 데이터에 단위가 없는 경우 (숫자만 있는 경우)
+            elif original_text:
+                final_text = f"{val_str} {original_text}"
+
+            # 3. 기존 단위가 아예 없는 셀인 경우
+            else:
+                final_text = val_str
+        else:
+            # 값이 없으면 기존 단위 유지
+            final_text = original_text
+
+        # 스타일 적용하여 입력
+        self._set_cell_text_preserving_style(
+            target_cell,
+            final_text,
+            is_bold=True,
+            font_size=font_size
+        )
 
     def _draw_failed_gene(self, layout, failed_gene_text):
         """3. Failed gene 섹션을 그립니다."""
@@ -1770,21 +2204,17 @@ class NGS_PPT_Generator:
         
         layout.add_space(height + self.config.SPACE_SECTION)
 
-    def _get_text_lines(self, text, chars_per_line=130):
-        import unicodedata
-        if not text:
-            return 0
-        total_lines = 0
-        for line in text.split('\n'):
-            w = sum(2 if unicodedata.east_asian_width(c) in 'WF' else 1 for c in line)
-            total_lines += int(w // chars_per_line) + 1
-        return total_lines
-
-    def _draw_comments(self, layout, comments, highlight_keywords=None):
+    def _get_text_lines(self, text):
+        """Comment 박스 안에서 text가 차지하는 줄 수 (글리프 폭 기반 줄바꿈 측정)"""
+        text_width = Emu(self.config.COMMENT_BOX_WIDTH - self.config.COMMENT_BOX_MARGIN * 2)
+        return text_metrics.count_lines(
+            text, self.config.COMMENT_FONT_SIZE.pt, text_width.pt * self.config.COMMENT_WIDTH_FILL
+        )
+
+    def _draw_comments(self, layout, comments, highlight_pattern=None):
         """Comments 섹션과 하단 고지문을 통합하여 그립니다."""
         # 상수 정의 (총 페이지 계산에 필요)
         LINE_HEIGHT = Cm(0.45) # 8pt font + 1.5 line spacing
-        CHARS_PER_LINE = 130
         FOOTER_TOP = Cm(23.49)
         BODY_BOTTOM_LIMIT = FOOTER_TOP - Cm(0.5)
         if layout.bottom_limit < BODY_BOTTOM_LIMIT:
@@ -1799,7 +2229,7 @@ class NGS_PPT_Generator:
             "of the Association for Molecular Pathology, American Society of Clinical Oncology and College of American Pathologists. "
             "J Mol Diagn. 2017; 19(1):4-23."
         )
-        DISCLAIMER_MAIN_HEIGHT = (self._get_text_lines(disclaimer_main, CHARS_PER_LINE) * LINE_HEIGHT) + Cm(0.5) + LINE_HEIGHT
+        DISCLAIMER_MAIN_HEIGHT = (self._get_text_lines(disclaimer_main) * LINE_HEIGHT) + Cm(0.5) + LINE_HEIGHT
 
         # 총 페이지 수 미리 계산
         if not comments:
@@ -1813,7 +2243,7 @@ class NGS_PPT_Generator:
         first_content_height = 0
         if comments_list:
             first_comment = comments_list[0]
-            lines = self._get_text_lines(first_comment, CHARS_PER_LINE)
+            lines = self._get_text_lines(first_comment)
             first_content_height = (lines * LINE_HEIGHT) + Cm(0.2) + LINE_HEIGHT
         else:
             first_content_height = DISCLAIMER_MAIN_HEIGHT
@@ -1825,7 +2255,7 @@ class NGS_PPT_Generator:
             layout.add_new_slide()
             
         total_pages = self._calculate_comment_pages(
-            layout, comments_list, BODY_BOTTOM_LIMIT, LINE_HEIGHT, CHARS_PER_LINE, DISCLAIMER_MAIN_HEIGHT
+            layout, comments_list, BODY_BOTTOM_LIMIT, LINE_HEIGHT, DISCLAIMER_MAIN_HEIGHT
         )
         
         # 1. 첫 페이지 헤더 그리기 (분할 시 (1/N) 형식)
@@ -1833,7 +2263,7 @@ class NGS_PPT_Generator:
         self._draw_comment_header(layout, page_info=page_info)
 
         # 2. 통합 콘텐츠 그리기 (코멘트 + 고지문)
-        self._draw_merged_content(layout, comments, highlight_keywords)
+        self._draw_merged_content(layout, comments, highlight_pattern)
 
     def _draw_comment_header(self, layout, page_info=None):
         """Comments 헤더를 그립니다.
@@ -1845,7 +2275,7 @@ class NGS_PPT_Generator:
         layout.check_space(header_height)
         
         # 박스와 동일한 좌측 여백 계산 (페이지 중앙 정렬)
-        BOX_WIDTH = Cm(17.55)
+        BOX_WIDTH = self.config.COMMENT_BOX_WIDTH
         slide_width = layout.prs.slide_width
         left_position = (slide_width - BOX_WIDTH) / 2
         
@@ -1862,7 +2292,7 @@ class NGS_PPT_Generator:
                             font_size=self.config.FONT_SIZE_TITLE, color=self.config.COLOR_BLACK)
         layout.add_space(header_height)
 
-    def _draw_merged_content(self, layout, comments, highlight_keywords):
+    def _draw_merged_content(self, layout, comments, highlight_pattern):
         if not comments:
             comments = [] 
 
@@ -1871,8 +2301,7 @@ class NGS_PPT_Generator:
 
         # 상수 정의
         LINE_HEIGHT = Cm(0.45)
-        CHARS_PER_LINE = 130
-        BOX_WIDTH = Cm(17.55)
+        BOX_WIDTH = self.config.COMMENT_BOX_WIDTH
         
         # 하단 Footer (Raw Data 등) 위치
         FOOTER_TOP = Cm(23.49)
@@ -1891,11 +2320,11 @@ class NGS_PPT_Generator:
             "of the Association for Molecular Pathology, American Society of Clinical Oncology and College of American Pathologists. "
             "J Mol Diagn. 2017; 19(1):4-23."
         )
-        DISCLAIMER_MAIN_HEIGHT = (self._get_text_lines(disclaimer_main, CHARS_PER_LINE) * LINE_HEIGHT) + Cm(0.5) + LINE_HEIGHT
+        DISCLAIMER_MAIN_HEIGHT = (self._get_text_lines(disclaimer_main) * LINE_HEIGHT) + Cm(0.5) + LINE_HEIGHT
         
         # 총 페이지 수 미리 계산
         total_pages = self._calculate_comment_pages(
-            layout, comments, BODY_BOTTOM_LIMIT, LINE_HEIGHT, CHARS_PER_LINE, DISCLAIMER_MAIN_HEIGHT
+            layout, comments, BODY_BOTTOM_LIMIT, LINE_HEIGHT, DISCLAIMER_MAIN_HEIGHT
         )
         current_page = 1
         
@@ -1904,13 +2333,13 @@ class NGS_PPT_Generator:
         
         # 코멘트 배치 루프
         for idx, comment in enumerate(comments):
-            lines = self._get_text_lines(comment, CHARS_PER_LINE)
+            lines = self._get_text_lines(comment)
             est_height = (lines * LINE_HEIGHT) + Cm(0.2) + LINE_HEIGHT
             
             # 공간 체크 (Footer 영역 침범 확인)
             if (layout.top + current_batch_height + est_height) > BODY_BOTTOM_LIMIT:
                  # 넘치면 현재 배치 그리기 (중간 페이지에는 footer 미포함)
-                 self._render_box(layout, current_batch, current_batch_height, BOX_WIDTH, highlight_keywords, main_disclaimer=None)
+                 self._render_box(layout, current_batch, current_batch_height, BOX_WIDTH, highlight_pattern, main_disclaimer=None)
                  
                  # 다음 페이지 이동
                  layout.add_new_slide()
@@ -1925,19 +2354,19 @@ class NGS_PPT_Generator:
 
         # 마지막 배치 및 Main Disclaimer 처리
         if (layout.top + current_batch_height + DISCLAIMER_MAIN_HEIGHT) <= BODY_BOTTOM_LIMIT:
-            self._render_box(layout, current_batch, current_batch_height + DISCLAIMER_MAIN_HEIGHT, BOX_WIDTH, highlight_keywords, main_disclaimer=disclaimer_main)
+            self._render_box(layout, current_batch, current_batch_height + DISCLAIMER_MAIN_HEIGHT, BOX_WIDTH, highlight_pattern, main_disclaimer=disclaimer_main)
             self._draw_footer_info(layout, FOOTER_TOP)
         else:
             if current_batch:
-                self._render_box(layout, current_batch, current_batch_height, BOX_WIDTH, highlight_keywords, main_disclaimer=None)
+                self._render_box(layout, current_batch, current_batch_height, BOX_WIDTH, highlight_pattern, main_disclaimer=None)
             
             layout.add_new_slide()
             current_page += 1
             self._draw_comment_header(layout, page_info=(current_page, total_pages))
-            self._render_box(layout, [], DISCLAIMER_MAIN_HEIGHT, BOX_WIDTH, highlight_keywords, main_disclaimer=disclaimer_main)
+            self._render_box(layout, [], DISCLAIMER_MAIN_HEIGHT, BOX_WIDTH, highlight_pattern, main_disclaimer=disclaimer_main)
             self._draw_footer_info(layout, FOOTER_TOP)
 
-    def _calculate_comment_pages(self, layout, comments, body_limit, line_height, chars_per_line, disclaimer_height):
+    def _calculate_comment_pages(self, layout, comments, body_limit, line_height, disclaimer_height):
         """Comment 섹션이 몇 페이지에 걸칠지 미리 계산합니다."""
         if not comments:
             return 1
@@ -1947,7 +2376,7 @@ class NGS_PPT_Generator:
         current_batch_height = 0
         
         for comment in comments:
-            lines = self._get_text_lines(comment, chars_per_line)
+            lines = self._get_text_lines(comment)
             est_height = (lines * line_height) + Cm(0.2) + line_height
             
             if (current_top + current_batch_height + est_height) > body_limit:
@@ -1964,7 +2393,7 @@ class NGS_PPT_Generator:
         return page_count
 
 
-    def _render_box(self, layout, comments_batch, height, width, highlight_keywords, main_disclaimer=None):
+    def _render_box(self, layout, comments_batch, height, width, highlight_pattern, main_disclaimer=None):
         if not comments_batch and not main_disclaimer:
             return
 
@@ -1984,12 +2413,11 @@ class NGS_PPT_Generator:
         
         tf = tb.text_frame
         tf.word_wrap = True
-        tf.margin_top = Cm(0.2)
-        tf.margin_bottom = Cm(0.2)
-        tf.margin_left = Cm(0.2)
-        tf.margin_right = Cm(0.2)
+        tf.margin_top = self.config.COMMENT_BOX_MARGIN
+        tf.margin_bottom = self.config.COMMENT_BOX_MARGIN
+        tf.margin_left = self.config.COMMENT_BOX_MARGIN
+        tf.margin_right = self.config.COMMENT_BOX_MARGIN
         
-        import re
         is_first_paragraph = True
         
         # 코멘트 그리기
@@ -2012,40 +2440,33 @@ class NGS_PPT_Generator:
             p.line_spacing = 1.5 # [Changed] 줄 간격 1.5
             
             
-            matched = False
-            if highlight_keywords:
-                keywords_sorted = sorted(highlight_keywords, key=len, reverse=True)
-                for kw in keywords_sorted:
-                    if kw in comment:
-                         parts = re.split(f"({re.escape(kw)})", comment)
-                         for part in parts:
-                             is_bold_part = (part == kw)
-                             run = p.add_run()
-                             self._set_run_style(run, part, is_bold=is_bold_part,
-                                                 font_size=Pt(8), color=self.config.COLOR_BLACK)
-                             self._apply_theme_body_latin(run)
-                         matched = True
-                         break
-
-            if not matched:
+            # 키워드가 나오는 모든 위치를 한 번의 탐색으로 찾아 굵게 처리
+            matches = list(highlight_pattern.finditer(comment)) if highlight_pattern else []
+            if matches:
+                pos = 0
+                for m in matches:
+                    for part, is_bold_part in ((comment[pos:m.start()], False), (m.group(), True)):
+                        if not part:
+                            continue
+                        self._set_run_style(p.add_run(), part, is_bold=is_bold_part, font_size=Pt(8),
+                                            color=self.config.COLOR_BLACK, theme_body=True)
+                    pos = m.end()
+                if pos < len(comment):
+                    self._set_run_style(p.add_run(), comment[pos:], is_bold=False, font_size=Pt(8),
+                                        color=self.config.COLOR_BLACK, theme_body=True)
+            else:
                 match_col = re.match(r"^([^:]+)(:)(.*)$", comment, re.DOTALL)
                 if match_col:
                     subject = match_col.group(1)
                     colon = match_col.group(2)
                     rest = match_col.group(3)
-                    run_subj = p.add_run()
-                    self._set_run_style(run_subj, subject, is_bold=True,
-                                        font_size=Pt(8), color=self.config.COLOR_BLACK)
-                    self._apply_theme_body_latin(run_subj)
-                    run_rest = p.add_run()
-                    self._set_run_style(run_rest, colon + rest, is_bold=False,
-                                        font_size=Pt(8), color=self.config.COLOR_BLACK)
-                    self._apply_theme_body_latin(run_rest)
+                    self._set_run_style(p.add_run(), subject, is_bold=True, font_size=Pt(8),
+                                        color=self.config.COLOR_BLACK, theme_body=True)
+                    self._set_run_style(p.add_run(), colon + rest, is_bold=False, font_size=Pt(8),
+                                        color=self.config.COLOR_BLACK, theme_body=True)
                 else:
-                    run_plain = p.add_run()
-                    self._set_run_style(run_plain, comment, is_bold=False,
-                                        font_size=Pt(8), color=self.config.COLOR_BLACK)
-                    self._apply_theme_body_latin(run_plain)
+                    self._set_run_style(p.add_run(), comment, is_bold=False, font_size=Pt(8),
+                                        color=self.config.COLOR_BLACK, theme_body=True)
         
         # 메인 고지문 추가
         if main_disclaimer:
@@ -2089,9 +2510,9 @@ class NGS_PPT_Generator:
         p2.space_before = Pt(6)
         self._set_run_style(p2.add_run(), footer_text_2, font_size=Pt(8), color=self.config.COLOR_BLACK)
 
-    def _fill_footer_info(self, slide, report_data):
+    def _fill_footer_info(self, slide, report_data, anchors: TemplateAnchors):
         """
-        마지막 페이지의 템플릿 요소(TextBox, Table)를 찾아 Footer 정보를 기입합니다.
+        마지막 페이지의 템플릿 요소(TextBox, Table)에 Footer 정보를 기입합니다.
         - 분자 접수 번호: 테이블 (Row 0, Col 1)
         - Tested by, Analyzed by, Signed by: 텍스트 박스 (기존 텍스트 뒤에 Append)
         """
@@ -2107,51 +2528,41 @@ class NGS_PPT_Generator:
             "Signed by:": diagnosis_user.get('Signed by', '')
         }
 
-        for shape in slide.shapes:
-            # 1. 텍스트 박스 처리 (Tested by, Analyzed by, Signed by)
-            if shape.has_text_frame:
-                text = shape.text_frame.text.strip()
-                for key, value in user_info_map.items():
-                    # 키워드가 포함되어 있고, 아직 값이 채워지지 않은 경우(길이 체크 등)
-                    if key in text and value:
-                        # 이미 값이 들어있는지 확인 (중복 방지)
-                        if value in text: 
-                            continue
+        shapes_by_id = _shapes_by_id(slide)
 
-                        # 스타일(폰트, 사이즈)을 유지하며 추가하기 위해 Run 추가
-                        p = shape.text_frame.paragraphs[0]
-                        run = p.add_run()
-                        run.text = f" {value}"
-                        run.font.name = self.config.FONT_NAME
-                        # 기존 텍스트의 폰트 크기를 따라가거나, 기본 Body 사이즈 적용
-                        # 여기서는 Body 사이즈 적용
-                        from pptx.util import Pt
-                        run.font.size = Pt(12)
-                        run.font.bold = False
+        # 1. 텍스트 박스 처리 (Tested by, Analyzed by, Signed by)
+        for shape_id, key in anchors.footer_texts:
+            value = user_info_map.get(key)
+            if not value:
+                continue
 
+            text_frame = shapes_by_id[shape_id].text_frame
+            # 이미 값이 들어있는지 확인 (중복 방지)
+            if value in text_frame.text.strip():
+                continue
 
-            elif shape.has_table:
-                tbl = shape.table
-                try:
-                    # (0, 0) 셀이 "분자 접수 번호" 인지 확인
-                    if len(tbl.rows) > 0 and len(tbl.rows[0].cells) > 0:
-                        header_text = tbl.rows[0].cells[0].text_frame.text.strip()
-                        if "분자 접수 번호" in header_text or "분자접수번호" in header_text:
-                            if len(tbl.rows[0].cells) > 1:
-                                target_cell = tbl.rows[0].cells[1]
-                                self._set_cell_text_preserving_style(
-                                    target_cell, 
-                                    str(receipt_no), 
-                                    is_bold=True, # [Changed] Bold 처리 (사용자 요청)
-                                    font_color=self.config.COLOR_BLACK
-                                )
-                except Exception as e:
-                    print(f"Footer table update error: {e}")
+            # 스타일(폰트, 사이즈)을 유지하며 추가하기 위해 Run 추가
+            run = text_frame.paragraphs[0].add_run()
+            run.text = f" {value}"
+            run.font.name = self.config.FONT_NAME
+            # 기존 텍스트의 폰트 크기를 따라가거나, 기본 Body 사이즈 적용
+            # 여기서는 Body 사이즈 적용
+            run.font.size = Pt(12)
+            run.font.bold = False
+
+        # 2. 분자 접수 번호
+        for shape_id, row, col in anchors.receipt_cells:
+            self._set_cell_text_preserving_style(
+                shapes_by_id[shape_id].table.cell(row, col),
+                str(receipt_no),
+                is_bold=True, # [Changed] Bold 처리 (사용자 요청)
+                font_color=self.config.COLOR_BLACK
+            )
 
-    def _fill_diagnostic_info(self, prs, report_data):
+    def _fill_diagnostic_info(self, prs, report_data, anchors: TemplateAnchors):
         """
-        '검사기기' 정보를 찾아 기입합니다.
-        검사정보 섹션의 텍스트 박스(예: '검사기기 :')를 찾아 뒤에 값을 이어 붙입니다.
+        '검사기기' 정보를 기입합니다.
+        검사정보 섹션의 텍스트 박스(예: '검사기기 :') 문단 뒤에 값을 이어 붙입니다.
         """
         diag_info = report_data.get('diagnostic_info', {})
         target_value = diag_info.get('검사기기', '')
@@ -2159,26 +2570,28 @@ class NGS_PPT_Generator:
         if not target_value:
             return
 
-        # 모든 슬라이드에서 검색 (위치가 명확하지 않으므로 안전하게 전체 검색)
-        for slide in prs.slides:
-            for shape in slide.shapes:
-                if shape.has_text_frame:
-                    for p in shape.text_frame.paragraphs:
-                        # "검사기기" 키워드 포함 여부 확인
-                        if "검사기기" in p.text:
-                            # 이미 값이 들어있는지 확인 (중복 기입 방지)
-                            if target_value in p.text:
-                                continue
-                            
-                            # 값 추가 (공백 한 칸 + 값)
-                            run = p.add_run()
-                            run.text = f" {target_value}"
-                            run.font.name = self.config.FONT_NAME
-                            # 기존 텍스트 스타일을 따라가거나 명시적 설정
-                            # 사용자가 10pt를 요청함 (기본 Body는 9pt이나 이 섹션은 10pt가 적절해 보임)
-                            from pptx.util import Pt
-                            run.font.size = Pt(10)
-                            run.font.bold = False # 값 부분은 Bold 아님 (HTML 참조: span만 label 클래스)
-                            
-                            # 하나 찾으면 종료 (일반적으로 하나만 존재)
-                            return
+        slide_index, shape_id, p_idx = anchors.diagnostic
+        shape = _shapes_by_id(prs.slides[slide_index])[shape_id]
+        p = shape.text_frame.paragraphs[p_idx]
+
+        # 이미 값이 들어있는지 확인 (중복 기입 방지)
+        if target_value in p.text:
+            return
+
+        # 값 추가 (공백 한 칸 + 값)
+        run = p.add_run()
+        run.text = f" {target_value}"
+        run.font.name = self.config.FONT_NAME
+        # 기존 텍스트 스타일을 따라가거나 명시적 설정
+        # 사용자가 10pt를 요청함 (기본 Body는 9pt이나 이 섹션은 10pt가 적절해 보임)
+        run.font.size = Pt(10)
+        run.font.bold = False # 값 부분은 Bold 아님 (HTML 참조: span만 label 클래스)
+
+
+# 템플릿은 프로세스당 한 번만 로드하고 렌더링마다 복제본 사용
+# 테마의 majorFont/minorFont가 동일하면 PowerPoint UI에서 "+본문"/"+제목" 구분 불가하므로
+# 로드 시 원본에 테마 폰트 보정을 한 번 적용해 둠
+template_cache = TemplateCache(
+    os.path.join(_BASE_DIR, "resources"),
+    prepare=NGS_PPT_Generator._fix_theme_font_distinction
+)
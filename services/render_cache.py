@@ -0,0 +1,249 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger("app")
+
+
+def compute_render_key(report_data: dict, template_version: str, renderer_version: str) -> str:
+    """
+    렌더링 결과를 식별하는 콘텐츠 주소 키.
+    보고서 데이터(정규화된 JSON) + 템플릿 파일 해시 + 렌더러 버전이 같으면 결과도 같습니다.
+    """
+    payload = json.dumps(report_data, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    digest = hashlib.sha256()
+    digest.update(renderer_version.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(template_version.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(payload.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    렌더링된 PPTX를 디스크에 키(해시) 단위로 저장하는 캐시.
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다(LRU).
+    """
+
+    SUFFIX = ".pptx"
+    TEMP_PREFIX = ".tmp_"
+    STALE_TEMP_SECONDS = 3600  # 렌더 워커가 중간에 종료되어 남은 임시 파일 정리 기준
+    TEMP_SWEEP_INTERVAL_SECONDS = 600  # new_temp_path()에서 남은 임시 파일을 정리하는 최소 간격
+    HASH_CHUNK_SIZE = 256 * 1024
+
+    def __init__(self, cache_dir, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = None  # OrderedDict {key: size}, 오래된 순서
+        self._total = 0
+        self._digests = {}  # {key: 결과 PPTX의 SHA-256}, 등록 시(워커가 계산한 값) 또는 content_hash()에서 채움
+        self._last_temp_sweep = None
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{self.SUFFIX}"
+
+    def _ensure_index(self):
+        """처음 사용할 때 디스크의 기존 캐시 파일로 LRU 인덱스를 구성 (최근 접근 시각 순)"""
+        if self._index is not None:
+            return
+        entries = []
+        if self.cache_dir.exists():
+            self._remove_stale_temps()
+            for path in self.cache_dir.glob(f"*/*{self.SUFFIX}"):
+                if path.name.startswith(self.TEMP_PREFIX):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path.name[:-len(self.SUFFIX)], stat.st_size))
+        entries.sort()
+        self._index = OrderedDict((key, size) for _, key, size in entries)
+        self._total = sum(self._index.values())
+
+    def _lookup(self, key: str):
+        """(잠금 안에서 호출) 항목이 있으면 LRU 순서를 갱신하고 경로를, 없으면 None"""
+        self._ensure_index()
+        if key not in self._index:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            self._forget(key)
+            return None
+        self._index.move_to_end(key)
+        # 재시작 후에도 LRU 순서가 유지되도록 접근 시각 기록
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def _forget(self, key: str):
+        self._total -= self._index.pop(key)
+        self._digests.pop(key, None)
+
+    def contains(self, key: str) -> bool:
+        """
+        캐시에 항목이 있는지만 확인 (상태 조회용).
+        get()/open()과 달리 LRU 순서와 파일 접근 시각을 갱신하지 않으므로, 상태 폴링이 항목을 '사용'한 것으로 치지 않습니다.
+        """
+        with self._lock:
+            self._ensure_index()
+            return key in self._index
+
+    def get(self, key: str):
+        """캐시 적중 시 파일 경로, 없으면 None (존재 확인용, 파일을 읽을 때는 open() 사용)"""
+        with self._lock:
+            return self._lookup(key)
+
+    def open(self, key: str):
+        """
+        캐시 적중 시 읽기용으로 연 파일 객체, 없으면 None.
+        LRU 정리와 같은 잠금 안에서 열기 때문에, 반환된 뒤 다른 요청이 이 항목을 정리해도 끝까지 읽을 수 있습니다.
+        (경로를 받아 나중에 열면 그 사이에 삭제될 수 있음)
+        """
+        with self._lock:
+            path = self._lookup(key)
+            if path is None:
+                return None
+            try:
+                return open(path, "rb")
+            except FileNotFoundError:
+                self._forget(key)
+                return None
+
+    def content_hash(self, key: str):
+        """
+        캐시된 PPTX 파일의 SHA-256 (hex). 항목이 없으면 None.
+        렌더링 결과는 바이트 단위로 결정적이므로 같은 키의 해시는 바뀌지 않아 키별로 한 번만 계산합니다.
+        새로 렌더링한 결과는 등록 시 받은 해시를 쓰고, 재시작 전부터 있던 캐시 파일만 처음 요청 시 읽어서 계산합니다
+        (파일 전체를 읽으므로 이벤트 루프에서는 스레드로 호출).
+        """
+        with self._lock:
+            digest = self._digests.get(key)
+        if digest is not None:
+            return digest
+
+        path = self.get(key)
+        if path is None:
+            return None
+        sha256 = hashlib.sha256()
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b""):
+                    sha256.update(chunk)
+        except FileNotFoundError:
+            return None
+        digest = sha256.hexdigest()
+
+        with self._lock:
+            if key in self._index:
+                self._digests[key] = digest
+        return digest
+
+    def _remove_stale_temps(self):
+        cutoff = time.time() - self.STALE_TEMP_SECONDS
+        for path in self.cache_dir.glob(f"{self.TEMP_PREFIX}*{self.SUFFIX}"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+    def new_temp_path(self) -> Path:
+        """
+        렌더 워커가 결과를 바로 기록할 임시 파일 경로 (캐시 디렉토리 안, 인덱스 대상 아님).
+        기록이 끝나면 부모 프로세스가 adopt()로 캐시에 등록합니다.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # 등록되지 못한 임시 파일(비정상 종료 등)이 쌓이지 않도록 주기적으로 정리 (인덱스/max_bytes 대상이 아님)
+        now = time.monotonic()
+        if self._last_temp_sweep is None or now - self._last_temp_sweep >= self.TEMP_SWEEP_INTERVAL_SECONDS:
+            self._last_temp_sweep = now
+            self._remove_stale_temps()
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=self.TEMP_PREFIX, suffix=self.SUFFIX)
+        os.close(fd)
+        return Path(tmp_path)
+
+    def put(self, key: str, data: bytes) -> Path:
+        """렌더링 결과를 원자적으로 저장하고 경로를 반환"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=self.TEMP_PREFIX, suffix=self.SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._register(key, len(data), hashlib.sha256(data).hexdigest())
+        return path
+
+    def adopt(self, key: str, tmp_path, content_hash: str = None) -> Path:
+        """
+        new_temp_path()에 기록된 렌더링 결과를 (복사 없이 이동하여) 캐시에 등록하고 경로를 반환
+        content_hash: 렌더 워커가 저장하면서 계산한 SHA-256 (없으면 content_hash() 첫 호출 시 계산)
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._register(key, size, content_hash)
+        return path
+
+    def adopt_open(self, key: str, tmp_path, content_hash: str = None):
+        """adopt()와 같되, 등록 전에 연 파일 객체를 반환 (등록 직후 다른 요청의 LRU 정리로 삭제되어도 읽을 수 있음)"""
+        source = open(tmp_path, "rb")
+        try:
+            self.adopt(key, tmp_path, content_hash)
+        except BaseException:
+            source.close()
+            raise
+        return source
+
+    def _register(self, key: str, size: int, content_hash: str = None):
+        with self._lock:
+            self._ensure_index()
+            if key in self._index:
+                self._total -= self._index.pop(key)
+            self._digests.pop(key, None)
+            if content_hash is not None:
+                self._digests[key] = content_hash
+            self._index[key] = size
+            self._total += size
+            self._evict(keep=key)
+
+    def _evict(self, keep: str):
+        while self._total > self.max_bytes and len(self._index) > 1:
+            key, size = next(iter(self._index.items()))
+            if key == keep:
+                break
+            self._index.pop(key)
+            self._digests.pop(key, None)
+            self._total -= size
+            try:
+                self._path(key).unlink()
+                logger.info(f"렌더 캐시 정리(LRU): {key}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                # Windows에서 전송 중(열린) 파일은 삭제할 수 없음: 인덱스에서만 빼고 재시작 시 다시 정리
+                logger.warning(f"렌더 캐시 파일 삭제 실패: {key} - {e}")
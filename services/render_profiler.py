@@ -0,0 +1,89 @@
+import sys
+import time
+from contextlib import contextmanager
+
+
+def _proc_status_mb(field: str) -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) / 1024
+    raise OSError(f"/proc/self/status에 {field} 항목이 없습니다.")
+
+
+def _start_peak_rss():
+    """
+    최대 RSS 측정 시작. 측정 구간이 끝난 뒤 호출할 읽기 함수(MB)를 반환하고, 측정할 수 없으면 None.
+    Linux에서는 /proc/self/clear_refs 로 최고치(VmHWM)를 현재 RSS로 초기화해 구간 안의 최고치만 읽고,
+    그 외 플랫폼은 ru_maxrss(프로세스 시작 이후 최고치)를 사용합니다.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return lambda: _proc_status_mb("VmHWM")
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Linux는 KB, macOS는 byte 단위
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+class RenderProfiler:
+    """
+    PPTX 렌더링 단계별 소요 시간 기록기 (같은 단계를 여러 번 측정하면 누적).
+    워커 프로세스에서 측정한 결과(timings, peak_rss_mb)는 부모 프로세스로 넘겨 merge합니다.
+
+    단계: cache(캐시 조회), template(템플릿 복제/컴파일), fills(검체·QC·Footer 정보 채우기),
+         variants(변이 섹션), comments(Comment 섹션), ghost(빈 슬라이드 제거), save(PPTX 저장),
+         release(Presentation 해제), render(워커 왕복 전체)
+    렌더링 중 프로세스 최대 RSS(peak_rss_mb)도 함께 기록할 수 있습니다 (track_peak_rss).
+    """
+
+    def __init__(self):
+        self.timings = {}  # {단계: 초} (기록 순서 유지)
+        self.peak_rss_mb = None  # 렌더링 중 프로세스 최대 RSS (MB, 측정하지 않았으면 None)
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    @contextmanager
+    def track_peak_rss(self):
+        """구간 안의 프로세스 최대 RSS를 peak_rss_mb에 기록 (템플릿 캐시 등 상주 메모리 포함)"""
+        read_peak = _start_peak_rss()
+        try:
+            yield
+        finally:
+            if read_peak is not None:
+                self.peak_rss_mb = read_peak()
+
+    def add(self, name: str, seconds: float):
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def merge(self, timings: dict, peak_rss_mb: float = None):
+        for name, seconds in (timings or {}).items():
+            self.add(name, seconds)
+        if peak_rss_mb is not None:
+            self.peak_rss_mb = max(self.peak_rss_mb or 0.0, peak_rss_mb)
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (예: "template;dur=12.3, variants;dur=45.6, rss;desc=\"peak 195.2MB\"")"""
+        metrics = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in self.timings.items()]
+        if self.peak_rss_mb is not None:
+            metrics.append(f'rss;desc="peak {self.peak_rss_mb:.1f}MB"')
+        return ", ".join(metrics)
+
+    def summary(self) -> str:
+        """로그용 요약 (예: "template 12ms, variants 46ms, peak RSS 195MB")"""
+        parts = [f"{name} {seconds * 1000:.0f}ms" for name, seconds in self.timings.items()]
+        if self.peak_rss_mb is not None:
+            parts.append(f"peak RSS {self.peak_rss_mb:.0f}MB")
+        return ", ".join(parts)
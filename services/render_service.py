@@ -0,0 +1,519 @@
+import _thread
+import asyncio
+import gc
+import hashlib
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+import config
+from services.render_cache import RenderCache
+from services.render_profiler import RenderProfiler
+
+logger = logging.getLogger("app")
+
+try:
+    from services.pptx_generator import NGS_PPT_Generator
+except ImportError as e:
+    logger.warning("경고: ppt_generator 모듈을 찾을 수 없습니다. PPT 다운로드 기능이 작동하지 않을 수 있습니다.")
+    NGS_PPT_Generator = None
+
+# 생성기는 요청마다 만들지 않고 재사용 (템플릿 캐시 공유)
+generator = NGS_PPT_Generator() if NGS_PPT_Generator is not None else None
+if generator is not None:
+    generator.verify_reused_parts = config.PPTX_VERIFY_REUSED_PARTS
+
+# 렌더링 결과 캐시 (같은 보고서 데이터 + 템플릿이면 재렌더링 없이 파일 전송)
+render_cache = RenderCache(config.RENDER_CACHE_DIR, config.RENDER_CACHE_MAX_BYTES)
+
+# 사전 렌더링 상태값
+STATUS_NONE = "none"
+STATUS_QUEUED = "queued"
+STATUS_RENDERING = "rendering"
+STATUS_READY = "ready"
+STATUS_FAILED = "failed"
+
+
+def build_pptx_filename(specimen_id: str, report_data: dict) -> str:
+    """다운로드 파일명: {specimen_id}_{Type}_report_{yymmdd}_auto.pptx"""
+    panel_type = report_data.get('panel_type', 'GE') # Default to GE if not present
+
+    # Extract sequence date from report_data and format it
+    formatted_date = ""
+    sequence_date_str = report_data.get('sequence_date', '').strip()
+
+    if sequence_date_str:
+        try:
+            # Try parsing "2025-12-03" -> "251203"
+            dt = datetime.strptime(sequence_date_str, "%Y-%m-%d")
+            formatted_date = dt.strftime("%y%m%d")
+        except Exception as e:
+            logger.warning(f"Sequence Date 파싱 실패 ({sequence_date_str}): {e}")
+            formatted_date = ""
+
+    date_suffix = f"_{formatted_date}" if formatted_date else ""
+
+    # Check if v2 report
+    is_v2 = report_data.get('is_v2', False)
+    report_str = "v2report" if is_v2 else "report"
+
+    return f"{specimen_id}_{panel_type}_{report_str}{date_suffix}_auto.pptx"
+
+
+class _HashingWriter:
+    """기록하는 바이트의 SHA-256을 함께 계산하는 출력 파일 래퍼 (PPTX 패키지는 처음부터 순서대로 쓰기만 함)"""
+
+    def __init__(self, fileobj):
+        self._fp = fileobj
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data):
+        self.sha256.update(data)
+        return self._fp.write(data)
+
+    def seek(self, *args):
+        return self._fp.seek(*args)
+
+
+def render_pptx_file(report_data: dict):
+    """
+    캐시 없이 렌더링만 수행합니다 (프로세스 풀 워커에서 호출).
+    워커 프로세스는 자신의 generator/템플릿 캐시를 사용하고, 결과는 렌더 캐시 디렉토리의 임시 파일에 바로 기록합니다.
+    (덱을 메모리에 올려 프로세스 간에 전송하지 않음, 캐시 등록은 부모 프로세스가 담당)
+    결과의 SHA-256은 저장하면서 함께 계산하므로 다운로드 시 파일을 다시 읽어 해시하지 않습니다.
+
+    Returns:
+        (Path, str, dict, float): 임시 파일 경로, 결과 PPTX의 SHA-256(hex),
+            단계별 소요 시간 {단계: 초}, 렌더링 중 최대 RSS(MB, 측정 불가 시 None)
+    """
+    profiler = RenderProfiler()
+    tmp_path = render_cache.new_temp_path()
+    try:
+        with profiler.track_peak_rss(), open(tmp_path, "wb") as output:
+            hashing_output = _HashingWriter(output)
+            generator.generate(report_data, profiler=profiler, output=hashing_output)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path, hashing_output.sha256.hexdigest(), profiler.timings, profiler.peak_rss_mb
+
+
+class _RenderDeadline:
+    """워커 프로세스 안에서 실행 중인 렌더링 작업과 제한 시간이 지난 작업 (SIGINT 핸들러와 타이머 스레드가 공유)"""
+    lock = threading.Lock()
+    current = None
+    expired = None
+
+
+def _expire_render(task):
+    """(타이머 스레드) 작업이 아직 실행 중이면 메인 스레드에 인터럽트를 걸어 렌더링을 중단시킴"""
+    with _RenderDeadline.lock:
+        if _RenderDeadline.current is task:
+            _RenderDeadline.expired = task
+            _thread.interrupt_main()
+
+
+def _on_render_interrupt(signum, frame):
+    """
+    워커의 SIGINT 핸들러: 제한 시간 타이머가 보낸 인터럽트는 실행 중인 작업에서만 RenderTimeout으로 바꾸고,
+    작업이 이미 끝난 뒤 도착한 인터럽트는 무시합니다 (워커 프로세스가 죽지 않도록).
+    """
+    expired, _RenderDeadline.expired = _RenderDeadline.expired, None
+    if expired is None:
+        signal.default_int_handler(signum, frame)
+    elif expired is _RenderDeadline.current:
+        raise RenderTimeout("렌더링 시간 초과")
+
+
+def render_pptx_file_with_deadline(report_data: dict, timeout: float):
+    """
+    작업이 시작된 시점부터 timeout초가 지나면 중단되는 render_pptx_file (프로세스 풀 워커에서 호출).
+    워커 프로세스를 종료하지 않고 작업만 RenderTimeout으로 끝내므로 같은 풀의 다른 작업에는 영향이 없습니다.
+    """
+    task = object()
+    result = None
+    timer = threading.Timer(timeout, _expire_render, (task,))
+    timer.daemon = True
+    try:
+        try:
+            with _RenderDeadline.lock:
+                _RenderDeadline.current = task
+            timer.start()
+            result = render_pptx_file(report_data)
+        finally:
+            with _RenderDeadline.lock:
+                _RenderDeadline.current = None
+            timer.cancel()
+    except RenderTimeout:
+        # 렌더링이 끝난 직후 도착한 인터럽트면 결과를 그대로 사용
+        if result is None:
+            raise RenderTimeout(f"렌더링 시간 초과 ({timeout}s)") from None
+    return result
+
+
+def _init_render_worker():
+    """
+    렌더 워커 프로세스 초기화: 템플릿을 미리 로드하여 첫 렌더링부터 캐시를 사용.
+    상주하는 템플릿 캐시 객체는 GC 추적에서 제외(freeze)하여 렌더링마다 하는 수거 비용을 줄입니다.
+    """
+    signal.signal(signal.SIGINT, _on_render_interrupt)
+    if generator is not None:
+        generator.preload()
+        gc.collect()
+        gc.freeze()
+
+
+def _noop():
+    return None
+
+
+def _discard_result(future):
+    """기다리는 쪽이 없어진(시간 초과/연결 종료/취소) 작업의 결과 임시 파일 삭제 (캐시에 등록되지 않으므로)"""
+    if future.cancelled() or future.exception() is not None:
+        return
+    tmp_path = future.result()[0]
+    try:
+        tmp_path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"렌더링 임시 파일 삭제 실패: {tmp_path} - {e}")
+
+
+class RenderQueueFull(Exception):
+    """렌더링 대기열이 가득 차 요청을 받을 수 없음"""
+
+
+class RenderTimeout(Exception):
+    """렌더링이 제한 시간 안에 끝나지 않음"""
+
+
+class RenderExecutor:
+    """
+    PPTX 렌더링 전용 프로세스 풀.
+    렌더링은 CPU 위주(Python + lxml)라 스레드에서는 GIL 때문에 확장되지 않고 다른 라우트까지 막으므로,
+    템플릿을 미리 로드한 워커 프로세스에서 실행합니다.
+
+    - 실행 중 + 대기 중 작업 수는 max_workers + max_queue로 제한 (초과 시 RenderQueueFull)
+    - 작업은 워커에서 시작된 시점부터 timeout초가 지나면 워커 안에서 중단 (RenderTimeout, 워커/풀은 유지)
+    - 요청은 제출 후 timeout초까지만 기다리고(RenderTimeout), 기다림을 포기한 작업은 대기 중이면 취소,
+      실행 중이면 워커의 제한 시간에 맡김
+    - 제한 시간이 지나도 끝나지 않는(인터럽트에 응답하지 않는) 워커가 있는 풀은 새 작업에서 제외하고,
+      그 풀의 다른 작업이 모두 끝난 뒤에 종료
+    """
+
+    HUNG_GRACE_SECONDS = 10  # 워커 제한 시간이 지난 뒤 멈춘 것으로 판단하기까지의 여유
+    RETIRE_CHECK_SECONDS = 1  # 교체 대상 풀의 남은 작업 확인 간격
+
+    def __init__(self, max_workers=None, max_queue: int = 16, timeout: float = 60):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.max_workers + max_queue)
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                # 서버 프로세스의 스레드 상태를 복제하지 않도록 spawn 사용
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_render_worker
+                )
+            return self._pool
+
+    def _discard_pool(self, pool):
+        """고장 난 풀을 버리고, 다음 요청에서 새 풀을 만듭니다."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _retire_if_hung(self, future):
+        """기다림을 포기한 작업이 워커 제한 시간이 지나도 실행 중이면 그 풀을 새 작업에서 제외"""
+        if future.done():
+            return
+        logger.error("렌더 워커가 제한 시간이 지나도 응답하지 않습니다: 작업 중인 풀을 교체합니다.")
+        with self._lock:
+            if self._pool is future.pool:
+                self._pool = None
+        self._terminate_when_idle(future)
+
+    def _terminate_when_idle(self, future):
+        """
+        멈춘 작업 외에 끝나지 않은 작업이 남아 있으면 기다렸다가, 없으면 풀의 워커를 종료합니다.
+        (ProcessPoolExecutor는 워커 하나만 종료해도 풀 전체가 고장 나므로, 다른 사용자의 작업이 끝난 뒤에 종료)
+        """
+        pool = future.pool
+        if future.done():
+            pool.shutdown(wait=False)
+            return
+        pending = list((getattr(pool, "_pending_work_items", None) or {}).values())
+        if any(item.future is not future and not item.future.done() for item in pending):
+            timer = threading.Timer(self.RETIRE_CHECK_SECONDS, self._terminate_when_idle, (future,))
+            timer.daemon = True
+            timer.start()
+            return
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def start(self):
+        """워커 프로세스를 미리 띄워 템플릿을 로드해 둡니다 (완료를 기다리지 않음)."""
+        pool = self._get_pool()
+        for _ in range(self.max_workers):
+            pool.submit(_noop)
+
+    def submit(self, report_data: dict, block: bool = False):
+        """
+        렌더링 작업을 제출하고 concurrent.futures.Future를 반환합니다.
+        block=False이면 대기열이 가득 찼을 때 즉시, True이면 timeout초 기다린 뒤 RenderQueueFull을 발생시킵니다.
+        """
+        acquired = self._slots.acquire(timeout=self.timeout) if block else self._slots.acquire(blocking=False)
+        if not acquired:
+            raise RenderQueueFull("렌더링 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요.")
+
+        pool = self._get_pool()
+        try:
+            future = pool.submit(render_pptx_file_with_deadline, report_data, self.timeout)
+        except BrokenProcessPool:
+            self._slots.release()
+            self._discard_pool(pool)
+            raise
+        except Exception:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self._slots.release())
+        future.pool = pool
+        return future
+
+    def abandon(self, future):
+        """
+        기다림을 포기한 작업 정리: 대기 중이면 취소하고, 이미 워커에 전달된 작업은 워커의 제한 시간에 맡깁니다.
+        (끝나면 결과 임시 파일을 삭제)
+        (같은 풀의 다른 작업을 위해 워커를 종료하지 않음, 제한 시간이 지나도 끝나지 않을 때만 풀 교체)
+        """
+        if future.cancel():
+            return
+        future.add_done_callback(_discard_result)
+        # 워커에 전달된 작업은 앞선 작업(최대 timeout)이 끝난 뒤 시작될 수 있으므로 2배 + 여유를 기다림
+        timer = threading.Timer(2 * self.timeout + self.HUNG_GRACE_SECONDS, self._retire_if_hung, (future,))
+        timer.daemon = True
+        timer.start()
+
+    def result(self, future, timeout: float = None):
+        """
+        Future의 결과 (임시 파일 경로, 단계별 소요 시간, 최대 RSS)를 기다립니다 (동기).
+        시간 초과 시 작업을 정리하고 RenderTimeout.
+        """
+        try:
+            return future.result(timeout=self.timeout if timeout is None else timeout)
+        except FutureTimeoutError:
+            self.abandon(future)
+            raise RenderTimeout(f"렌더링 시간 초과 ({self.timeout}s)")
+        except BrokenProcessPool:
+            self._discard_pool(future.pool)
+            raise
+
+    def render(self, report_data: dict, block: bool = False):
+        """동기 렌더링 (스레드에서 호출), (임시 파일 경로, 단계별 소요 시간, 최대 RSS) 반환"""
+        return self.result(self.submit(report_data, block=block))
+
+    async def render_async(self, report_data: dict):
+        """비동기 렌더링: 이벤트 루프를 막지 않고 워커 프로세스의 결과 (임시 파일 경로, 단계별 소요 시간, 최대 RSS)를 기다립니다."""
+        future = self.submit(report_data)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            self.abandon(future)
+            raise RenderTimeout(f"렌더링 시간 초과 ({self.timeout}s)")
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료 등으로 요청이 취소됨
+            self.abandon(future)
+            raise
+        except BrokenProcessPool:
+            self._discard_pool(future.pool)
+            raise
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+render_executor = RenderExecutor(
+    config.RENDER_MAX_WORKERS,
+    max_queue=config.RENDER_QUEUE_MAX,
+    timeout=config.RENDER_TIMEOUT_SECONDS
+)
+
+
+def _lookup_cached(report_data: dict, profiler: RenderProfiler, open_file: bool = False):
+    with profiler.phase("cache"):
+        render_key = generator.get_render_key(report_data)
+        cached = render_cache.open(render_key) if open_file else render_cache.get(render_key)
+    if cached is not None:
+        logger.info(f"렌더 캐시 적중: {render_key[:12]}")
+    return render_key, cached
+
+
+def _store_rendered(render_key: str, result: tuple, profiler: RenderProfiler, started: float, open_file: bool = False):
+    tmp_path, content_hash, timings, peak_rss_mb = result
+    # 워커 단계 시간 + 대기열/프로세스 간 전송을 포함한 전체 왕복 시간
+    profiler.merge(timings, peak_rss_mb)
+    profiler.add("render", time.perf_counter() - started)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"PPTX 렌더링 {render_key[:12]}: {profiler.summary()}")
+    if open_file:
+        return render_cache.adopt_open(render_key, tmp_path, content_hash)
+    return render_cache.adopt(render_key, tmp_path, content_hash)
+
+
+def render_pptx_cached(report_data: dict, block: bool = False, profiler: RenderProfiler = None):
+    """
+    캐시된 렌더링 결과가 있으면 그 경로를, 없으면 렌더 워커에서 렌더링 후 캐시에 저장한 경로를 반환합니다.
+    profiler를 넘기면 캐시 조회와 워커의 단계별 렌더링 시간, 렌더링 중 최대 RSS가 기록됩니다.
+
+    Returns:
+        (Path, str): PPTX 파일 경로, 렌더 키
+    """
+    profiler = profiler or RenderProfiler()
+    render_key, cached_path = _lookup_cached(report_data, profiler)
+    if cached_path is not None:
+        return cached_path, render_key
+
+    started = time.perf_counter()
+    result = render_executor.render(report_data, block=block)
+    return _store_rendered(render_key, result, profiler, started), render_key
+
+
+async def render_pptx_cached_async(report_data: dict, profiler: RenderProfiler = None):
+    """
+    render_pptx_cached의 비동기 버전 (다운로드 라우트용). 이벤트 루프에서는 워커의 결과만 기다립니다.
+    경로 대신 읽기용으로 연 파일 객체를 반환하므로, 전송 전에 다른 요청의 LRU 정리로 파일이 삭제되어도 안전합니다.
+
+    Returns:
+        (BinaryIO, str): 연 PPTX 파일 (호출자가 닫음), 렌더 키
+    """
+    profiler = profiler or RenderProfiler()
+    # 렌더 키 계산(첫 호출 시 템플릿 해시/로드 포함)과 캐시 디스크 I/O는 이벤트 루프 밖에서 수행
+    render_key, cached_file = await asyncio.to_thread(_lookup_cached, report_data, profiler, True)
+    if cached_file is not None:
+        return cached_file, render_key
+
+    started = time.perf_counter()
+    result = await render_executor.render_async(report_data)
+    cached_file = await asyncio.to_thread(_store_rendered, render_key, result, profiler, started, True)
+    return cached_file, render_key
+
+
+class PrerenderQueue:
+    """
+    업로드 직후 PPTX를 백그라운드에서 미리 렌더링하여 렌더 캐시에 넣어두는 작업 큐.
+    동시 렌더링 수는 max_workers로 제한되며, 나머지는 대기열에서 순서대로 처리됩니다.
+    진행 중인 작업만 기억하고, 완료된 작업은 렌더 캐시로, 실패한 작업은 최근 MAX_RECENT_FAILURES건만 유지합니다.
+    """
+
+    MAX_RECENT_FAILURES = 256
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self._jobs = {}  # 대기/렌더링 중인 작업 {specimen_id: {"render_key": ..., "status": ...}}
+        self._failures = OrderedDict()  # 최근 실패 {specimen_id: (render_key, 오류 메시지)}
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="prerender")
+        return self._executor
+
+    def submit(self, specimen_id: str, report_data: dict) -> bool:
+        """사전 렌더링 요청 (이미 캐시에 있거나 같은 내용이 대기 중이면 건너뜀)"""
+        if generator is None:
+            return False
+
+        render_key = generator.get_render_key(report_data)
+        with self._lock:
+            job = self._jobs.get(specimen_id)
+            if job and job["render_key"] == render_key:
+                return True
+            self._failures.pop(specimen_id, None)
+            # 존재 확인만 (LRU 순서/접근 시각은 실제 다운로드에서만 갱신)
+            if render_cache.contains(render_key):
+                self._jobs.pop(specimen_id, None)
+                return True
+
+            self._jobs[specimen_id] = {"render_key": render_key, "status": STATUS_QUEUED}
+            self._get_executor().submit(self._run, specimen_id, render_key, report_data)
+        logger.info(f"PPT 사전 렌더링 예약: {specimen_id}")
+        return True
+
+    def _current_job(self, specimen_id, render_key):
+        """(잠금 안에서 호출) 이 작업이 아직 검체의 최신 요청이면 작업 항목, 그 사이 새 버전이 업로드되었으면 None"""
+        job = self._jobs.get(specimen_id)
+        return job if job is not None and job["render_key"] == render_key else None
+
+    def _run(self, specimen_id, render_key, report_data):
+        with self._lock:
+            job = self._current_job(specimen_id, render_key)
+            if job is not None:
+                job["status"] = STATUS_RENDERING
+        try:
+            # 사전 렌더링은 대기열이 찰 때까지 기다려도 됨 (다운로드 요청은 즉시 거절)
+            render_pptx_cached(report_data, block=True)
+            error = None
+            logger.info(f"PPT 사전 렌더링 완료: {specimen_id}")
+        except Exception as e:
+            error = str(e)
+            logger.error(f"PPT 사전 렌더링 실패 ({specimen_id}): {e}")
+
+        with self._lock:
+            # 끝난 작업은 제거 (완료 여부는 렌더 캐시로 판단), 새 버전의 작업은 건드리지 않음
+            if self._current_job(specimen_id, render_key) is None:
+                return
+            del self._jobs[specimen_id]
+            if error is not None:
+                self._failures[specimen_id] = (render_key, error)
+                while len(self._failures) > self.MAX_RECENT_FAILURES:
+                    self._failures.popitem(last=False)
+
+    def status(self, specimen_id: str, report_data: dict) -> dict:
+        """
+        현재 보고서 데이터 기준의 덱 준비 상태를 반환합니다.
+        렌더 캐시에 결과가 있으면 (서버 재시작 후에도) ready로 판단합니다.
+        상태 폴링은 캐시 항목의 LRU 순서나 파일 접근 시각을 바꾸지 않습니다.
+        """
+        if generator is None:
+            return {"status": STATUS_NONE, "error": None}
+
+        render_key = generator.get_render_key(report_data)
+        # 진행 중인 작업을 먼저 확인 (완료된 작업은 캐시 등록 후 제거되므로 그 사이에 none이 보이지 않음)
+        with self._lock:
+            job = self._current_job(specimen_id, render_key)
+            if job is not None:
+                return {"status": job["status"], "error": None}
+
+        if render_cache.contains(render_key):
+            return {"status": STATUS_READY, "error": None}
+
+        with self._lock:
+            failure = self._failures.get(specimen_id)
+            if failure is not None and failure[0] == render_key:
+                return {"status": STATUS_FAILED, "error": failure[1]}
+        return {"status": STATUS_NONE, "error": None}
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+prerender_queue = PrerenderQueue(config.PRERENDER_MAX_WORKERS)
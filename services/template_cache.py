@@ -0,0 +1,140 @@
+import copy
+import hashlib
+import logging
+import os
+import threading
+
+from pptx import Presentation
+from pptx.opc.package import XmlPart, _Relationship
+from pptx.util import lazyproperty
+
+logger = logging.getLogger("app")
+
+
+def _plain_state(obj):
+    """lazyproperty 캐시를 제외한 인스턴스 속성 (복제본에서 다시 계산되도록)"""
+    cls = type(obj)
+    return {k: v for k, v in obj.__dict__.items() if not isinstance(getattr(cls, k, None), lazyproperty)}
+
+
+def clone_presentation(prs):
+    """
+    파싱된 Presentation을 파트 단위로 복제합니다.
+    XML 파트는 lxml 트리를 deepcopy하고, 이미지 등 바이너리 파트는 blob(bytes)을 공유하므로
+    zip 해제 + XML 파싱을 다시 하는 것보다 훨씬 저렴합니다.
+    복제된 파트에는 원본 파트명(_template_partname)을 기록해 두어, 저장 시 바뀌지 않은 파트를 찾는 데 씁니다.
+    """
+    src_package = prs.part.package
+    package = src_package.__class__.__new__(src_package.__class__)
+    package.__dict__.update(_plain_state(src_package))
+
+    part_map = {}
+    for part in src_package.iter_parts():
+        new_part = part.__class__.__new__(part.__class__)
+        new_part.__dict__.update(_plain_state(part))
+        new_part._package = package
+        new_part._template_partname = part.partname
+        if isinstance(part, XmlPart):
+            new_part._element = copy.deepcopy(part._element)
+        part_map[part] = new_part
+
+    def _copy_rels(src_rels, dst_rels):
+        for rId, rel in src_rels.items():
+            target = rel._target if rel.is_external else part_map[rel._target]
+            dst_rels._rels[rId] = _Relationship(rel._base_uri, rId, rel._reltype, rel._target_mode, target)
+
+    _copy_rels(src_package._rels, package._rels)
+    for part, new_part in part_map.items():
+        _copy_rels(part._rels, new_part._rels)
+
+    return package.presentation_part.presentation
+
+
+class TemplateEntry:
+    """템플릿 1개에 대한 캐시 항목 (원본 파싱 결과 + 파일 해시)"""
+
+    def __init__(self, path, stat_key, digest, presentation):
+        self.path = path
+        self.stat_key = stat_key
+        self.digest = digest
+        self.presentation = presentation  # 렌더링에 직접 사용하지 않는 원본(pristine)
+        self.compiled = {}  # 템플릿에서 파생된 사전 계산 결과 (레이아웃 분석 등)
+
+
+class TemplateCache:
+    """
+    PPTX 템플릿을 한 번만 로드하여 원본을 보관하고, 렌더링마다 복제본을 제공합니다.
+    파일의 mtime/size가 바뀌면 해시를 다시 계산하여 내용이 달라진 경우에만 재로드합니다.
+
+    prepare가 주어지면 로드 직후 원본에 한 번 적용되며(예: 테마 폰트 보정),
+    모든 복제본은 이미 준비된 상태에서 시작합니다.
+    """
+
+    def __init__(self, template_dir, prepare=None):
+        self.template_dir = template_dir
+        self.prepare = prepare
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def entry(self, template_name) -> TemplateEntry:
+        """최신 상태가 보장된 캐시 항목을 반환합니다."""
+        path = os.path.join(self.template_dir, template_name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"템플릿 파일을 찾을 수 없습니다: {path}")
+
+        stat = os.stat(path)
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(template_name)
+            if entry is not None and entry.stat_key == stat_key:
+                return entry
+
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+
+            if entry is not None and entry.digest == digest:
+                # 내용은 같고 mtime만 바뀐 경우 (예: 복사/touch)
+                entry.stat_key = stat_key
+                return entry
+
+            if entry is not None:
+                logger.info(f"템플릿 변경 감지, 재로드: {template_name}")
+
+            prs = Presentation(path)
+            if self.prepare is not None:
+                self.prepare(prs)
+
+            entry = TemplateEntry(path, stat_key, digest, prs)
+            self._entries[template_name] = entry
+            return entry
+
+    def clone(self, entry: TemplateEntry):
+        """캐시 항목의 원본으로부터 렌더링용 복제본(Presentation)을 만듭니다."""
+        with self._lock:
+            return clone_presentation(entry.presentation)
+
+    def get(self, template_name):
+        """렌더링에 사용할 템플릿 복제본(Presentation)을 반환합니다."""
+        return self.clone(self.entry(template_name))
+
+    def compiled(self, entry: TemplateEntry, key, builder, read_only=False):
+        """
+        템플릿별 사전 계산 결과를 반환합니다. 처음 요청될 때 builder(복제본)로 만들고,
+        템플릿이 재로드되면 새 항목과 함께 다시 계산됩니다.
+        builder에는 버려도 되는 복제본이 전달되므로 자유롭게 수정해도 됩니다.
+        read_only=True이면 복제하지 않고 원본을 전달합니다 (읽기만 하는 builder용, 수정 금지).
+        """
+        result = entry.compiled.get(key)
+        if result is None:
+            if read_only:
+                with self._lock:
+                    result = builder(entry.presentation)
+            else:
+                result = builder(self.clone(entry))
+            entry.compiled[key] = result
+        return result
+
+    def version(self, template_name) -> str:
+        """템플릿 파일 내용의 해시 (캐시 키 등에 사용)"""
+        return self.entry(template_name).digest
@@ -0,0 +1,200 @@
+import logging
+import struct
+import threading
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+
+import config
+
+logger = logging.getLogger("app")
+
+# 폰트 파일이 없을 때 쓰는 ASCII 글리프 폭 (1/1000 em, Helvetica 계열 근사치)
+_FALLBACK_ASCII_WIDTHS = dict(zip(
+    (chr(c) for c in range(0x20, 0x7F)),
+    (
+        278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,  # ' ' ~ '/'
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,  # '0' ~ '?'
+        1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,  # '@' ~ 'O'
+        667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,  # 'P' ~ '_'
+        333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,  # '`' ~ 'o'
+        556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,  # 'p' ~ '~'
+    )
+))
+_FALLBACK_WIDE = 1000  # 한글/한자 등 전각 문자
+_FALLBACK_NARROW = 556  # 그 외 반각 문자
+
+
+def _read_sfnt_advances(path: Path):
+    """
+    TrueType/OpenType 폰트의 cmap(format 4/12) + hmtx 테이블에서 문자별 advance 폭을 읽습니다.
+
+    Returns:
+        ({codepoint: 폭(em 단위 float)}, 기본 폭(em))
+    """
+    data = path.read_bytes()
+    num_tables = struct.unpack_from(">H", data, 4)[0]
+    tables = {}
+    for i in range(num_tables):
+        tag, _, offset, length = struct.unpack_from(">4sIII", data, 12 + i * 16)
+        tables[tag.decode("latin-1")] = offset
+
+    units_per_em = struct.unpack_from(">H", data, tables["head"] + 18)[0]
+    num_hmetrics = struct.unpack_from(">H", data, tables["hhea"] + 34)[0]
+    hmtx = tables["hmtx"]
+    advances = struct.unpack_from(f">{num_hmetrics * 2}H", data, hmtx)[0::2]
+
+    def glyph_advance(glyph_id):
+        return advances[min(glyph_id, num_hmetrics - 1)]
+
+    # 유니코드 서브테이블 선택 (format 12 우선, 없으면 format 4)
+    cmap = tables["cmap"]
+    num_subtables = struct.unpack_from(">H", data, cmap + 2)[0]
+    candidates = {}
+    for i in range(num_subtables):
+        platform_id, encoding_id, offset = struct.unpack_from(">HHI", data, cmap + 4 + i * 8)
+        if (platform_id, encoding_id) in ((3, 1), (3, 10), (0, 3), (0, 4)):
+            fmt = struct.unpack_from(">H", data, cmap + offset)[0]
+            candidates.setdefault(fmt, cmap + offset)
+
+    widths = {}
+    if 12 in candidates:
+        sub = candidates[12]
+        num_groups = struct.unpack_from(">I", data, sub + 12)[0]
+        for i in range(num_groups):
+            start, end, start_glyph = struct.unpack_from(">III", data, sub + 16 + i * 12)
+            for cp in range(start, min(end, 0x2FFFF) + 1):
+                widths[cp] = glyph_advance(start_glyph + cp - start) / units_per_em
+    elif 4 in candidates:
+        sub = candidates[4]
+        seg_count = struct.unpack_from(">H", data, sub + 6)[0] // 2
+        ends = struct.unpack_from(f">{seg_count}H", data, sub + 14)
+        starts_at = sub + 16 + seg_count * 2
+        starts = struct.unpack_from(f">{seg_count}H", data, starts_at)
+        deltas = struct.unpack_from(f">{seg_count}h", data, starts_at + seg_count * 2)
+        range_offsets_at = starts_at + seg_count * 4
+        range_offsets = struct.unpack_from(f">{seg_count}H", data, range_offsets_at)
+        for seg in range(seg_count):
+            for cp in range(starts[seg], ends[seg] + 1):
+                if cp == 0xFFFF:
+                    continue
+                if range_offsets[seg] == 0:
+                    glyph_id = (cp + deltas[seg]) & 0xFFFF
+                else:
+                    at = range_offsets_at + seg * 2 + range_offsets[seg] + (cp - starts[seg]) * 2
+                    glyph_id = struct.unpack_from(">H", data, at)[0]
+                    if glyph_id:
+                        glyph_id = (glyph_id + deltas[seg]) & 0xFFFF
+                if glyph_id:
+                    widths[cp] = glyph_advance(glyph_id) / units_per_em
+    else:
+        raise ValueError("지원하는 유니코드 cmap 서브테이블이 없습니다.")
+
+    return widths, glyph_advance(0) / units_per_em
+
+
+class TextMetrics:
+    """
+    글리프 advance 폭 기반 텍스트 측정기 (코멘트 박스 높이/페이지 분할 계산용).
+    폰트 파일은 처음 측정할 때 한 번만 읽고, 문자 폭은 (문자, 글자 크기)별로 메모이즈합니다.
+    폰트 파일이 없거나 읽지 못하면 내장 근사 폭 테이블을 사용합니다.
+    """
+
+    def __init__(self, font_path=None):
+        self.font_path = Path(font_path) if font_path else None
+        self._widths = None
+        self._default_width = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._widths is not None:
+                return
+            widths, default_width = {}, None
+            if self.font_path is None or not self.font_path.exists():
+                logger.warning(f"텍스트 측정 폰트가 없어 근사 폭 테이블 사용 (코멘트 줄 수 오차 가능): {self.font_path}")
+            else:
+                try:
+                    widths, default_width = _read_sfnt_advances(self.font_path)
+                    logger.info(f"텍스트 측정 폰트 로드: {self.font_path.name} ({len(widths)} glyphs)")
+                except Exception as e:
+                    logger.warning(f"텍스트 측정 폰트 로드 실패, 근사 폭 테이블 사용: {e}")
+                    widths, default_width = {}, None
+            self._default_width = default_width
+            self._widths = widths
+
+    def _em_width(self, char):
+        if self._widths is None:
+            self._load()
+        width = self._widths.get(ord(char))
+        if width is not None:
+            return width
+        if char in _FALLBACK_ASCII_WIDTHS:
+            return _FALLBACK_ASCII_WIDTHS[char] / 1000
+        if unicodedata.east_asian_width(char) in "WF":
+            return _FALLBACK_WIDE / 1000
+        if self._default_width is not None:
+            return self._default_width
+        return _FALLBACK_NARROW / 1000
+
+    @lru_cache(maxsize=8192)
+    def char_width(self, char, font_size_pt):
+        """문자 1개의 advance 폭 (pt)"""
+        return self._em_width(char) * font_size_pt
+
+    def text_width(self, text, font_size_pt):
+        """문자열 폭 (pt, 커닝 미반영)"""
+        return sum(self.char_width(c, font_size_pt) for c in text)
+
+    def count_lines(self, text, font_size_pt, max_width_pt):
+        """
+        줄바꿈(word wrap) 후 줄 수를 계산합니다.
+        한글/영문 모두 공백 단위로 줄을 나누고(PowerPoint 기본 동작), 한 줄보다 긴 단어만 글자 단위로 자릅니다.
+        줄 끝 공백은 폭에 포함하지 않습니다.
+        """
+        if not text:
+            return 0
+        total_lines = 0
+        for paragraph in text.split("\n"):
+            lines = 1
+            line_width = 0.0  # 현재 줄의 (끝 공백 제외) 폭
+            pending_space = 0.0  # 다음 단어가 같은 줄에 오면 더해질 공백 폭
+            for word, spaces in self._split_words(paragraph):
+                word_width = self.text_width(word, font_size_pt)
+                if line_width and line_width + pending_space + word_width > max_width_pt:
+                    lines += 1
+                    line_width, pending_space = 0.0, 0.0
+                if word_width > max_width_pt:
+                    # 한 줄보다 긴 단어는 글자 단위로 분할
+                    for c in word:
+                        w = self.char_width(c, font_size_pt)
+                        if line_width and line_width + w > max_width_pt:
+                            lines += 1
+                            line_width = 0.0
+                        line_width += w
+                else:
+                    line_width += pending_space + word_width
+                pending_space = self.text_width(spaces, font_size_pt)
+            total_lines += lines
+        return total_lines
+
+    @staticmethod
+    def _split_words(paragraph):
+        """[(단어, 뒤따르는 공백)] 목록"""
+        result = []
+        word_start, i, n = 0, 0, len(paragraph)
+        while i < n:
+            if paragraph[i] == " ":
+                space_start = i
+                while i < n and paragraph[i] == " ":
+                    i += 1
+                result.append((paragraph[word_start:space_start], paragraph[space_start:i]))
+                word_start = i
+            else:
+                i += 1
+        if word_start < n:
+            result.append((paragraph[word_start:], ""))
+        return result
+
+
+text_metrics = TextMetrics(config.TEXT_METRICS_FONT_PATH)
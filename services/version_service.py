@@ -0,0 +1,214 @@
+import json
+import logging
+import config
+
+logger = logging.getLogger("app")
+
+# 델타 종류 표기
+KIND_SNAPSHOT = "snapshot"
+KIND_DELTA = "delta"
+
+
+def _dumps(obj) -> str:
+    """버전 저장용 compact JSON 직렬화"""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _same(old, new) -> bool:
+    """
+    JSON 값으로서 같은지 비교합니다.
+    파이썬 ==는 1 == 1.0 == True로 취급하므로, ==로 같을 때 타입까지 확인합니다 (true -> 1 같은 수정도 변경으로 기록).
+    """
+    return old == new and _same_types(old, new)
+
+
+def _same_types(old, new) -> bool:
+    """==로 같은 두 값의 각 위치 타입이 모두 같은지 (dict 키/list 길이는 ==에서 이미 같음)"""
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return all(_same_types(value, new[key]) for key, value in old.items())
+    if isinstance(old, list):
+        return all(map(_same_types, old, new))
+    return True
+
+
+def make_delta(old, new):
+    """
+    두 report_data 사이의 구조적 델타를 계산합니다.
+
+    델타 형식:
+        - dict: {"t": "d", "set": {키: 새 값}, "sub": {키: 하위 델타}, "del": [삭제된 키]}
+        - list: {"t": "l", "i": 공통 prefix 길이, "n": 교체될 기존 항목 수, "v": 새 항목들}
+        - 그 외: {"t": "r", "v": 새 값}
+
+    Returns:
+        변경이 없으면 None, 있으면 델타 객체
+    """
+    if _same(old, new):
+        return None
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        set_vals, sub_vals = {}, {}
+        for key, new_val in new.items():
+            if key not in old:
+                set_vals[key] = new_val
+            elif not _same(old[key], new_val):
+                sub_delta = make_delta(old[key], new_val)
+                # 하위 델타가 전체 값보다 크면 통째로 교체
+                if len(_dumps(sub_delta)) < len(_dumps(new_val)):
+                    sub_vals[key] = sub_delta
+                else:
+                    set_vals[key] = new_val
+        delta = {"t": "d"}
+        if set_vals:
+            delta["set"] = set_vals
+        if sub_vals:
+            delta["sub"] = sub_vals
+        removed = [key for key in old if key not in new]
+        if removed:
+            delta["del"] = removed
+        return delta
+
+    if isinstance(old, list) and isinstance(new, list):
+        # 공통 prefix/suffix를 제외한 가운데 구간만 교체 (행 추가/삭제/수정 모두 커버)
+        limit = min(len(old), len(new))
+        prefix = 0
+        while prefix < limit and _same(old[prefix], new[prefix]):
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and _same(old[-1 - suffix], new[-1 - suffix]):
+            suffix += 1
+        return {
+            "t": "l",
+            "i": prefix,
+            "n": len(old) - prefix - suffix,
+            "v": new[prefix:len(new) - suffix]
+        }
+
+    return {"t": "r", "v": new}
+
+
+def apply_delta(base, delta):
+    """make_delta로 만든 델타를 base에 적용한 새 객체를 반환합니다. (base는 변경하지 않음)"""
+    if delta is None:
+        return base
+
+    kind = delta["t"]
+    if kind == "d":
+        result = dict(base)
+        for key in delta.get("del", []):
+            result.pop(key, None)
+        for key, sub_delta in delta.get("sub", {}).items():
+            result[key] = apply_delta(result[key], sub_delta)
+        result.update(delta.get("set", {}))
+        return result
+
+    if kind == "l":
+        start = delta["i"]
+        return base[:start] + delta["v"] + base[start + delta["n"]:]
+
+    return delta["v"]
+
+
+def record_version(cursor, specimen_id: str, report_data: dict, previous_data: dict = None):
+    """
+    report_data의 새 버전을 report_versions 테이블에 기록합니다.
+
+    Args:
+        cursor: 업로드 트랜잭션의 DB 커서 (commit은 호출자가 수행)
+        specimen_id: 검체 번호
+        report_data: 새로 저장될 보고서 데이터
+        previous_data: 덮어쓰기 직전 reports 테이블의 보고서 데이터 (없으면 None)
+
+    Returns:
+        int: 기록된(또는 변경이 없어 유지된) 버전 번호
+    """
+    cursor.execute(
+        "SELECT MAX(version) FROM report_versions WHERE specimen_id = ?",
+        (specimen_id,)
+    )
+    last_version = cursor.fetchone()[0]
+
+    # 버전 기능 도입 이전에 저장된 보고서는 기존 데이터를 1번 스냅샷으로 보존
+    if last_version is None and previous_data is not None:
+        _insert_version(cursor, specimen_id, 1, KIND_SNAPSHOT, _dumps(previous_data))
+        last_version = 1
+
+    if last_version is None:
+        _insert_version(cursor, specimen_id, 1, KIND_SNAPSHOT, _dumps(report_data))
+        return 1
+
+    # reports 테이블의 현재 값이 곧 최신 버전이므로 재구성 없이 델타 계산
+    base = previous_data if previous_data is not None else get_version(cursor, specimen_id, last_version)
+    delta = make_delta(base, report_data)
+    if delta is None:
+        logger.info(f"{specimen_id}: 이전 버전과 동일하여 새 버전을 만들지 않습니다. (v{last_version})")
+        return last_version
+
+    version = last_version + 1
+    snapshot_payload = _dumps(report_data)
+    delta_payload = _dumps(delta)
+
+    # 주기적으로 스냅샷을 두어 재구성 시 적용할 델타 수를 제한
+    # 델타가 전체 데이터보다 커지는 경우에도 스냅샷으로 저장
+    if (version - 1) % config.VERSION_SNAPSHOT_INTERVAL == 0 or len(delta_payload) >= len(snapshot_payload):
+        _insert_version(cursor, specimen_id, version, KIND_SNAPSHOT, snapshot_payload)
+    else:
+        _insert_version(cursor, specimen_id, version, KIND_DELTA, delta_payload)
+
+    logger.info(f"{specimen_id}: 보고서 버전 기록 완료 (v{version})")
+    return version
+
+
+def _insert_version(cursor, specimen_id, version, kind, payload):
+    cursor.execute(
+        "INSERT INTO report_versions (specimen_id, version, kind, payload) VALUES (?, ?, ?, ?)",
+        (specimen_id, version, kind, payload)
+    )
+
+
+def list_versions(cursor, specimen_id: str) -> list:
+    """검체의 버전 목록(메타데이터)을 반환합니다."""
+    cursor.execute(
+        "SELECT version, kind, LENGTH(payload) AS size, created_at FROM report_versions "
+        "WHERE specimen_id = ? ORDER BY version",
+        (specimen_id,)
+    )
+    return [
+        {"version": row[0], "kind": row[1], "size": row[2], "created_at": row[3]}
+        for row in cursor.fetchall()
+    ]
+
+
+def get_version(cursor, specimen_id: str, version: int):
+    """
+    특정 버전의 report_data를 재구성합니다.
+    가장 가까운 이전 스냅샷부터 델타를 순서대로 적용하므로
+    적용 횟수는 VERSION_SNAPSHOT_INTERVAL 미만으로 제한됩니다.
+
+    Returns:
+        dict 또는 해당 버전이 없으면 None
+    """
+    cursor.execute(
+        "SELECT MAX(version) FROM report_versions "
+        "WHERE specimen_id = ? AND version <= ? AND kind = ?",
+        (specimen_id, version, KIND_SNAPSHOT)
+    )
+    snapshot_version = cursor.fetchone()[0]
+    if snapshot_version is None:
+        return None
+
+    cursor.execute(
+        "SELECT version, kind, payload FROM report_versions "
+        "WHERE specimen_id = ? AND version BETWEEN ? AND ? ORDER BY version",
+        (specimen_id, snapshot_version, version)
+    )
+    rows = cursor.fetchall()
+    if not rows or rows[-1][0] != version:
+        return None
+
+    report_data = json.loads(rows[0][2])
+    for row in rows[1:]:
+        report_data = apply_delta(report_data, json.loads(row[2]))
+    return report_data
@@ -0,0 +1,114 @@
+"""
+변이 섹션 배치 계획(_plan_variant_sections / _plan_table_chunks) 테스트.
+번들된 템플릿의 컴파일 결과만 사용하며 프레젠테이션을 렌더링하지 않습니다.
+
+    python -m pytest tests
+"""
+import dataclasses
+from types import MappingProxyType
+
+import pytest
+from pptx.util import Cm
+
+from benchmarks.synthetic_reports import SECTION_HEADERS, SECTION_TYPES, make_report
+from services.pptx_generator import NGS_PPT_Generator
+
+UNKNOWN_TITLE = "2. Variants of unknown significance"
+
+
+@pytest.fixture(scope="module")
+def generator():
+    return NGS_PPT_Generator()
+
+
+def compiled_layout(generator, report_data):
+    entry = generator.template_cache.entry(generator.get_template_name(report_data))
+    return generator.template_cache.compiled(entry, "layout", generator._compile_layout)
+
+
+def plan_with_clinical_top(generator, report_data, top):
+    """임상 섹션 앵커의 시작 위치(top)만 바꾼 컴파일 결과로 계획 (슬라이드 하단 근처에서 시작하는 경우 재현)"""
+    compiled = compiled_layout(generator, report_data)
+    locations = dict(compiled.section_locations)
+    locations["clinical"] = {**locations["clinical"], "top": top}
+    compiled = dataclasses.replace(compiled, section_locations=MappingProxyType(locations))
+    return generator._plan_variant_sections(report_data, compiled)
+
+
+def no_variants(**counts):
+    """counts에 지정한 섹션만 행이 있는 보고서 (나머지 섹션은 None)"""
+    variants = {f"{kind}_{section_type}": 0 for kind in SECTION_HEADERS for section_type in SECTION_TYPES}
+    variants.update(counts)
+    return make_report(panel="GE", v2=False, variants=variants)
+
+
+def test_split_table_chunks_and_page_labels(generator):
+    plan = generator.plan_layout(make_report(panel="GE", v2=False, variants={"snv_unknown": 300}))
+    steps = list(plan.steps)
+
+    chunks = [step for step in steps if step[0] == "table" and step[1] == "snv_unknown"]
+    assert len(chunks) > 1
+    # 조각은 빈틈/겹침 없이 0 ~ 300행을 덮음
+    assert chunks[0][2] == 0 and chunks[-1][3] == 300
+    assert all(prev[3] == cur[2] for prev, cur in zip(chunks, chunks[1:]))
+
+    total = len(chunks)
+    headers = [step for step in steps if step[0] == "section_header" and step[1].startswith("SNVs & Indels (")]
+    assert [step[1] for step in headers] == [f"SNVs & Indels ({page}/{total})" for page in range(1, total + 1)]
+
+    # 이어지는 조각은 새 슬라이드의 (n/N) 소제목 바로 뒤에서 시작
+    for chunk in chunks[1:]:
+        at = steps.index(chunk)
+        assert steps[at - 1][0] == "section_header" and steps[at - 2] == ("new_slide",)
+
+    assert plan.new_slides == steps.count(("new_slide",))
+
+
+def test_orphan_guard_moves_section_to_new_slide(generator):
+    report_data = no_variants(snv_clinical=3)
+    compiled = compiled_layout(generator, report_data)
+    bottom = compiled.slide_bottom_limits.get(
+        compiled.section_locations["clinical"]["slide_id"], generator.config.BODY_BOTTOM_LIMIT
+    )
+    guard = generator.config.HEIGHT_ORPHAN_GUARD
+
+    # 소제목 + 최소 행 공간이 없으면 소제목부터 새 슬라이드에서 시작
+    plan = plan_with_clinical_top(generator, report_data, bottom - guard + Cm(0.1))
+    steps = list(plan.steps)
+    header = next(i for i, step in enumerate(steps) if step[0] == "section_header")
+    assert steps[header - 1] == ("new_slide",)
+    assert steps[header + 1][:2] == ("table", "snv_clinical")
+
+    # 공간이 있으면 앵커 위치에서 시작 (남은 행은 다음 슬라이드로 분할)
+    plan = plan_with_clinical_top(generator, report_data, bottom - guard - Cm(1.0))
+    steps = list(plan.steps)
+    header = next(i for i, step in enumerate(steps) if step[0] == "section_header")
+    assert ("new_slide",) not in steps[:header + 2]
+    assert steps[header + 1][:3] == ("table", "snv_clinical", 0)
+
+
+def test_unknown_section_jumps_to_template_anchor(generator):
+    plan = generator.plan_layout(no_variants(snv_clinical=1, snv_unknown=1))
+    steps = list(plan.steps)
+
+    assert ("move_to_section", "unknown") in steps
+    assert ("remove_anchor_title", "unknown") not in steps
+    assert ("main_title", UNKNOWN_TITLE) not in steps
+
+
+def test_unknown_section_overflow_draws_its_own_title(generator):
+    # 임상 섹션이 미지 섹션 앵커 슬라이드까지 넘치면 앵커로 되돌아가지 않고 제목을 직접 그림
+    plan = generator.plan_layout(no_variants(snv_clinical=60, snv_unknown=1))
+    steps = list(plan.steps)
+
+    assert ("move_to_section", "unknown") not in steps
+    removed = steps.index(("remove_anchor_title", "unknown"))
+    assert steps[removed + 1] == ("main_title", UNKNOWN_TITLE)
+    assert steps[removed + 2] == ("set_main_title", UNKNOWN_TITLE)
+
+
+def test_plan_round_trips_through_storage(generator):
+    plan = generator.plan_layout(make_report(panel="SA", v2=True, variants={"snv_unknown": 80}, highlight_items=8))
+    restored = type(plan).from_dict(plan.to_dict())
+    assert restored == plan
+    assert restored.pages() == plan.pages()